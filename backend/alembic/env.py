@@ -11,9 +11,22 @@ from alembic import context
 
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from core.config import settings
+from core.config import get_settings
 from db.base import Base
-from models import Cat, Mission, Target  # noqa: F401
+from db.migrations import lock_timeout_statement
+from models import (  # noqa: F401
+    Cat,
+    ChangeTombstone,
+    IdempotencyKey,
+    Job,
+    Mission,
+    MissionArchive,
+    MissionDocument,
+    MissionEvent,
+    RateLimitBucket,
+    Target,
+    TargetArchive,
+)
 
 
 # this is the Alembic Config object, which provides
@@ -27,7 +40,8 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
-config.set_main_option(name="sqlalchemy.url", value=str(settings.database_url))
+settings = get_settings()
+config.set_main_option(name="sqlalchemy.url", value=settings.direct_database_url)
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -53,14 +67,34 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
+    context.execute(lock_timeout_statement(settings.db_migration_lock_timeout))
     with context.begin_transaction():
         context.run_migrations()
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    """Run each revision in its own transaction, with bounded lock waits.
+
+    DDL queued behind a long transaction for a table lock blocks every query on
+    the table behind it, so it fails after `db_migration_lock_timeout` instead.
+    The setting is made for the session, so it also covers the statements the
+    helpers in `db.migrations` run outside a transaction. Committing each
+    revision separately lets those helpers commit the work before them without
+    taking earlier revisions along.
+    """
+    connection.exec_driver_sql(
+        lock_timeout_statement(settings.db_migration_lock_timeout)
+    )
+    connection.commit()
+
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
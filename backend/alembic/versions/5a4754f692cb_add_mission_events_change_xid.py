@@ -0,0 +1,45 @@
+"""Add mission events change_xid
+
+Revision ID: 5a4754f692cb
+Revises: 58eb637a5bac
+Create Date: 2026-10-19 17:52:10.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from db.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a4754f692cb'
+down_revision: Union[str, Sequence[str], None] = '58eb637a5bac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing events get transaction 0, so they sort before new ones and a
+    # bare event ID cursor (0, id) still resumes among them. A constant
+    # default does not rewrite the table.
+    op.add_column(
+        'mission_events',
+        sa.Column('change_xid', sa.BigInteger(), server_default='0', nullable=False),
+    )
+    op.alter_column(
+        'mission_events',
+        'change_xid',
+        server_default=sa.text('pg_current_xact_id()::text::bigint'),
+    )
+    create_index_concurrently(
+        'ix_mission_events_change_xid_id', 'mission_events', ['change_xid', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently('ix_mission_events_change_xid_id', 'mission_events')
+    op.drop_column('mission_events', 'change_xid')
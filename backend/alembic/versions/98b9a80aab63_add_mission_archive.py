@@ -0,0 +1,169 @@
+"""Add mission archive
+
+Revision ID: 98b9a80aab63
+Revises: c24677248de7
+Create Date: 2026-10-19 16:25:11.622866
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '98b9a80aab63'
+down_revision: Union[str, Sequence[str], None] = 'c24677248de7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Stats views recreated so that archived missions and targets keep counting.
+# Each entry is (name, unique index column, live-only query, live + archive query).
+STATS_VIEWS = (
+    (
+        "cat_mission_stats",
+        "cat_id",
+        """
+        SELECT
+            c.id AS cat_id,
+            c.name AS cat_name,
+            count(m.id) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            count(m.id) FILTER (WHERE m.is_complete) AS completed_missions
+        FROM cats c
+        LEFT JOIN missions m ON m.cat_id = c.id
+        GROUP BY c.id, c.name
+        """,
+        """
+        SELECT
+            c.id AS cat_id,
+            c.name AS cat_name,
+            count(m.id) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            count(m.id) FILTER (WHERE m.is_complete) AS completed_missions
+        FROM cats c
+        LEFT JOIN (
+            SELECT id, cat_id, is_complete FROM missions
+            UNION ALL
+            SELECT id, cat_id, is_complete FROM missions_archive
+        ) m ON m.cat_id = c.id
+        GROUP BY c.id, c.name
+        """,
+    ),
+    (
+        "country_target_stats",
+        "country",
+        """
+        SELECT
+            t.country,
+            count(*) AS total_targets,
+            count(*) FILTER (WHERE t.is_complete) AS completed_targets,
+            round(count(*) FILTER (WHERE t.is_complete)::numeric / count(*), 4)
+                AS completion_rate
+        FROM targets t
+        GROUP BY t.country
+        """,
+        """
+        SELECT
+            t.country,
+            count(*) AS total_targets,
+            count(*) FILTER (WHERE t.is_complete) AS completed_targets,
+            round(count(*) FILTER (WHERE t.is_complete)::numeric / count(*), 4)
+                AS completion_rate
+        FROM (
+            SELECT country, is_complete FROM targets
+            UNION ALL
+            SELECT country, is_complete FROM targets_archive
+        ) t
+        GROUP BY t.country
+        """,
+    ),
+    (
+        "mission_completion_stats",
+        "id",
+        """
+        SELECT
+            1 AS id,
+            count(*) AS total_missions,
+            count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+            count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            extract(epoch FROM avg(m.completed_at - m.created_at))
+                AS avg_completion_seconds,
+            now() AS refreshed_at
+        FROM missions m
+        """,
+        """
+        SELECT
+            1 AS id,
+            count(*) AS total_missions,
+            count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+            count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            extract(epoch FROM avg(m.completed_at - m.created_at))
+                AS avg_completion_seconds,
+            now() AS refreshed_at
+        FROM (
+            SELECT is_complete, created_at, completed_at FROM missions
+            UNION ALL
+            SELECT is_complete, created_at, completed_at FROM missions_archive
+        ) m
+        """,
+    ),
+)
+
+
+def _recreate_stats_views(include_archive: bool) -> None:
+    for name, key, live_query, archive_query in STATS_VIEWS:
+        query = archive_query if include_archive else live_query
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
+        op.execute(f"CREATE MATERIALIZED VIEW {name} AS {query}")
+        op.execute(f"CREATE UNIQUE INDEX ix_{name}_{key} ON {name} ({key})")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('missions_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('is_complete', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('cat_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['cat_id'], ['cats.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_missions_archive_cat_id'), 'missions_archive', ['cat_id'], unique=False)
+    op.create_index(op.f('ix_missions_archive_completed_at'), 'missions_archive', ['completed_at'], unique=False)
+    op.create_table('targets_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('country', sa.String(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_complete', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('mission_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['mission_id'], ['missions_archive.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('mission_id', 'name', name='uq_target_archive_mission_name')
+    )
+    op.create_index(op.f('ix_targets_archive_mission_id'), 'targets_archive', ['mission_id'], unique=False)
+    # ### end Alembic commands ###
+
+    _recreate_stats_views(include_archive=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_stats_views(include_archive=False)
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index(op.f('ix_targets_archive_mission_id'), table_name='targets_archive')
+    op.drop_table('targets_archive')
+    op.drop_index(op.f('ix_missions_archive_completed_at'), table_name='missions_archive')
+    op.drop_index(op.f('ix_missions_archive_cat_id'), table_name='missions_archive')
+    op.drop_table('missions_archive')
+    # ### end Alembic commands ###
@@ -0,0 +1,76 @@
+"""Add total cats to mission completion stats
+
+Revision ID: a7c36f8635ba
+Revises: c309cd83d155
+Create Date: 2026-10-19 19:21:47.306915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c36f8635ba'
+down_revision: Union[str, Sequence[str], None] = 'c309cd83d155'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The one-row view also counts the rows of cat_mission_stats, so paging through
+# cats does not count the whole view on every read. Both are refreshed in the
+# same transaction, so the count matches the pages.
+PREVIOUS_QUERY = """
+    SELECT
+        1 AS id,
+        count(*) AS total_missions,
+        count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+        count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+        extract(epoch FROM avg(m.completed_at - m.created_at))
+            AS avg_completion_seconds,
+        now() AS refreshed_at
+    FROM (
+        SELECT is_complete, created_at, completed_at
+        FROM missions
+        WHERE deleted_at IS NULL
+        UNION ALL
+        SELECT is_complete, created_at, completed_at FROM missions_archive
+    ) m
+"""
+QUERY = """
+    SELECT
+        1 AS id,
+        count(*) AS total_missions,
+        count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+        count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+        extract(epoch FROM avg(m.completed_at - m.created_at))
+            AS avg_completion_seconds,
+        (SELECT count(*) FROM cats WHERE deleted_at IS NULL) AS total_cats,
+        now() AS refreshed_at
+    FROM (
+        SELECT is_complete, created_at, completed_at
+        FROM missions
+        WHERE deleted_at IS NULL
+        UNION ALL
+        SELECT is_complete, created_at, completed_at FROM missions_archive
+    ) m
+"""
+
+
+def _recreate_mission_completion_stats(query: str) -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mission_completion_stats")
+    op.execute(f"CREATE MATERIALIZED VIEW mission_completion_stats AS {query}")
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mission_completion_stats_id "
+        "ON mission_completion_stats (id)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate_mission_completion_stats(QUERY)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_mission_completion_stats(PREVIOUS_QUERY)
@@ -0,0 +1,91 @@
+"""Add agency stats materialized views
+
+Revision ID: d1cf4aec4a5f
+Revises: defd392c4ed1
+Create Date: 2025-07-02 10:14:08.311942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1cf4aec4a5f'
+down_revision: Union[str, Sequence[str], None] = 'defd392c4ed1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Every view carries a unique index so it can be refreshed CONCURRENTLY.
+    op.execute("""
+        CREATE MATERIALIZED VIEW cat_mission_stats AS
+        SELECT
+            c.id AS cat_id,
+            c.name AS cat_name,
+            count(m.id) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            count(m.id) FILTER (WHERE m.is_complete) AS completed_missions
+        FROM cats c
+        LEFT JOIN missions m ON m.cat_id = c.id
+        GROUP BY c.id, c.name
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX ix_cat_mission_stats_cat_id ON cat_mission_stats (cat_id)"
+    )
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW country_target_stats AS
+        SELECT
+            t.country,
+            count(*) AS total_targets,
+            count(*) FILTER (WHERE t.is_complete) AS completed_targets,
+            round(count(*) FILTER (WHERE t.is_complete)::numeric / count(*), 4)
+                AS completion_rate
+        FROM targets t
+        GROUP BY t.country
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX ix_country_target_stats_country "
+        "ON country_target_stats (country)"
+    )
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW breed_salary_stats AS
+        SELECT
+            c.breed,
+            count(*) AS cat_count,
+            sum(c.salary) AS total_salary,
+            round(avg(c.salary), 2) AS average_salary
+        FROM cats c
+        GROUP BY c.breed
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX ix_breed_salary_stats_breed ON breed_salary_stats (breed)"
+    )
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW mission_completion_stats AS
+        SELECT
+            1 AS id,
+            count(*) AS total_missions,
+            count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+            count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            extract(epoch FROM avg(m.completed_at - m.created_at))
+                AS avg_completion_seconds,
+            now() AS refreshed_at
+        FROM missions m
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mission_completion_stats_id "
+        "ON mission_completion_stats (id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mission_completion_stats")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS breed_salary_stats")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS country_target_stats")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS cat_mission_stats")
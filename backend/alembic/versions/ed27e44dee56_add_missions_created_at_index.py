@@ -0,0 +1,28 @@
+"""Add missions created_at index
+
+Revision ID: ed27e44dee56
+Revises: 0de2aa910479
+Create Date: 2026-10-19 17:14:02.490927
+
+"""
+from typing import Sequence, Union
+
+from db.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ed27e44dee56'
+down_revision: Union[str, Sequence[str], None] = '0de2aa910479'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Purges select missions by age; built without blocking writes
+    create_index_concurrently('ix_missions_created_at', 'missions', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently('ix_missions_created_at', 'missions')
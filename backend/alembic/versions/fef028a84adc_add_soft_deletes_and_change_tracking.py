@@ -0,0 +1,227 @@
+"""Add soft deletes and change tracking
+
+Revision ID: fef028a84adc
+Revises: 98b9a80aab63
+Create Date: 2026-10-19 16:28:38.613594
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from db.migrations import (
+    CHANGE_TRACKING_VALUES,
+    backfill,
+    create_index_concurrently,
+    set_not_null,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fef028a84adc'
+down_revision: Union[str, Sequence[str], None] = '98b9a80aab63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Stats views recreated to leave soft-deleted cats and missions out.
+# Each entry is (name, unique index column, previous query, new query).
+STATS_VIEWS = (
+    (
+        "cat_mission_stats",
+        "cat_id",
+        """
+        SELECT
+            c.id AS cat_id,
+            c.name AS cat_name,
+            count(m.id) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            count(m.id) FILTER (WHERE m.is_complete) AS completed_missions
+        FROM cats c
+        LEFT JOIN (
+            SELECT id, cat_id, is_complete FROM missions
+            UNION ALL
+            SELECT id, cat_id, is_complete FROM missions_archive
+        ) m ON m.cat_id = c.id
+        GROUP BY c.id, c.name
+        """,
+        """
+        SELECT
+            c.id AS cat_id,
+            c.name AS cat_name,
+            count(m.id) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            count(m.id) FILTER (WHERE m.is_complete) AS completed_missions
+        FROM cats c
+        LEFT JOIN (
+            SELECT id, cat_id, is_complete FROM missions WHERE deleted_at IS NULL
+            UNION ALL
+            SELECT id, cat_id, is_complete FROM missions_archive
+        ) m ON m.cat_id = c.id
+        WHERE c.deleted_at IS NULL
+        GROUP BY c.id, c.name
+        """,
+    ),
+    (
+        "country_target_stats",
+        "country",
+        """
+        SELECT
+            t.country,
+            count(*) AS total_targets,
+            count(*) FILTER (WHERE t.is_complete) AS completed_targets,
+            round(count(*) FILTER (WHERE t.is_complete)::numeric / count(*), 4)
+                AS completion_rate
+        FROM (
+            SELECT country, is_complete FROM targets
+            UNION ALL
+            SELECT country, is_complete FROM targets_archive
+        ) t
+        GROUP BY t.country
+        """,
+        """
+        SELECT
+            t.country,
+            count(*) AS total_targets,
+            count(*) FILTER (WHERE t.is_complete) AS completed_targets,
+            round(count(*) FILTER (WHERE t.is_complete)::numeric / count(*), 4)
+                AS completion_rate
+        FROM (
+            SELECT t.country, t.is_complete
+            FROM targets t
+            JOIN missions m ON m.id = t.mission_id
+            WHERE m.deleted_at IS NULL
+            UNION ALL
+            SELECT country, is_complete FROM targets_archive
+        ) t
+        GROUP BY t.country
+        """,
+    ),
+    (
+        "breed_salary_stats",
+        "breed",
+        """
+        SELECT
+            c.breed,
+            count(*) AS cat_count,
+            sum(c.salary) AS total_salary,
+            round(avg(c.salary), 2) AS average_salary
+        FROM cats c
+        GROUP BY c.breed
+        """,
+        """
+        SELECT
+            c.breed,
+            count(*) AS cat_count,
+            sum(c.salary) AS total_salary,
+            round(avg(c.salary), 2) AS average_salary
+        FROM cats c
+        WHERE c.deleted_at IS NULL
+        GROUP BY c.breed
+        """,
+    ),
+    (
+        "mission_completion_stats",
+        "id",
+        """
+        SELECT
+            1 AS id,
+            count(*) AS total_missions,
+            count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+            count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            extract(epoch FROM avg(m.completed_at - m.created_at))
+                AS avg_completion_seconds,
+            now() AS refreshed_at
+        FROM (
+            SELECT is_complete, created_at, completed_at FROM missions
+            UNION ALL
+            SELECT is_complete, created_at, completed_at FROM missions_archive
+        ) m
+        """,
+        """
+        SELECT
+            1 AS id,
+            count(*) AS total_missions,
+            count(*) FILTER (WHERE m.is_complete) AS completed_missions,
+            count(*) FILTER (WHERE NOT m.is_complete) AS active_missions,
+            extract(epoch FROM avg(m.completed_at - m.created_at))
+                AS avg_completion_seconds,
+            now() AS refreshed_at
+        FROM (
+            SELECT is_complete, created_at, completed_at
+            FROM missions
+            WHERE deleted_at IS NULL
+            UNION ALL
+            SELECT is_complete, created_at, completed_at FROM missions_archive
+        ) m
+        """,
+    ),
+)
+
+
+def _recreate_stats_views(exclude_deleted: bool) -> None:
+    for name, key, previous_query, query in STATS_VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
+        op.execute(
+            f"CREATE MATERIALIZED VIEW {name} AS "
+            f"{query if exclude_deleted else previous_query}"
+        )
+        op.execute(f"CREATE UNIQUE INDEX ix_{name}_{key} ON {name} ({key})")
+
+
+CHANGE_TRACKED_TABLES = ("cats", "missions", "targets")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("change_seq")))
+
+    op.add_column('cats', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('missions', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    # Volatile defaults on NOT NULL columns would rewrite every table under
+    # ACCESS EXCLUSIVE. The columns are added nullable, new rows get the
+    # defaults, existing rows are backfilled in batches and NOT NULL is set last.
+    for table_name in CHANGE_TRACKED_TABLES:
+        op.add_column(table_name, sa.Column('change_xid', sa.BigInteger(), nullable=True))
+        op.add_column(table_name, sa.Column('change_seq', sa.BigInteger(), nullable=True))
+        op.alter_column(
+            table_name,
+            'change_xid',
+            server_default=sa.text('pg_current_xact_id()::text::bigint'),
+        )
+        op.alter_column(
+            table_name, 'change_seq', server_default=sa.text("nextval('change_seq')")
+        )
+
+    _recreate_stats_views(exclude_deleted=True)
+
+    for table_name in CHANGE_TRACKED_TABLES:
+        backfill(table_name, CHANGE_TRACKING_VALUES, where="change_xid IS NULL")
+        set_not_null(table_name, 'change_xid')
+        set_not_null(table_name, 'change_seq')
+        create_index_concurrently(
+            f'ix_{table_name}_change_xid_change_seq',
+            table_name,
+            ['change_xid', 'change_seq'],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_stats_views(exclude_deleted=False)
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index('ix_targets_change_xid_change_seq', table_name='targets')
+    op.drop_column('targets', 'change_seq')
+    op.drop_column('targets', 'change_xid')
+    op.drop_index('ix_missions_change_xid_change_seq', table_name='missions')
+    op.drop_column('missions', 'change_seq')
+    op.drop_column('missions', 'change_xid')
+    op.drop_column('missions', 'deleted_at')
+    op.drop_index('ix_cats_change_xid_change_seq', table_name='cats')
+    op.drop_column('cats', 'change_seq')
+    op.drop_column('cats', 'change_xid')
+    op.drop_column('cats', 'deleted_at')
+    # ### end Alembic commands ###
+
+    op.execute(sa.schema.DropSequence(sa.Sequence("change_seq")))
@@ -0,0 +1,102 @@
+"""Check that mission documents are upserted in bulk past asyncpg's limits.
+
+Usage: python scripts/document_upsert.py [--missions N], from the `backend`
+directory, with DATABASE_URL pointing at a migrated database.
+
+asyncpg refuses statements with more than 32767 arguments, so an upsert that
+sent two per document failed beyond 16383 documents. This creates that many
+missions and more, saves a document for each twice (an insert, then a
+replace) and checks they were all written. Everything runs in one transaction
+that is rolled back, so the database is left as it was.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import (  # noqa: E402
+    ARRAY,
+    Integer,
+    any_,
+    bindparam,
+    false,
+    func,
+    insert,
+    select,
+)
+
+from core.config import get_settings  # noqa: E402
+from db.session import create_engine, create_session_factory  # noqa: E402
+from models import Mission, MissionDocument  # noqa: E402
+from repositories.document import save_mission_documents  # noqa: E402
+
+# asyncpg's cap on query arguments, divided by the two the old upsert sent
+OLD_DOCUMENT_LIMIT = 32767 // 2
+
+
+async def check(missions: int) -> bool:
+    """Upsert documents of `missions` new missions; True if all were written."""
+    engine = create_engine(get_settings())
+    session_factory = create_session_factory(engine)
+    try:
+        async with session_factory() as session:
+            result = await session.execute(
+                insert(Mission)
+                .from_select(
+                    ["is_complete"],
+                    select(false()).select_from(func.generate_series(1, missions)),
+                )
+                .returning(Mission.id)
+            )
+            mission_ids = list(result.scalars().all())
+
+            for revision in (1, 2):
+                started = time.perf_counter()
+                await save_mission_documents(
+                    session=session,
+                    documents={
+                        mission_id: {"id": mission_id, "revision": revision}
+                        for mission_id in mission_ids
+                    },
+                )
+                elapsed = time.perf_counter() - started
+                print(
+                    f"Saved revision {revision} of {len(mission_ids)} documents "
+                    f"in {elapsed * 1000:.0f} ms"
+                )
+
+            written = await session.scalar(
+                select(func.count())
+                .select_from(MissionDocument)
+                .where(
+                    MissionDocument.mission_id
+                    == any_(bindparam("ids", mission_ids, type_=ARRAY(Integer)))
+                )
+                .where(MissionDocument.document["revision"].as_integer() == 2)
+            )
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+    print(f"{written} of {missions} documents at revision 2")
+    return written == missions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--missions",
+        type=int,
+        default=2 * OLD_DOCUMENT_LIMIT,
+        help=f"missions created (default: {2 * OLD_DOCUMENT_LIMIT})",
+    )
+    args = parser.parse_args()
+    return 0 if asyncio.run(check(args.missions)) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Maintenance commands run against the configured database.
+
+Usage: python cli.py <command> [options], from the `src` directory.
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+
+from core.config import Settings, get_settings
+from core.logging import configure_logging
+from db.session import create_engine, create_session_factory, open_db_session
+from schemas.mission import MissionPurgeRequest
+from services.document import (
+    DOCUMENT_BATCH_SIZE,
+    rebuild_mission_documents_service,
+    verify_mission_documents_service,
+)
+from services.mission import purge_missions_service
+
+
+async def _run_service(
+    settings: Settings,
+    service: Callable[..., Awaitable[BaseModel]],
+    **kwargs: Any,
+) -> BaseModel:
+    """Run a service in a session of its own and print its result as JSON."""
+    engine = create_engine(settings)
+    try:
+        async with open_db_session(
+            session_factory=create_session_factory(engine),
+            statement_timeout=settings.db_statement_timeout,
+        ) as session:
+            response = await service(session=session, **kwargs)
+    finally:
+        await engine.dispose()
+
+    print(response.model_dump_json())
+    return response
+
+
+async def purge_missions(settings: Settings, args: argparse.Namespace) -> int:
+    """Permanently delete missions matching the filter options."""
+    request = MissionPurgeRequest(
+        older_than_days=args.older_than_days,
+        is_complete=args.complete,
+        assigned=args.assigned,
+        deleted=args.deleted,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+    )
+    await _run_service(
+        settings, purge_missions_service, settings=settings, request=request
+    )
+    return 0
+
+
+async def rebuild_mission_documents(
+    settings: Settings, args: argparse.Namespace
+) -> int:
+    """Rewrite the stored documents of all missions."""
+    await _run_service(
+        settings, rebuild_mission_documents_service, batch_size=args.batch_size
+    )
+    return 0
+
+
+async def verify_mission_documents(
+    settings: Settings, args: argparse.Namespace
+) -> int:
+    """Report mission documents that differ from their missions."""
+    report = await _run_service(
+        settings, verify_mission_documents_service, batch_size=args.batch_size
+    )
+    return 1 if report.missing or report.stale or report.orphaned else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    purge = commands.add_parser(
+        "purge-missions", help=purge_missions.__doc__.rstrip(".")
+    )
+    purge.set_defaults(handler=purge_missions)
+    purge.add_argument(
+        "--older-than-days",
+        type=int,
+        required=True,
+        help="only missions created more than this many days ago",
+    )
+    purge.add_argument(
+        "--complete",
+        action=argparse.BooleanOptionalAction,
+        help="only complete (--complete) or incomplete (--no-complete) missions",
+    )
+    purge.add_argument(
+        "--assigned",
+        action=argparse.BooleanOptionalAction,
+        help="only assigned (--assigned) or unassigned (--no-assigned) missions",
+    )
+    purge.add_argument(
+        "--deleted",
+        action=argparse.BooleanOptionalAction,
+        help="only soft-deleted (--deleted) or live (--no-deleted) missions",
+    )
+    purge.add_argument(
+        "--batch-size",
+        type=int,
+        help="missions deleted per transaction (default: PURGE_BATCH_SIZE)",
+    )
+    purge.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="count the matching missions without deleting them",
+    )
+
+    for name, handler in (
+        ("rebuild-mission-documents", rebuild_mission_documents),
+        ("verify-mission-documents", verify_mission_documents),
+    ):
+        command = commands.add_parser(name, help=handler.__doc__.rstrip("."))
+        command.set_defaults(handler=handler)
+        command.add_argument(
+            "--batch-size",
+            type=int,
+            default=DOCUMENT_BATCH_SIZE,
+            help=f"missions per transaction (default: {DOCUMENT_BATCH_SIZE})",
+        )
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    settings = get_settings()
+    configure_logging(settings)
+
+    try:
+        return asyncio.run(args.handler(settings, args))
+    except ValidationError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except HTTPException as e:
+        print(f"error: {e.detail}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
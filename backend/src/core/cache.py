@@ -0,0 +1,151 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Key under which sessions carry the process-wide cache, see `create_session_factory`
+ENTITY_CACHE_KEY = "entity_cache"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of an entity cache since startup."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EntityCache:
+    """Size-bounded LRU of read models, shared by the requests of one worker.
+
+    Entries expire after `ttl` seconds, which bounds how stale a worker can be
+    about writes made by other workers. Writes made here replace or drop their
+    entry directly. Values exposing a `version` are never replaced by an older
+    version, so a slow reader cannot undo a concurrent write-through.
+
+    Concurrent misses for the same key share a single load. The event loop
+    runs one coroutine at a time and no method awaits while touching the
+    dictionaries, so no lock is needed.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self.loading: dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a live entry and mark it recently used."""
+        if (entry := self.entries.get(key)) is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value unless a newer version of it is already cached."""
+        if self.max_size == 0:
+            return
+
+        current = self.get(key)
+        if current is not None and _version(current) > _version(value):
+            return
+
+        self.entries[key] = (value, time.monotonic() + self.ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry; a load already in flight will not store its result."""
+        self.entries.pop(key, None)
+        self.loading.pop(key, None)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any | None]]
+    ) -> Any | None:
+        """Return the cached value or load it once for all concurrent callers.
+
+        None results are returned but not cached.
+        """
+        while True:
+            if (value := self.get(key)) is not None:
+                self.hits += 1
+                return value
+
+            if (future := self.loading.get(key)) is None:
+                break
+
+            # Waiting on the future rather than awaiting it keeps a cancelled
+            # loader from cancelling its followers; they retry the load instead
+            await asyncio.wait([future])
+            if not future.cancelled():
+                self.hits += 1
+                return future.result()
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self.loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here so an error nobody waited for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if value is not None and self.loading.get(key) is future:
+                self.set(key, value)
+            return value
+        finally:
+            if self.loading.get(key) is future:
+                del self.loading[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.entries.clear()
+        self.loading.clear()
+
+    def stats(self) -> CacheStats:
+        """Snapshot the cache counters."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self.entries),
+            max_size=self.max_size,
+        )
+
+
+def _version(value: Any) -> int:
+    return getattr(value, "version", 0)
+
+
+def get_entity_cache(session: AsyncSession) -> EntityCache | None:
+    """Return the process-wide cache the session was created with, if any."""
+    return session.info.get(ENTITY_CACHE_KEY)
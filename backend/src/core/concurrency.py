@@ -0,0 +1,20 @@
+from fastapi import HTTPException, status
+
+
+def parse_if_match(if_match: str | None) -> int | None:
+    """Extract the expected entity version from an If-Match header."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    value = if_match.strip().removeprefix("W/").strip('"')
+    if not value.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must be an entity version ETag, e.g. \"3\""
+        )
+    return int(value)
+
+
+def version_etag(version: int) -> str:
+    """Build a strong ETag for an entity version."""
+    return f'"{version}"'
@@ -4,7 +4,13 @@ from pathlib import Path
 from pydantic import Field, PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from core.enums import Environment
+from core.enums import (
+    DatabasePoolMode,
+    Environment,
+    LogFormat,
+    RateLimitBackend,
+    TracingExporter,
+)
 
 
 class Settings(BaseSettings):
@@ -30,6 +36,227 @@ class Settings(BaseSettings):
         default="https://api.thecatapi.com/v1/breeds",
         description="The Cat API URL for breed validation"
     )
+    database_direct_url: PostgresDsn | None = Field(
+        default=None,
+        description=(
+            "PostgreSQL URL bypassing any connection pooler, used for LISTEN and "
+            "migrations. Defaults to DATABASE_URL"
+        )
+    )
+    db_pool_mode: DatabasePoolMode = Field(
+        default=DatabasePoolMode.DIRECT,
+        description=(
+            "`transaction` when DATABASE_URL points at a transaction-pooling proxy "
+            "such as PgBouncer"
+        )
+    )
+    db_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Connections kept open per worker in direct mode"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Extra connections opened under load per worker in direct mode"
+    )
+    db_prepared_statement_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description="Prepared statements cached per connection, 0 to disable"
+    )
+    db_statement_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds a query of an API request may run, 0 for no limit"
+    )
+    db_list_statement_timeout: float = Field(
+        default=10.0,
+        ge=0,
+        description="Seconds a query of a list or feed endpoint may run, 0 for no limit"
+    )
+    db_migration_lock_timeout: float = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "Seconds a migration waits for a table lock before failing, 0 to wait "
+            "indefinitely"
+        )
+    )
+    stats_refresh_interval: int = Field(
+        default=60,
+        ge=1,
+        description="Seconds between agency statistics refreshes (staleness bound)"
+    )
+    event_queue_size: int = Field(
+        default=100,
+        ge=1,
+        description="Undelivered change feed events buffered per client connection"
+    )
+    event_keepalive_interval: int = Field(
+        default=15,
+        ge=1,
+        description="Seconds between keepalive comments on idle change feeds"
+    )
+    event_retention_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Hours change feed events are kept for resuming clients"
+    )
+    job_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Background jobs executed concurrently per worker"
+    )
+    job_poll_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds between outbox polls when no jobs are due"
+    )
+    job_max_attempts: int = Field(
+        default=5,
+        ge=1,
+        description="Attempts before a background job is marked as failed"
+    )
+    job_retry_base_delay: float = Field(
+        default=5.0,
+        gt=0,
+        description="Base delay in seconds for exponential job retry backoff"
+    )
+    job_lease_seconds: int = Field(
+        default=300,
+        ge=1,
+        description="Seconds a claimed job stays locked before it can be retried"
+    )
+    rate_limit_enabled: bool = Field(
+        default=True,
+        description="Enable per-client token bucket rate limiting"
+    )
+    rate_limit_backend: RateLimitBackend = Field(
+        default=RateLimitBackend.MEMORY,
+        description="Where token buckets live: per worker memory or shared Postgres"
+    )
+    rate_limit_rate: float = Field(
+        default=20.0,
+        gt=0,
+        description="Sustained requests per second allowed per client"
+    )
+    rate_limit_burst: int = Field(
+        default=40,
+        ge=1,
+        description="Requests a client may burst above the sustained rate"
+    )
+    rate_limit_api_keys: list[str] = Field(
+        default=[],
+        description=(
+            "Client keys whose X-API-Key requests get a bucket of their own; "
+            "requests with any other key are limited by IP"
+        )
+    )
+    rate_limit_pool_size: int = Field(
+        default=2,
+        ge=1,
+        description="Connections per worker of the Postgres rate limiter's own pool"
+    )
+    db_concurrency_limit: int = Field(
+        default=15,
+        ge=1,
+        description="Concurrent DB-bound requests per worker before queueing"
+    )
+    db_queue_timeout: float = Field(
+        default=2.0,
+        ge=0,
+        description="Seconds a request may wait for a DB slot before a 503"
+    )
+    gzip_minimum_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Responses smaller than this many bytes are not compressed"
+    )
+    idempotency_key_ttl_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Hours a stored Idempotency-Key response can be replayed"
+    )
+    archive_after_days: int = Field(
+        default=90,
+        ge=1,
+        description="Days after completion before a mission is moved to the archive"
+    )
+    archive_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Missions moved to the archive per transaction"
+    )
+    archive_interval: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds between archival runs"
+    )
+    purge_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Missions permanently deleted per transaction by a purge"
+    )
+    purge_batch_pause: float = Field(
+        default=0.1,
+        ge=0,
+        description="Seconds a purge sleeps between batches to let replicas catch up"
+    )
+    admin_api_key: str | None = Field(
+        default=None,
+        description="Key admin endpoints require in X-Admin-Key; unset disables them"
+    )
+    log_level: str = Field(
+        default="INFO",
+        description="Minimum level of emitted log records"
+    )
+    log_format: LogFormat = Field(
+        default=LogFormat.JSON,
+        description="Log records as one JSON object per line, or as plain text"
+    )
+    log_sample_burst: int = Field(
+        default=20,
+        ge=0,
+        description="Warnings and errors logged per call site and window, 0 for all"
+    )
+    log_sample_window: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds over which repeated warnings and errors are sampled"
+    )
+    entity_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Entities cached per worker for single-entity reads, 0 to disable"
+    )
+    entity_cache_ttl: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds a cached entity may lag writes made by other workers"
+    )
+    tracing_enabled: bool = Field(
+        default=False,
+        description="Record OpenTelemetry spans; needs the tracing extra installed"
+    )
+    tracing_sample_ratio: float = Field(
+        default=0.1,
+        ge=0,
+        le=1,
+        description="Share of traces recorded when the caller did not decide"
+    )
+    tracing_exporter: TracingExporter = Field(
+        default=TracingExporter.OTLP,
+        description="Send spans to an OTLP/HTTP collector or append them to a file"
+    )
+    tracing_otlp_endpoint: str | None = Field(
+        default=None,
+        description="OTLP/HTTP traces URL; unset uses the OTEL_EXPORTER_OTLP_* env"
+    )
+    tracing_file_path: str = Field(
+        default="traces.jsonl",
+        description="File that spans are appended to with the file exporter"
+    )
 
     @property
     def debug(self) -> bool:
@@ -41,12 +268,20 @@ class Settings(BaseSettings):
         """Database echo is enabled for development environment."""
         return self.environment == Environment.DEVELOPMENT
 
+    @property
+    def direct_database_url(self) -> str:
+        """Database URL that reaches PostgreSQL itself rather than a pooler."""
+        return str(self.database_direct_url or self.database_url)
+
+    @property
+    def listen_database_url(self) -> str:
+        """Plain asyncpg DSN for LISTEN connections outside SQLAlchemy."""
+        return self.direct_database_url.replace(
+            "postgresql+asyncpg://", "postgresql://"
+        )
+
 
 @lru_cache
 def get_settings() -> Settings:
     """Get cached application settings."""
     return Settings()
-
-
-# Global settings instance
-settings = get_settings()
@@ -6,3 +6,93 @@ class Environment(str, Enum):
 
     DEVELOPMENT = "development"
     PRODUCTION = "production"
+
+
+class MissionEventType(str, Enum):
+    """Mission change feed event type enum."""
+
+    MISSION_CREATED = "mission_created"
+    CAT_ASSIGNED = "cat_assigned"
+    TARGET_UPDATED = "target_updated"
+    MISSION_COMPLETED = "mission_completed"
+
+
+class JobStatus(str, Enum):
+    """Background job status enum."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+class JobTask(str, Enum):
+    """Background job task name enum."""
+
+    REVALIDATE_CAT_BREED = "revalidate_cat_breed"
+    REFRESH_MISSION_DOCUMENTS = "refresh_mission_documents"
+
+
+class AssignmentPreference(str, Enum):
+    """Auto-assignment cat ranking enum."""
+
+    EXPERIENCE = "experience"
+    SALARY = "salary"
+
+
+class MissionListShape(str, Enum):
+    """Mission list response layout enum."""
+
+    NESTED = "nested"
+    SIDELOADED = "sideloaded"
+
+
+class TargetNotes(str, Enum):
+    """How much of target notes a mission list returns enum."""
+
+    FULL = "full"
+    PREVIEW = "preview"
+    NONE = "none"
+
+
+class DatabasePoolMode(str, Enum):
+    """Database connection pooling mode enum."""
+
+    DIRECT = "direct"
+    TRANSACTION = "transaction"
+
+
+class LogFormat(str, Enum):
+    """Log output format enum."""
+
+    JSON = "json"
+    TEXT = "text"
+
+
+class TracingExporter(str, Enum):
+    """Trace export destination enum."""
+
+    OTLP = "otlp"
+    FILE = "file"
+
+
+class RateLimitBackend(str, Enum):
+    """Rate limit state storage enum."""
+
+    MEMORY = "memory"
+    POSTGRES = "postgres"
+
+
+class ChangeEntity(str, Enum):
+    """Change feed entity type enum."""
+
+    CAT = "cat"
+    MISSION = "mission"
+    TARGET = "target"
+
+
+class ChangeOperation(str, Enum):
+    """Change feed operation enum."""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
@@ -0,0 +1,80 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesces single-key lookups made in the same event loop tick.
+
+    Every `load` call queues its key. The queue is flushed on the next
+    iteration of the loop, so concurrent requests resolving different IDs
+    share one `load_many` query instead of running one each. `load_many` gets
+    up to `max_batch_size` distinct keys and returns the values it found;
+    missing keys resolve to None.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[list[K]], Awaitable[dict[K, V]]],
+        max_batch_size: int = 100,
+    ) -> None:
+        self.load_many = load_many
+        self.max_batch_size = max_batch_size
+        self.pending: dict[K, list[asyncio.Future]] = {}
+        self.batches: set[asyncio.Task[None]] = set()
+        self.scheduled = False
+
+    async def load(self, key: K) -> V | None:
+        """Resolve a key together with the other keys queued this tick."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.setdefault(key, []).append(future)
+
+        if not self.scheduled:
+            self.scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        self.scheduled = False
+        pending, self.pending = self.pending, {}
+
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch_size):
+            chunk = keys[start:start + self.max_batch_size]
+            batch = {key: pending[key] for key in chunk}
+            task = asyncio.create_task(self._load_batch(batch))
+            self.batches.add(task)
+            task.add_done_callback(self.batches.discard)
+
+    async def _load_batch(self, batch: dict[K, list[asyncio.Future]]) -> None:
+        waiting = [
+            future
+            for futures in batch.values()
+            for future in futures
+            if not future.done()
+        ]
+        if not waiting:
+            return
+
+        try:
+            values = await self.load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in waiting:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in waiting:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, futures in batch.items():
+            for future in futures:
+                # A caller cancelled while waiting has nobody to deliver to
+                if not future.done():
+                    future.set_result(values.get(key))
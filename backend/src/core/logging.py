@@ -0,0 +1,155 @@
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+from typing import TextIO
+
+from loguru import logger
+
+from core.config import Settings
+from core.enums import LogFormat
+
+# ID of the request being handled, set by `RequestIdMiddleware`
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+TEXT_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {extra[request_id]} | "
+    "{name}:{function}:{line} - {message}{extra[sampling]}\n{exception}"
+)
+
+
+class LogSampler:
+    """Lets through the first `burst` warnings and errors per call site and window.
+
+    The rest are dropped before they are formatted or queued, so an error storm
+    costs a dictionary lookup per record. The first record let through in the
+    next window carries the number dropped in `extra["suppressed"]`. Records
+    below WARNING are never sampled.
+    """
+
+    def __init__(self, burst: int, window: float, min_level: int = 30) -> None:
+        self.burst = burst
+        self.window = window
+        self.min_level = min_level
+        self.sites: dict[tuple[str, str, int], tuple[float, int, int]] = {}
+
+    def __call__(self, record: dict) -> bool:
+        if self.burst == 0 or record["level"].no < self.min_level:
+            return True
+
+        site = (record["name"], record["function"], record["line"])
+        now = time.monotonic()
+        started_at, seen, suppressed = self.sites.get(site, (now, 0, 0))
+
+        if now - started_at >= self.window:
+            if suppressed:
+                record["extra"]["suppressed"] = suppressed
+            started_at, seen, suppressed = now, 0, 0
+
+        seen += 1
+        allowed = seen <= self.burst
+        if not allowed:
+            suppressed += 1
+
+        self.sites[site] = (started_at, seen, suppressed)
+        return allowed
+
+
+class BackgroundSink:
+    """Writes formatted records to a stream from a daemon thread.
+
+    Logging calls only put the rendered line on an in-process queue. When the
+    writer falls behind by `max_queued` lines, new lines are dropped rather
+    than blocking the caller; `dropped` counts them.
+    """
+
+    def __init__(self, stream: TextIO, max_queued: int = 10_000) -> None:
+        self.stream = stream
+        self.queue: queue.Queue[str | None] = queue.Queue(maxsize=max_queued)
+        self.dropped = 0
+        self.thread = threading.Thread(
+            target=self._drain, name="log-writer", daemon=True
+        )
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def write(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self) -> None:
+        """Write out queued lines and end the writer thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=5)
+        atexit.unregister(self.stop)
+
+    def _drain(self) -> None:
+        while (message := self.queue.get()) is not None:
+            self.stream.write(message)
+            # Write whatever else is already queued before flushing once
+            while not self.queue.empty():
+                if (message := self.queue.get_nowait()) is None:
+                    self.stream.flush()
+                    return
+                self.stream.write(message)
+            self.stream.flush()
+
+
+def _add_request_id(record: dict) -> None:
+    record["extra"].setdefault("request_id", request_id_var.get() or "-")
+
+
+def _json_format(record: dict) -> str:
+    """Render a record as one JSON line; runs only for records that pass the filter."""
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        payload["exception"] = "".join(traceback.format_exception(*record["exception"]))
+
+    record["extra"]["json"] = json.dumps(payload, default=str)
+    return "{extra[json]}\n"
+
+
+def _text_format(record: dict) -> str:
+    suppressed = record["extra"].get("suppressed")
+    record["extra"]["sampling"] = (
+        f" ({suppressed} similar records suppressed)" if suppressed else ""
+    )
+    return TEXT_FORMAT
+
+
+def configure_logging(settings: Settings) -> None:
+    """Route loguru through a sampled sink written from a background thread.
+
+    The calling coroutine only renders the record and queues it; writing to
+    stderr happens on the sink's thread, so a slow or flooded log pipe does not
+    stall the event loop. Loguru's own `enqueue` is not used, as it pickles
+    every record through a multiprocessing pipe and costs the caller more than
+    the write it offloads.
+    """
+    logger.remove()
+    logger.configure(patcher=_add_request_id)
+    logger.add(
+        BackgroundSink(sys.stderr),
+        level=settings.log_level.upper(),
+        format=_json_format if settings.log_format == LogFormat.JSON else _text_format,
+        filter=LogSampler(
+            burst=settings.log_sample_burst, window=settings.log_sample_window
+        ),
+        backtrace=False,
+        diagnose=settings.debug,
+    )
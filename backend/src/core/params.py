@@ -0,0 +1,25 @@
+from fastapi import HTTPException, status
+
+# Most IDs a multi-get request may resolve at once
+MAX_IDS_PER_REQUEST = 100
+
+
+def parse_ids(value: str | None) -> list[int] | None:
+    """Parse a comma-separated `ids` query parameter, dropping duplicates."""
+    if value is None:
+        return None
+
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if not items or not all(item.isdigit() for item in items):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integer IDs"
+        )
+
+    ids = list(dict.fromkeys(int(item) for item in items))
+    if len(ids) > MAX_IDS_PER_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_IDS_PER_REQUEST} ids can be requested at once"
+        )
+    return ids
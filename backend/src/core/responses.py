@@ -0,0 +1,91 @@
+import json
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import msgpack
+except ImportError:  # Optional: installed with the `msgpack` extra
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+
+# Documents the alternative body of negotiated endpoints in OpenAPI
+MSGPACK_CONTENT = {MSGPACK_MEDIA_TYPE: {}}
+
+# Negotiated responses differ by Accept, which shared caches must key on
+VARY_ACCEPT = {"Vary": "Accept"}
+
+
+class MsgPackResponse(Response):
+    """Response encoded as MessagePack instead of JSON.
+
+    Models are dumped in JSON mode first, so the document has the same keys
+    and values as its JSON form: datetimes as ISO 8601 strings and decimals
+    such as `salary` as strings that keep their precision. A string is taken
+    as an already encoded JSON document and decoded first.
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump(mode="json")
+        elif isinstance(content, str):
+            content = json.loads(content)
+        return msgpack.packb(content)
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Whether the client prefers MessagePack over JSON.
+
+    MessagePack is chosen when the `Accept` header lists it with a quality at
+    least that of `application/json`. Without msgpack installed, or without
+    such a header, responses stay JSON.
+    """
+    accept = request.headers.get("accept")
+    if msgpack is None or not accept or "msgpack" not in accept:
+        return False
+
+    msgpack_quality = json_quality = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        media_type = media_type.lower()
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type == "application/json":
+            json_quality = max(json_quality, quality)
+
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+def negotiated_response(
+    request: Request, content: BaseModel | dict | str
+) -> Response:
+    """Answer with MessagePack when the client asks for it, JSON otherwise.
+
+    Models are already validated instances of the route's response model, so
+    they are dumped directly rather than validated again by FastAPI. A string
+    is an already encoded JSON document and is sent as it is.
+    """
+    if accepts_msgpack(request):
+        return MsgPackResponse(content=content, headers=VARY_ACCEPT)
+    if isinstance(content, str):
+        return Response(
+            content=content, media_type="application/json", headers=VARY_ACCEPT
+        )
+    if isinstance(content, BaseModel):
+        content = content.model_dump(mode="json")
+    return JSONResponse(content=content, headers=VARY_ACCEPT)
@@ -0,0 +1,211 @@
+import functools
+import inspect
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import Settings
+from core.enums import TracingExporter
+
+if TYPE_CHECKING:
+    import httpx
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.trace import Tracer
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+SERVICE_NAME = "spy-cat-agency-api"
+
+# Longer statements are cut before being attached to their span
+MAX_STATEMENT_LENGTH = 2000
+
+# Set by `configure_tracing`; None means tracing is off and every hook is a no-op
+_tracer: "Tracer | None" = None
+_provider: "TracerProvider | None" = None
+
+
+def get_tracer() -> "Tracer | None":
+    """Return the application tracer, or None while tracing is off."""
+    return _tracer
+
+
+def traced(
+    func: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Record a span around each call of a service or repository coroutine.
+
+    While tracing is off the wrapper hands back the coroutine of the wrapped
+    function unchanged, so a call costs one global lookup and no extra frame.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    attributes = {"code.namespace": func.__module__, "code.function": func.__qualname__}
+
+    async def call_in_span(*args: P.args, **kwargs: P.kwargs) -> R:
+        with _tracer.start_as_current_span(name, attributes=attributes):
+            return await func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Coroutine[Any, Any, R]:
+        if _tracer is None:
+            return func(*args, **kwargs)
+        return call_in_span(*args, **kwargs)
+
+    return inspect.markcoroutinefunction(wrapper)
+
+
+def configure_tracing(settings: Settings) -> None:
+    """Start exporting spans when `tracing_enabled` is set.
+
+    OpenTelemetry is an optional dependency (the `tracing` extra) and is only
+    imported here, so deployments without it pay nothing. Spans are sampled
+    per trace with `tracing_sample_ratio`, following the caller's decision
+    when a request carries a `traceparent` header, and exported in batches
+    from a background thread.
+    """
+    global _provider, _tracer
+
+    if not settings.tracing_enabled or _tracer is not None:
+        return
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError as e:
+        raise RuntimeError(
+            "TRACING_ENABLED requires the tracing extra: pip install 'backend[tracing]'"
+        ) from e
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {
+                "service.name": SERVICE_NAME,
+                "deployment.environment": settings.environment.value,
+            }
+        ),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(_create_exporter(settings)))
+    trace.set_tracer_provider(provider)
+
+    _provider = provider
+    _tracer = provider.get_tracer(SERVICE_NAME)
+
+
+def _create_exporter(settings: Settings):
+    if settings.tracing_exporter == TracingExporter.OTLP:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        # None falls back to OTEL_EXPORTER_OTLP_TRACES_ENDPOINT or localhost
+        return OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    # One JSON span per line, appended, so the file can be read offline
+    return ConsoleSpanExporter(
+        out=open(settings.tracing_file_path, "a", encoding="utf-8"),  # noqa: SIM115
+        formatter=lambda span: span.to_json(indent=None) + "\n",
+    )
+
+
+def shutdown_tracing() -> None:
+    """Export spans still buffered and stop recording new ones."""
+    global _provider, _tracer
+
+    if _provider is not None:
+        _provider.shutdown()
+    _provider = None
+    _tracer = None
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record a client span for every statement the engine sends.
+
+    Does nothing while tracing is off, so no event listeners are installed.
+    """
+    if _tracer is None:
+        return
+
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+
+    url = engine.sync_engine.url
+    base_attributes = {
+        "db.system": "postgresql",
+        "db.name": url.database or "",
+        "server.address": url.host or "",
+        "server.port": url.port or 5432,
+    }
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _start_span(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        span = _tracer.start_span(
+            f"{operation} {url.database}".strip(),
+            kind=SpanKind.CLIENT,
+            attributes={
+                **base_attributes,
+                "db.operation": operation,
+                "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            },
+        )
+        conn.info.setdefault("tracing_spans", []).append(span)
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _end_span(conn, cursor, statement, parameters, context, executemany):
+        if spans := conn.info.get("tracing_spans"):
+            span = spans.pop()
+            if context is not None and context.rowcount >= 0:
+                span.set_attribute("db.rowcount", context.rowcount)
+            span.end()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _fail_span(exception_context):
+        conn = exception_context.connection
+        if conn is not None and (spans := conn.info.get("tracing_spans")):
+            span = spans.pop()
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+
+def create_http_transport() -> "httpx.AsyncBaseTransport | None":
+    """Transport that records outbound requests, or None for httpx's default.
+
+    Pass the result as `transport=` when building an `httpx.AsyncClient`.
+    """
+    if _tracer is None:
+        return None
+
+    import httpx
+
+    from opentelemetry.propagate import inject
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+
+    class TracingTransport(httpx.AsyncHTTPTransport):
+        """Wraps each request in a client span and propagates the trace."""
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            with _tracer.start_as_current_span(
+                request.method,
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "http.request.method": request.method,
+                    "url.full": str(request.url.copy_with(query=None)),
+                    "server.address": request.url.host,
+                },
+            ) as span:
+                inject(request.headers)
+                response = await super().handle_async_request(request)
+                span.set_attribute("http.response.status_code", response.status_code)
+                if response.status_code >= 400:
+                    span.set_status(Status(StatusCode.ERROR))
+                return response
+
+    return TracingTransport()
@@ -1,5 +1,29 @@
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import BigInteger, Sequence, Text, func, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+# Shared by every change-tracked table so `/changes` has one global order
+change_seq = Sequence("change_seq")
 
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
+
+
+class ChangeTrackingMixin:
+    """Columns that order writes for the incremental `/changes` feed.
+
+    `change_xid` is the ID of the transaction that last wrote the row and
+    `change_seq` a global sequence number. Ordering by both lets readers skip
+    transactions that are still in flight instead of missing them for good.
+    """
+
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+        onupdate=func.pg_current_xact_id().cast(Text).cast(BigInteger)
+    )
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=change_seq.next_value(),
+        onupdate=change_seq.next_value()
+    )
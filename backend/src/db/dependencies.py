@@ -1,9 +1,22 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import get_db_session
+from core.config import Settings
+from db.session import get_db_session, get_list_db_session
+
+
+def get_app_settings(request: Request) -> Settings:
+    """Dependency to get the settings the application was built with."""
+    return request.app.state.settings
+
 
 # Database session dependency
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
+
+# Session for list and feed endpoints, which get a tighter query deadline
+ListDBSession = Annotated[AsyncSession, Depends(get_list_db_session)]
+
+# Settings passed to `create_app`
+AppSettings = Annotated[Settings, Depends(get_app_settings)]
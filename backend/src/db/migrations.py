@@ -0,0 +1,176 @@
+"""Helpers for migrations that must not block writes to large tables.
+
+Revisions import them with `from db.migrations import ...`. `alembic/env.py`
+runs every revision in its own transaction and caps lock waits at
+`db_migration_lock_timeout`, so a revision that cannot get its locks fails
+fast instead of stalling the queries queued behind it.
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from core.config import get_settings
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# SET clause that records a migration's write for the `/changes` feed, for
+# backfills of change-tracked tables that mirrors should pick up
+CHANGE_TRACKING_VALUES = (
+    "change_xid = pg_current_xact_id()::text::bigint, "
+    "change_seq = nextval('change_seq')"
+)
+
+# Seconds between progress lines of a backfill
+PROGRESS_INTERVAL = 10.0
+
+
+def lock_timeout_statement(seconds: float) -> str:
+    """Statement setting how long the session waits for a lock, 0 for no limit."""
+    return f"SET lock_timeout = '{int(seconds * 1000)}ms'"
+
+
+def set_lock_timeout(seconds: float) -> None:
+    """Override the lock timeout for the rest of the revision's transaction.
+
+    Use it before DDL on a busy table that needs a tighter bound, or a looser
+    one, than `db_migration_lock_timeout`.
+    """
+    op.execute(f"SET LOCAL lock_timeout = '{int(seconds * 1000)}ms'")
+
+
+def _index_is_invalid(index_name: str) -> bool:
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                "SELECT NOT indisvalid FROM pg_index "
+                "WHERE indexrelid = to_regclass(:index_name)"
+            ),
+            {"index_name": index_name},
+        )
+    )
+
+
+def create_index_concurrently(
+    index_name: str, table_name: str, columns: Sequence[str], **kwargs: Any
+) -> None:
+    """Build an index with CREATE INDEX CONCURRENTLY, leaving writes unblocked.
+
+    The statement cannot run in a transaction, so the revision's transaction
+    is committed first and the build runs on its own. It waits for
+    transactions already touching the table without blocking new ones, so the
+    lock timeout is lifted meanwhile. A build that failed earlier leaves an
+    invalid index behind, which is dropped and built again. Other keyword
+    arguments go to `op.create_index`, e.g. `unique` or `postgresql_where`.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(lock_timeout_statement(0))
+        if not context.is_offline_mode() and _index_is_invalid(index_name):
+            logger.info(f"Rebuilding invalid index {index_name}")
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kwargs,
+        )
+        op.execute(
+            lock_timeout_statement(get_settings().db_migration_lock_timeout)
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index with DROP INDEX CONCURRENTLY, outside a transaction."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def set_not_null(table_name: str, column_name: str) -> None:
+    """Make a column NOT NULL without scanning the table under an exclusive lock.
+
+    `SET NOT NULL` on its own scans every row while holding ACCESS EXCLUSIVE.
+    A `NOT VALID` check constraint is added instead and validated, which only
+    blocks other DDL, and `SET NOT NULL` then relies on it without a scan.
+    Each step commits on its own; the check is dropped once it has served.
+    Backfill the column first.
+    """
+    constraint = f"ck_{table_name}_{column_name}_not_null"
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {constraint}")
+        op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint} "
+            f"CHECK ({column_name} IS NOT NULL) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {constraint}")
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} SET NOT NULL")
+        op.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT {constraint}")
+
+
+def backfill(
+    table_name: str,
+    values: str,
+    where: str | None = None,
+    batch_size: int = 5000,
+    pause: float = 0.1,
+    key: str = "id",
+) -> None:
+    """Update a large table in key ranges of `batch_size`, one commit per range.
+
+    `values` is the SET clause and `where` an optional filter, both in SQL.
+    Each range commits on its own, so row locks are held briefly and vacuum
+    can reclaim old row versions while the backfill runs. The loop sleeps
+    `pause` seconds between ranges to leave I/O for live traffic and logs its
+    progress. Write `where` so that rows already done are skipped, e.g.
+    `new_column IS NULL`, and an interrupted backfill can simply be rerun.
+    In offline mode a single UPDATE is emitted instead.
+    """
+    condition = f" AND ({where})" if where else ""
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {table_name} SET {values} WHERE TRUE{condition}")
+        return
+
+    statement = sa.text(
+        f"UPDATE {table_name} SET {values} "
+        f"WHERE {key} >= :low AND {key} < :high{condition}"
+    )
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        first, last = bind.execute(
+            sa.text(f"SELECT min({key}), max({key}) FROM {table_name}")
+        ).one()
+        if first is None:
+            return
+
+        updated = 0
+        logged_at = time.monotonic()
+        for low in range(first, last + 1, batch_size):
+            high = low + batch_size
+            updated += bind.execute(statement, {"low": low, "high": high}).rowcount
+
+            if high > last:
+                break
+            if time.monotonic() - logged_at >= PROGRESS_INTERVAL:
+                logged_at = time.monotonic()
+                logger.info(
+                    f"Backfilling {table_name}: {updated} rows updated, "
+                    f"{(high - first) / (last + 1 - first):.0%} of {key} range done"
+                )
+            time.sleep(pause)
+
+        logger.info(f"Backfilled {table_name}: {updated} rows updated")
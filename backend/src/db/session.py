@@ -1,30 +1,123 @@
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import uuid4
 
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
-from core.config import settings
+from core.cache import ENTITY_CACHE_KEY, EntityCache
+from core.config import Settings
+from core.enums import DatabasePoolMode
 
-engine: AsyncEngine = create_async_engine(
-    url=str(settings.database_url),
-    echo=settings.database_echo,
-    pool_pre_ping=True,
-)
 
-AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Pool and driver options for the configured pooling mode."""
+    connect_args: dict[str, Any] = {
+        # Unique names keep prepared statements from colliding when a
+        # transaction-pooling proxy hands the server connection to another client
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
 
+    if settings.db_pool_mode == DatabasePoolMode.TRANSACTION:
+        # The proxy owns pooling; a statement prepared on one server connection
+        # is not there on the next transaction, so nothing is cached either
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["statement_cache_size"] = 0
+        return {"poolclass": NullPool, "connect_args": connect_args}
 
-async def get_db_session() -> AsyncIterator[AsyncSession]:
-    """Dependency to get database session."""
-    async with AsyncSessionLocal() as session:
+    connect_args["prepared_statement_cache_size"] = (
+        settings.db_prepared_statement_cache_size
+    )
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "connect_args": connect_args,
+    }
+
+
+def create_engine(settings: Settings) -> AsyncEngine:
+    """Create the application's database engine."""
+    return create_async_engine(
+        url=str(settings.database_url),
+        echo=settings.database_echo,
+        **_engine_options(settings),
+    )
+
+
+def create_rate_limit_engine(settings: Settings) -> AsyncEngine:
+    """Create the small engine of the Postgres rate limiter.
+
+    It keeps its own few connections, pooled even behind a transaction-pooling
+    proxy, so a rate limit check never takes a connection from, or waits on,
+    the pool meant for admitted requests.
+    """
+    options = _engine_options(settings)
+    options.pop("poolclass", None)
+    options.update(
+        pool_size=settings.rate_limit_pool_size,
+        max_overflow=0,
+        pool_timeout=settings.db_queue_timeout,
+        pool_pre_ping=True,
+    )
+    return create_async_engine(
+        url=str(settings.database_url), echo=settings.database_echo, **options
+    )
+
+
+def create_session_factory(
+    engine: AsyncEngine, entity_cache: EntityCache | None = None
+) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory bound to an engine.
+
+    Sessions share `entity_cache` through their `info`, so services can reach
+    the worker's cache without it being threaded through every call.
+    """
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        info={ENTITY_CACHE_KEY: entity_cache} if entity_cache is not None else {},
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _set_statement_timeout(session: Session, transaction, connection) -> None:
+    """Apply the session's query deadline to each transaction it begins.
+
+    SET LOCAL ends with the transaction, so the setting never leaks to other
+    users of a pooled connection.
+    """
+    if timeout := session.info.get("statement_timeout"):
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(timeout * 1000)}"
+        )
+
+
+@asynccontextmanager
+async def open_db_session(
+    session_factory: async_sessionmaker[AsyncSession], statement_timeout: float
+) -> AsyncIterator[AsyncSession]:
+    """Open a session whose queries are cancelled after `statement_timeout`.
+
+    Opening the session is free: a connection is only checked out when the
+    first statement begins a transaction, and it is returned when that
+    transaction commits or rolls back. Services that await slow non-database
+    work should do it before their first statement, or end the transaction
+    first, so the connection is not held idle meanwhile.
+    """
+    async with session_factory(
+        info={"statement_timeout": statement_timeout}
+    ) as session:
         try:
             yield session
         except Exception:
@@ -32,3 +125,21 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Dependency to get database session."""
+    async with open_db_session(
+        session_factory=request.app.state.session_factory,
+        statement_timeout=request.app.state.settings.db_statement_timeout,
+    ) as session:
+        yield session
+
+
+async def get_list_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Dependency to get a session with the tighter list endpoint deadline."""
+    async with open_db_session(
+        session_factory=request.app.state.session_factory,
+        statement_timeout=request.app.state.settings.db_list_statement_timeout,
+    ) as session:
+        yield session
@@ -1,44 +1,203 @@
+import asyncio
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import AsyncIterator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, RedirectResponse
+from loguru import logger
+from sqlalchemy.exc import DBAPIError
 
-from core.config import settings
-from db.session import engine
-from routers import cat_router, mission_router, target_router
+from core.cache import EntityCache
+from core.config import Settings, get_settings
+from core.logging import configure_logging
+from core.tracing import configure_tracing, instrument_engine, shutdown_tracing
+from db.session import create_engine, create_session_factory
+from middleware import (
+    AdmissionControlMiddleware,
+    DisconnectCancellationMiddleware,
+    RequestIdMiddleware,
+    create_rate_limit_backend,
+)
+from routers import (
+    admin_router,
+    cat_router,
+    changes_router,
+    mission_router,
+    stats_router,
+    target_router,
+)
+from services.archive import archive_missions_service
+from services.cat import create_cat_loader
+from services.events import MissionEventBroker, purge_mission_events_service
+from services.idempotency import purge_idempotency_keys_service
+from services.jobs import JobRunner
+from services.mission import create_mission_loader
+from services.scheduler import start_periodic_job, stop_background_tasks
+from services.stats import refresh_stats_service
+
+# SQLSTATE raised when a statement hits `statement_timeout`
+QUERY_CANCELED = "57014"
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Lifespan context manager for FastAPI application."""
-    yield
+    """Lifespan context manager for FastAPI application.
 
-    await engine.dispose()
+    The engine is created here rather than at import time, so importing the
+    application or building it in tests does not touch the database driver.
+    """
+    settings: Settings = app.state.settings
+    engine = create_engine(settings)
+    instrument_engine(engine)
+    entity_cache = EntityCache(
+        max_size=settings.entity_cache_size, ttl=settings.entity_cache_ttl
+    )
+    session_factory = create_session_factory(engine, entity_cache=entity_cache)
 
+    app.state.engine = engine
+    app.state.entity_cache = entity_cache
+    app.state.cat_loader = create_cat_loader(
+        session_factory=session_factory,
+        statement_timeout=settings.db_statement_timeout,
+    )
+    app.state.mission_loader = create_mission_loader(
+        session_factory=session_factory,
+        statement_timeout=settings.db_statement_timeout,
+    )
+    app.state.session_factory = session_factory
+    rate_limit_backend = create_rate_limit_backend(settings)
+    app.state.rate_limit_backend = rate_limit_backend
+    app.state.mission_events = MissionEventBroker(
+        dsn=settings.listen_database_url,
+        session_factory=session_factory,
+        queue_size=settings.event_queue_size,
+    )
 
-app: FastAPI = FastAPI(
-    title="Spy Cat Agency Management API",
-    description="CRUD API for managing spy cats, missions, and targets",
-    debug=settings.debug,
-    lifespan=lifespan,
-)
+    background_tasks = [
+        asyncio.create_task(app.state.mission_events.run(), name="mission-events"),
+        asyncio.create_task(
+            JobRunner(session_factory=session_factory, settings=settings).run(),
+            name="job-runner",
+        ),
+        start_periodic_job(
+            name="refresh-stats",
+            interval=settings.stats_refresh_interval,
+            job=refresh_stats_service,
+            session_factory=session_factory,
+        ),
+        start_periodic_job(
+            name="purge-mission-events",
+            interval=3600,
+            job=partial(purge_mission_events_service, settings=settings),
+            session_factory=session_factory,
+        ),
+        start_periodic_job(
+            name="purge-idempotency-keys",
+            interval=3600,
+            job=purge_idempotency_keys_service,
+            session_factory=session_factory,
+        ),
+        start_periodic_job(
+            name="archive-missions",
+            interval=settings.archive_interval,
+            job=partial(archive_missions_service, settings=settings),
+            session_factory=session_factory,
+        ),
+    ]
+    if rate_limit_backend is not None:
+        background_tasks.append(
+            asyncio.create_task(rate_limit_backend.run(), name="rate-limit-buckets")
+        )
 
-app.add_middleware(
-    middleware_class=CORSMiddleware,  # type: ignore
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    yield
+
+    await stop_background_tasks(background_tasks)
+    if rate_limit_backend is not None:
+        await rate_limit_backend.close()
+    await engine.dispose()
+    shutdown_tracing()
+    # Flush records still queued for the logging thread
+    await logger.complete()
 
-app.include_router(router=cat_router, prefix=settings.api_prefix)
-app.include_router(router=mission_router, prefix=settings.api_prefix)
-app.include_router(router=target_router, prefix=settings.api_prefix)
+
+async def query_timeout_handler(
+    request: Request, exc: DBAPIError
+) -> JSONResponse:
+    """Answer queries cancelled by their deadline with 503 instead of 500."""
+    if getattr(exc.orig, "sqlstate", None) != QUERY_CANCELED:
+        raise exc
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Query took too long, retry later"},
+        headers={"Retry-After": "1"},
+    )
 
 
-@app.get("/", include_in_schema=False)
 def root() -> RedirectResponse:
     """Redirect root to API documentation."""
     return RedirectResponse(url="/docs")
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    """Build the FastAPI application; run with `uvicorn main:create_app --factory`."""
+    settings = settings or get_settings()
+    configure_logging(settings)
+    configure_tracing(settings)
+
+    app = FastAPI(
+        title="Spy Cat Agency Management API",
+        description="CRUD API for managing spy cats, missions, and targets",
+        debug=settings.debug,
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+
+    app.add_middleware(
+        middleware_class=AdmissionControlMiddleware,  # type: ignore
+        path_prefix=settings.api_prefix,
+        concurrency_limit=settings.db_concurrency_limit,
+        queue_timeout=settings.db_queue_timeout,
+        exempt_paths=frozenset({f"{settings.api_prefix}/missions/events"}),
+        api_keys=frozenset(settings.rate_limit_api_keys),
+    )
+    app.add_middleware(
+        middleware_class=DisconnectCancellationMiddleware,  # type: ignore
+    )
+    app.add_middleware(
+        middleware_class=GZipMiddleware,  # type: ignore
+        minimum_size=settings.gzip_minimum_size,
+    )
+    app.add_middleware(
+        middleware_class=CORSMiddleware,  # type: ignore
+        allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Request-ID"],
+    )
+    if settings.tracing_enabled:
+        # Imported here as it needs the optional OpenTelemetry packages
+        from middleware.tracing import TracingMiddleware
+
+        app.add_middleware(
+            middleware_class=TracingMiddleware,  # type: ignore
+        )
+    app.add_middleware(
+        middleware_class=RequestIdMiddleware,  # type: ignore
+    )
+
+    app.add_exception_handler(DBAPIError, query_timeout_handler)  # type: ignore
+
+    app.include_router(router=admin_router, prefix=settings.api_prefix)
+    app.include_router(router=cat_router, prefix=settings.api_prefix)
+    app.include_router(router=changes_router, prefix=settings.api_prefix)
+    app.include_router(router=mission_router, prefix=settings.api_prefix)
+    app.include_router(router=stats_router, prefix=settings.api_prefix)
+    app.include_router(router=target_router, prefix=settings.api_prefix)
+
+    app.add_api_route("/", root, include_in_schema=False)
+
+    return app
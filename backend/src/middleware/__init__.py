@@ -0,0 +1,13 @@
+from middleware.admission import (
+    AdmissionControlMiddleware,
+    create_rate_limit_backend,
+)
+from middleware.disconnect import DisconnectCancellationMiddleware
+from middleware.request_id import RequestIdMiddleware
+
+__all__ = [
+    "AdmissionControlMiddleware",
+    "DisconnectCancellationMiddleware",
+    "RequestIdMiddleware",
+    "create_rate_limit_backend",
+]
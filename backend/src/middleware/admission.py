@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Protocol
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import Settings
+from core.enums import RateLimitBackend
+from db.session import create_rate_limit_engine
+from repositories.rate_limit import consume_token, delete_idle_buckets
+
+# Seconds between purges of idle buckets from Postgres
+BUCKET_PURGE_INTERVAL = 60
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+class TokenBucketBackend(Protocol):
+    """Storage for per-client token buckets."""
+
+    async def consume(self, key: str) -> float | None:
+        """Take a token; return None if allowed, else seconds until one is free."""
+
+    async def run(self) -> None:
+        """Do the backend's housekeeping until cancelled."""
+
+    async def close(self) -> None:
+        """Release the resources of the backend."""
+
+
+class InMemoryTokenBucket:
+    """Token buckets local to this worker, bounded by LRU eviction."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 10_000) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str) -> float | None:
+        now = time.monotonic()
+        tokens, updated_at = self.buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+
+        self.buckets[key] = (tokens, now)
+        if len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+
+        return None if allowed else (1 - tokens) / self.rate
+
+    async def run(self) -> None:
+        """Nothing to do: the LRU bound is enforced on every check."""
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class PostgresTokenBucket:
+    """Token buckets shared by every worker through an UNLOGGED table.
+
+    The engine is the limiter's own, not the application's, so checks are
+    made before admission without taking connections from admitted requests.
+    """
+
+    def __init__(self, engine: AsyncEngine, rate: float, burst: int) -> None:
+        self.engine = engine
+        self.rate = rate
+        self.burst = burst
+
+    async def consume(self, key: str) -> float | None:
+        try:
+            async with self.engine.begin() as connection:
+                allowed, tokens = await consume_token(
+                    connection=connection, key=key, rate=self.rate, burst=self.burst
+                )
+        except Exception as e:
+            # Fail open: an unavailable limiter must not take the API down
+            logger.error(f"Rate limit check failed for '{key}': {e}")
+            return None
+
+        return None if allowed else (1 - tokens) / self.rate
+
+    async def run(self) -> None:
+        """Delete idle buckets every `BUCKET_PURGE_INTERVAL` seconds.
+
+        A bucket untouched for `burst / rate` seconds has refilled, so dropping
+        it is the same as keeping it: its next check recreates it full.
+        """
+        idle = timedelta(seconds=self.burst / self.rate)
+        while True:
+            try:
+                async with self.engine.begin() as connection:
+                    await delete_idle_buckets(connection=connection, idle=idle)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Purging idle rate limit buckets failed: {e}")
+
+            await asyncio.sleep(BUCKET_PURGE_INTERVAL)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+
+class AdmissionControlMiddleware:
+    """Rate limits clients and caps concurrent DB-bound requests.
+
+    Clients are identified by `X-API-Key` when it is one of `api_keys`, and
+    otherwise by their IP address, so unknown keys cannot dodge the IP limit.
+    Requests over their quota get 429. Requests that cannot get one of the
+    worker's DB slots within `queue_timeout` get 503, so overload is shed
+    here instead of piling up on the connection pool. The token bucket backend
+    is read from `app.state.rate_limit_backend`, set up during lifespan.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefix: str,
+        concurrency_limit: int,
+        queue_timeout: float,
+        exempt_paths: frozenset[str] = frozenset(),
+        api_keys: frozenset[str] = frozenset(),
+    ) -> None:
+        self.app = app
+        self.path_prefix = path_prefix
+        self.queue_timeout = queue_timeout
+        self.exempt_paths = exempt_paths
+        self.slots = asyncio.Semaphore(concurrency_limit)
+        # Buckets are named by a digest so keys are neither stored nor logged
+        self.client_keys = {
+            key.encode("latin-1"): f"key:{_digest(key)}" for key in api_keys
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not path.startswith(self.path_prefix)
+            or path in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        backend = getattr(scope["app"].state, "rate_limit_backend", None)
+        if backend is not None:
+            retry_after = await backend.consume(self._client_key(scope))
+            if retry_after is not None:
+                response = self._reject(429, "Rate limit exceeded", retry_after)
+                await response(scope, receive, send)
+                return
+
+        try:
+            await asyncio.wait_for(self.slots.acquire(), timeout=self.queue_timeout)
+        except TimeoutError:
+            response = self._reject(503, "Server is overloaded, retry later", 1)
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.slots.release()
+
+    def _client_key(self, scope: Scope) -> str:
+        for name, value in scope.get("headers", []):
+            if name == b"x-api-key" and value in self.client_keys:
+                return self.client_keys[value]
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    @staticmethod
+    def _reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+def create_rate_limit_backend(settings: Settings) -> TokenBucketBackend | None:
+    """Build the configured token bucket backend."""
+    if not settings.rate_limit_enabled:
+        return None
+    if settings.rate_limit_backend == RateLimitBackend.POSTGRES:
+        return PostgresTokenBucket(
+            engine=create_rate_limit_engine(settings),
+            rate=settings.rate_limit_rate,
+            burst=settings.rate_limit_burst,
+        )
+    return InMemoryTokenBucket(
+        rate=settings.rate_limit_rate, burst=settings.rate_limit_burst
+    )
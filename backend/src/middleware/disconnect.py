@@ -0,0 +1,60 @@
+import asyncio
+import contextlib
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class DisconnectCancellationMiddleware:
+    """Cancels request handling once the client has disconnected.
+
+    Starlette keeps running a handler whose client went away, so its queries
+    hold a connection until they finish. Cancelling the handler task makes
+    asyncpg cancel the running statement on the server as well. Handlers that
+    already started responding are left alone; streaming responses watch for
+    disconnects themselves.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def watch_disconnect() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_wrapper))
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await asyncio.wait(
+                {handler, watcher}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not handler.done() and not response_started:
+                logger.info(
+                    f"Client disconnected, cancelling {scope['method']} "
+                    f"{scope['path']}"
+                )
+                handler.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await handler
+                return
+            await handler
+        finally:
+            watcher.cancel()
+            handler.cancel()
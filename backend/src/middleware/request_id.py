@@ -0,0 +1,50 @@
+import re
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.logging import request_id_var
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Incoming IDs are echoed into logs and headers, so only plain tokens are kept
+VALID_REQUEST_ID = re.compile(rb"[A-Za-z0-9._-]{1,128}")
+
+
+class RequestIdMiddleware:
+    """Tags each request with an ID for log correlation.
+
+    A well-formed `X-Request-ID` from the client or a proxy is reused,
+    otherwise a new one is generated. The ID is stored for loggers in
+    `request_id_var` and returned in the `X-Request-ID` response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._incoming_id(scope) or uuid4().hex.encode()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []), (REQUEST_ID_HEADER, request_id)
+                ]
+            await send(message)
+
+        token = request_id_var.set(request_id.decode())
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
+
+    @staticmethod
+    def _incoming_id(scope: Scope) -> bytes | None:
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER and VALID_REQUEST_ID.fullmatch(value):
+                return value
+        return None
@@ -0,0 +1,58 @@
+from opentelemetry import propagate
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.logging import request_id_var
+from core.tracing import get_tracer
+
+
+class TracingMiddleware:
+    """Opens the server span that a request's service, SQL and HTTP spans nest in.
+
+    A `traceparent` header from the caller continues its trace. The span is
+    named after the matched route template, so `/cats/7` and `/cats/8` are
+    grouped together. Only added by `create_app` when tracing is enabled, as
+    it imports OpenTelemetry.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.tracer = get_tracer()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        method = scope["method"]
+
+        with self.tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={
+                "http.request.method": method,
+                "url.path": scope["path"],
+                "http.request.id": request_id_var.get() or "",
+            },
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    span.set_attribute("http.response.status_code", status_code)
+                    if status_code >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # The router stores the matched route in the scope it was given
+                if (route := getattr(scope.get("route"), "path", None)) is not None:
+                    span.set_attribute("http.route", route)
+                    span.update_name(f"{method} {route}")
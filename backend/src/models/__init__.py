@@ -1,7 +1,26 @@
 """Database models for Spy Cat Agency."""
 
+from .archive import MissionArchive, TargetArchive
 from .cat import Cat
+from .document import MissionDocument
+from .event import MissionEvent
+from .idempotency import IdempotencyKey
+from .job import Job
 from .mission import Mission
+from .rate_limit import RateLimitBucket
 from .target import Target
+from .tombstone import ChangeTombstone
 
-__all__ = ["Cat", "Mission", "Target"]
+__all__ = [
+    "Cat",
+    "ChangeTombstone",
+    "IdempotencyKey",
+    "Job",
+    "Mission",
+    "MissionArchive",
+    "MissionDocument",
+    "MissionEvent",
+    "RateLimitBucket",
+    "Target",
+    "TargetArchive",
+]
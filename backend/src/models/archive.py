@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
+from sqlalchemy.sql import func
+
+from db.base import Base
+
+
+class MissionArchive(Base):
+    """Completed mission moved out of the hot `missions` table."""
+
+    __tablename__ = "missions_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    is_complete: Mapped[bool]
+    created_at: Mapped[datetime]
+    updated_at: Mapped[datetime]
+    completed_at: Mapped[datetime | None] = mapped_column(index=True)
+    version: Mapped[int]
+    archived_at: Mapped[datetime] = mapped_column(default=func.now())
+
+    cat_id: Mapped[int | None] = mapped_column(
+        ForeignKey(column="cats.id", ondelete="SET NULL"),
+        index=True
+    )
+
+    # Relationships
+    cat: Mapped[Optional["Cat"]] = relationship(argument="Cat", viewonly=True)
+    targets: Mapped[list["TargetArchive"]] = relationship(
+        argument="TargetArchive",
+        back_populates="mission",
+        viewonly=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<MissionArchive(id={self.id}, cat_id={self.cat_id})>"
+
+
+class TargetArchive(Base):
+    """Target of an archived mission."""
+
+    __tablename__ = "targets_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    name: Mapped[str]
+    country: Mapped[str]
+    notes: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )
+    notes_preview: Mapped[str | None] = query_expression()
+    is_complete: Mapped[bool]
+    created_at: Mapped[datetime]
+    updated_at: Mapped[datetime]
+    completed_at: Mapped[datetime | None]
+    version: Mapped[int]
+
+    mission_id: Mapped[int] = mapped_column(
+        ForeignKey(column="missions_archive.id", ondelete="CASCADE"),
+        index=True
+    )
+
+    # Relationships
+    mission: Mapped["MissionArchive"] = relationship(
+        argument="MissionArchive",
+        back_populates="targets",
+        viewonly=True
+    )
+
+    # Table constraints
+    __table_args__ = (
+        UniqueConstraint("mission_id", "name", name="uq_target_archive_mission_name"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TargetArchive(id={self.id}, name='{self.name}')>"
@@ -1,14 +1,14 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DECIMAL
+from sqlalchemy import DECIMAL, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from db.base import Base
+from db.base import Base, ChangeTrackingMixin
 
 
-class Cat(Base):
+class Cat(ChangeTrackingMixin, Base):
     """Spy Cat model."""
 
     __tablename__ = "cats"
@@ -17,19 +17,48 @@ class Cat(Base):
     name: Mapped[str] = mapped_column(index=True)
     years_of_experience: Mapped[int]
     breed: Mapped[str] = mapped_column(index=True)
+    # Set when a breed accepted while TheCatAPI was down is later not recognized
+    breed_rejected: Mapped[bool] = mapped_column(default=False, server_default="false")
     salary: Mapped[Decimal] = mapped_column(DECIMAL(precision=10, scale=2))
     created_at: Mapped[datetime] = mapped_column(default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         default=func.now(),
         onupdate=func.now()
     )
+    version: Mapped[int] = mapped_column(server_default="1")
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    # Denormalized pointer to the cat's incomplete mission, NULL when available
+    active_mission_id: Mapped[int | None] = mapped_column(
+        ForeignKey(
+            column="missions.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_cats_active_mission_id_missions",
+        ),
+        nullable=True
+    )
 
     # Relationships
     missions: Mapped[list["Mission"]] = relationship(
         argument="Mission",
         back_populates="cat",
-        cascade="all, delete-orphan"
+        foreign_keys="Mission.cat_id"
     )
 
+    # Table constraints
+    __table_args__ = (
+        Index("ix_cats_change_xid_change_seq", "change_xid", "change_seq"),
+        Index(
+            "ix_cats_available",
+            "breed",
+            "years_of_experience",
+            postgresql_where=text("active_mission_id IS NULL AND deleted_at IS NULL"),
+        ),
+    )
+
+    # Optimistic locking
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self) -> str:
         return f"<Cat(id={self.id}, name='{self.name}', breed='{self.breed}')>"
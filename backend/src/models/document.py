@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from db.base import Base
+
+
+class MissionDocument(Base):
+    """Pre-rendered `MissionResponse` of a live mission, served by reads.
+
+    Rewritten in the transaction of every write to the mission, its targets or
+    its cat, and removed with the mission when it is deleted or archived. Bulk
+    writes mark documents stale instead, and a background job rewrites them;
+    until then reads render the mission from its rows.
+    """
+
+    __tablename__ = "mission_documents"
+
+    mission_id: Mapped[int] = mapped_column(
+        ForeignKey(column="missions.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    document: Mapped[dict] = mapped_column(JSONB)
+    is_stale: Mapped[bool] = mapped_column(default=False, server_default="false")
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(),
+        onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<MissionDocument(mission_id={self.mission_id})>"
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Identity, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from db.base import Base
+
+
+class MissionEvent(Base):
+    """Mission change feed event model."""
+
+    __tablename__ = "mission_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_type: Mapped[str]
+    mission_id: Mapped[int] = mapped_column(index=True)
+    target_id: Mapped[int | None] = mapped_column(nullable=True)
+    cat_id: Mapped[int | None] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=func.now(), index=True)
+    # Transaction that recorded the event; see `ChangeTrackingMixin`
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("pg_current_xact_id()::text::bigint")
+    )
+
+    # Table constraints
+    __table_args__ = (
+        Index("ix_mission_events_change_xid_id", "change_xid", "id"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MissionEvent(id={self.id}, event_type='{self.event_type}', "
+            f"mission_id={self.mission_id})>"
+        )
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Identity, Index, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from core.enums import JobStatus
+from db.base import Base
+
+
+class Job(Base):
+    """Transactional outbox entry processed by the background job runner."""
+
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    task: Mapped[str]
+    payload: Mapped[dict] = mapped_column(JSONB, default=dict)
+    status: Mapped[str] = mapped_column(default=JobStatus.PENDING.value)
+    attempts: Mapped[int] = mapped_column(default=0)
+    max_attempts: Mapped[int]
+    available_at: Mapped[datetime] = mapped_column(default=func.now())
+    locked_until: Mapped[datetime | None] = mapped_column(nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(),
+        onupdate=func.now()
+    )
+
+    # Table constraints
+    __table_args__ = (
+        Index("ix_jobs_status_available_at", "status", "available_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Job(id={self.id}, task='{self.task}', status='{self.status}', "
+            f"attempts={self.attempts})>"
+        )
@@ -1,26 +1,28 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from db.base import Base
+from db.base import Base, ChangeTrackingMixin
 
 
-class Mission(Base):
+class Mission(ChangeTrackingMixin, Base):
     """Mission model."""
 
     __tablename__ = "missions"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     is_complete: Mapped[bool] = mapped_column(default=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(default=func.now(), index=True)
     updated_at: Mapped[datetime] = mapped_column(
         default=func.now(),
         onupdate=func.now()
     )
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(server_default="1")
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     cat_id: Mapped[int | None] = mapped_column(
         ForeignKey(column="cats.id", ondelete="SET NULL"),
@@ -30,7 +32,8 @@ class Mission(Base):
     # Relationships
     cat: Mapped[Optional["Cat"]] = relationship(
         argument="Cat",
-        back_populates="missions"
+        back_populates="missions",
+        foreign_keys=[cat_id]
     )
     targets: Mapped[list["Target"]] = relationship(
         argument="Target",
@@ -38,6 +41,14 @@ class Mission(Base):
         cascade="all, delete-orphan"
     )
 
+    # Table constraints
+    __table_args__ = (
+        Index("ix_missions_change_xid_change_seq", "change_xid", "change_seq"),
+    )
+
+    # Optimistic locking
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self) -> str:
         return (
             f"<Mission(id={self.id}, cat_id={self.cat_id}, "
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class RateLimitBucket(Base):
+    """Token bucket shared by all workers when rate limiting uses Postgres."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    tokens: Mapped[float]
+    allowed: Mapped[bool]
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    # Table constraints
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket(key='{self.key}', tokens={self.tokens})>"
@@ -1,13 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 from sqlalchemy.sql import func
 
-from db.base import Base
+from db.base import Base, ChangeTrackingMixin
 
 
-class Target(Base):
+class Target(ChangeTrackingMixin, Base):
     """Target model."""
 
     __tablename__ = "targets"
@@ -15,7 +15,13 @@ class Target(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(index=True)
     country: Mapped[str] = mapped_column(index=True)
-    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Loaded only when asked for with `undefer`; touching it otherwise raises
+    # instead of emitting a query per target
+    notes: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )
+    # The first characters of `notes`, filled in by `with_expression` in lists
+    notes_preview: Mapped[str | None] = query_expression()
     is_complete: Mapped[bool] = mapped_column(default=False, index=True)
     created_at: Mapped[datetime] = mapped_column(default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -23,6 +29,7 @@ class Target(Base):
         onupdate=func.now()
     )
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(server_default="1")
 
     mission_id: Mapped[int] = mapped_column(
         ForeignKey(column="missions.id", ondelete="CASCADE"),
@@ -38,8 +45,12 @@ class Target(Base):
     # Table constraints
     __table_args__ = (
         UniqueConstraint("mission_id", "name", name="uq_target_mission_name"),
+        Index("ix_targets_change_xid_change_seq", "change_xid", "change_seq"),
     )
 
+    # Optimistic locking
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self) -> str:
         return (
             f"<Target(id={self.id}, name='{self.name}', country='{self.country}', "
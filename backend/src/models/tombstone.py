@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from db.base import Base, ChangeTrackingMixin
+
+
+class ChangeTombstone(ChangeTrackingMixin, Base):
+    """Record of a row removed from a change-tracked table.
+
+    Archival and purges delete rows outright, so they leave one of these for
+    the `/changes` feed to report in place of the row's own tombstone.
+    """
+
+    __tablename__ = "change_tombstones"
+
+    entity: Mapped[str] = mapped_column(primary_key=True)
+    entity_id: Mapped[int] = mapped_column(primary_key=True)
+    removed_at: Mapped[datetime] = mapped_column(default=func.now())
+
+    # Table constraints
+    __table_args__ = (
+        Index(
+            "ix_change_tombstones_change_xid_change_seq", "change_xid", "change_seq"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChangeTombstone(entity='{self.entity}', entity_id={self.entity_id})>"
+        )
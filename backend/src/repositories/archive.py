@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+from sqlalchemy import ARRAY, Integer, any_, bindparam, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from core.enums import TargetNotes
+from core.tracing import traced
+from models import Mission, MissionArchive, Target, TargetArchive
+from repositories.changes import record_mission_removals
+from repositories.target import load_targets
+
+MISSION_COLUMNS = (
+    "id",
+    "cat_id",
+    "is_complete",
+    "created_at",
+    "updated_at",
+    "completed_at",
+    "version",
+)
+TARGET_COLUMNS = (
+    "id",
+    "mission_id",
+    "name",
+    "country",
+    "notes",
+    "is_complete",
+    "created_at",
+    "updated_at",
+    "completed_at",
+    "version",
+)
+
+
+@traced
+async def archive_completed_missions(
+    session: AsyncSession, age: timedelta, batch_size: int
+) -> int:
+    """Move one batch of missions completed before `age` ago to the archive.
+
+    Rows are locked with `SKIP LOCKED`, so a mission being edited concurrently
+    is simply picked up by a later batch. Moved missions and their targets are
+    reported as deleted on the change feed. Returns the number of missions moved.
+    """
+    result = await session.execute(
+        select(Mission.id)
+        .where(Mission.is_complete)
+        .where(Mission.deleted_at.is_(None))
+        .where(Mission.completed_at < func.now() - age)
+        .order_by(Mission.completed_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    mission_ids = list(result.scalars().all())
+    if not mission_ids:
+        return 0
+
+    await session.execute(
+        insert(MissionArchive).from_select(
+            MISSION_COLUMNS,
+            select(*(getattr(Mission, name) for name in MISSION_COLUMNS))
+            .where(Mission.id.in_(mission_ids)),
+        )
+    )
+    await session.execute(
+        insert(TargetArchive).from_select(
+            TARGET_COLUMNS,
+            select(*(getattr(Target, name) for name in TARGET_COLUMNS))
+            .where(Target.mission_id.in_(mission_ids)),
+        )
+    )
+    await record_mission_removals(session=session, mission_ids=mission_ids)
+    # Targets go with their missions through ON DELETE CASCADE
+    await session.execute(delete(Mission).where(Mission.id.in_(mission_ids)))
+    return len(mission_ids)
+
+
+@traced
+async def get_archived_mission_by_id(
+    session: AsyncSession, mission_id: int
+) -> MissionArchive | None:
+    """Get archived mission by ID with targets and cat."""
+    result = await session.execute(
+        select(MissionArchive)
+        .options(
+            load_targets(MissionArchive.targets),
+            selectinload(MissionArchive.cat)
+        )
+        .where(MissionArchive.id == mission_id)
+    )
+    return result.scalar_one_or_none()
+
+
+@traced
+async def get_archived_missions_by_ids(
+    session: AsyncSession,
+    mission_ids: list[int],
+    include_targets: bool = True,
+    include_cat: bool = True,
+    notes: TargetNotes = TargetNotes.FULL,
+) -> list[MissionArchive]:
+    """Get the archived missions among the given IDs in one query."""
+    options = []
+    if include_targets:
+        options.append(load_targets(MissionArchive.targets, notes=notes))
+    if include_cat:
+        options.append(selectinload(MissionArchive.cat))
+
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        select(MissionArchive)
+        .options(*options)
+        .where(MissionArchive.id == any_(ids))
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def get_all_archived_missions(
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    include_targets: bool = True,
+    include_cat: bool = True,
+    notes: TargetNotes = TargetNotes.FULL,
+) -> tuple[list[MissionArchive], int]:
+    """Get archived missions with pagination, most recently completed first."""
+    count_result = await session.execute(
+        select(func.count(MissionArchive.id))
+    )
+    total = count_result.scalar()
+
+    options = []
+    if include_targets:
+        options.append(load_targets(MissionArchive.targets, notes=notes))
+    if include_cat:
+        options.append(selectinload(MissionArchive.cat))
+
+    result = await session.execute(
+        select(MissionArchive)
+        .options(*options)
+        .offset(skip)
+        .limit(limit)
+        .order_by(MissionArchive.completed_at.desc())
+    )
+    missions = result.scalars().all()
+
+    return list(missions), total
@@ -1,10 +1,25 @@
-from sqlalchemy import select, func
+from decimal import Decimal
+
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    any_,
+    bindparam,
+    func,
+    lambda_stmt,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.enums import AssignmentPreference
+from core.tracing import traced
 from models import Cat, Mission
+from repositories.changes import record_target_removals
 from schemas.cat import CatCreate, CatUpdate
 
 
+@traced
 async def create_cat(session: AsyncSession, cat_data: CatCreate) -> Cat:
     """Create a new cat."""
     cat = Cat(
@@ -19,34 +34,56 @@ async def create_cat(session: AsyncSession, cat_data: CatCreate) -> Cat:
     return cat
 
 
+@traced
 async def get_cat_by_id(session: AsyncSession, cat_id: int) -> Cat | None:
     """Get cat by ID."""
     result = await session.execute(
-        select(Cat).where(Cat.id == cat_id)
+        lambda_stmt(
+            lambda: select(Cat).where(Cat.id == cat_id).where(Cat.deleted_at.is_(None))
+        )
     )
     return result.scalar_one_or_none()
 
 
+@traced
+async def get_cats_by_ids(session: AsyncSession, cat_ids: list[int]) -> list[Cat]:
+    """Get the existing cats among the given IDs in one query."""
+    ids = bindparam("cat_ids", cat_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        select(Cat)
+        .where(Cat.id == any_(ids))
+        .where(Cat.deleted_at.is_(None))
+    )
+    return list(result.scalars().all())
+
+
+@traced
 async def get_all_cats(
     session: AsyncSession, skip: int = 0, limit: int = 100
 ) -> tuple[list[Cat], int]:
     """Get all cats with pagination."""
     count_result = await session.execute(
-        select(func.count(Cat.id))
+        lambda_stmt(
+            lambda: select(func.count(Cat.id)).where(Cat.deleted_at.is_(None))
+        )
     )
     total = count_result.scalar()
 
     result = await session.execute(
-        select(Cat)
-        .offset(skip)
-        .limit(limit)
-        .order_by(Cat.created_at.desc())
+        lambda_stmt(
+            lambda: select(Cat)
+            .where(Cat.deleted_at.is_(None))
+            .offset(skip)
+            .limit(limit)
+            .order_by(Cat.created_at.desc())
+        )
     )
     cats = result.scalars().all()
 
     return list(cats), total
 
 
+@traced
 async def update_cat(session: AsyncSession, cat: Cat, cat_data: CatUpdate) -> Cat:
     """Update cat information."""
     if cat_data.salary is not None:
@@ -57,25 +94,204 @@ async def update_cat(session: AsyncSession, cat: Cat, cat_data: CatUpdate) -> Ca
     return cat
 
 
+@traced
+async def reject_cat_breed(session: AsyncSession, cat: Cat) -> Cat:
+    """Flag the cat's breed as not recognized by TheCatAPI."""
+    cat.breed_rejected = True
+    await session.flush()
+    await session.refresh(cat)
+    return cat
+
+
+@traced
 async def delete_cat(session: AsyncSession, cat: Cat) -> None:
-    """Delete a cat."""
-    await session.delete(cat)
+    """Soft-delete a cat together with its missions, leaving tombstones.
+
+    The missions' targets have no `deleted_at`, so they get tombstones of
+    their own in the same transaction.
+    """
+    result = await session.execute(
+        update(Mission)
+        .where(Mission.cat_id == cat.id)
+        .where(Mission.deleted_at.is_(None))
+        .values(deleted_at=func.now(), version=Mission.version + 1)
+        .returning(Mission.id)
+        .execution_options(synchronize_session=False)
+    )
+    if mission_ids := list(result.scalars().all()):
+        await record_target_removals(session=session, mission_ids=mission_ids)
+    cat.deleted_at = func.now()
     await session.flush()
 
 
+@traced
 async def get_cats_by_breed(session: AsyncSession, breed: str) -> list[Cat]:
     """Get cats by breed."""
     result = await session.execute(
-        select(Cat).where(Cat.breed == breed)
+        lambda_stmt(
+            lambda: select(Cat)
+            .where(Cat.breed == breed)
+            .where(Cat.deleted_at.is_(None))
+        )
     )
     return list(result.scalars().all())
 
 
+@traced
+async def get_available_cat_ids(
+    session: AsyncSession,
+    limit: int,
+    prefer: AssignmentPreference = AssignmentPreference.EXPERIENCE,
+    min_experience: int | None = None,
+    max_salary: Decimal | None = None,
+    breeds: list[str] | None = None,
+) -> list[int]:
+    """Lock the best ranked cats without an active mission.
+
+    Cats are ranked by the preferred attribute, most experienced or cheapest
+    first. Rows locked by a concurrent planner are skipped rather than waited on.
+    """
+    statement = (
+        select(Cat.id)
+        .where(Cat.active_mission_id.is_(None))
+        .where(Cat.deleted_at.is_(None))
+    )
+    if min_experience is not None:
+        statement = statement.where(Cat.years_of_experience >= min_experience)
+    if max_salary is not None:
+        statement = statement.where(Cat.salary <= max_salary)
+    if breeds:
+        statement = statement.where(
+            func.lower(Cat.breed).in_([breed.lower() for breed in breeds])
+        )
+
+    if prefer == AssignmentPreference.SALARY:
+        statement = statement.order_by(Cat.salary, Cat.years_of_experience.desc())
+    else:
+        statement = statement.order_by(Cat.years_of_experience.desc(), Cat.salary)
+
+    result = await session.execute(
+        statement.order_by(Cat.id)
+        .limit(limit)
+        .with_for_update(of=Cat, skip_locked=True)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def get_available_cats(
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    breed: str | None = None,
+    min_experience: int | None = None,
+    max_experience: int | None = None,
+) -> tuple[list[Cat], int]:
+    """Get cats without an active mission, most experienced first.
+
+    Served by the partial `ix_cats_available` index.
+    """
+    statement = (
+        select(Cat)
+        .where(Cat.active_mission_id.is_(None))
+        .where(Cat.deleted_at.is_(None))
+    )
+    if breed is not None:
+        statement = statement.where(Cat.breed == breed)
+    if min_experience is not None:
+        statement = statement.where(Cat.years_of_experience >= min_experience)
+    if max_experience is not None:
+        statement = statement.where(Cat.years_of_experience <= max_experience)
+
+    count_result = await session.execute(
+        select(func.count()).select_from(statement.subquery())
+    )
+    total = count_result.scalar()
+
+    result = await session.execute(
+        statement.order_by(Cat.years_of_experience.desc(), Cat.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.scalars().all()), total
+
+
+@traced
 async def cat_has_active_mission(session: AsyncSession, cat_id: int) -> bool:
     """Check if cat has an active mission."""
     result = await session.execute(
-        select(func.count(Mission.id))
-        .where(Mission.cat_id == cat_id)
-        .where(Mission.is_complete == False)
+        lambda_stmt(
+            lambda: select(Cat.active_mission_id).where(Cat.id == cat_id)
+        )
+    )
+    return result.scalar_one_or_none() is not None
+
+
+@traced
+async def claim_cat_for_mission(
+    session: AsyncSession, cat_id: int, mission_id: int
+) -> bool:
+    """Point an available cat at its new active mission.
+
+    The update only matches while the cat has no active mission, so of two
+    concurrent assignments of the same cat exactly one succeeds.
+    """
+    result = await session.execute(
+        update(Cat)
+        .where(Cat.id == cat_id)
+        .where(Cat.active_mission_id.is_(None))
+        .where(Cat.deleted_at.is_(None))
+        .values(active_mission_id=mission_id, version=Cat.version + 1)
+    )
+    return result.rowcount == 1
+
+
+@traced
+async def release_cat_from_mission(
+    session: AsyncSession, cat_id: int, mission_id: int
+) -> None:
+    """Clear the cat's active mission pointer if it points at the mission."""
+    await session.execute(
+        update(Cat)
+        .where(Cat.id == cat_id)
+        .where(Cat.active_mission_id == mission_id)
+        .values(active_mission_id=None, version=Cat.version + 1)
+    )
+
+
+@traced
+async def release_cats_from_missions(
+    session: AsyncSession, mission_ids: list[int]
+) -> list[int]:
+    """Clear the active mission pointer of cats on any of the missions.
+
+    Returns the IDs of the cats released.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        update(Cat)
+        .where(Cat.active_mission_id == any_(ids))
+        .values(active_mission_id=None, version=Cat.version + 1)
+        .returning(Cat.id)
+        .execution_options(synchronize_session=False)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def claim_cats_for_missions(
+    session: AsyncSession, mission_ids: list[int], cat_ids: list[int]
+) -> None:
+    """Point cats at their new active missions pairwise in one statement."""
+    assignments = func.unnest(
+        bindparam("mission_ids", mission_ids, type_=ARRAY(Integer)),
+        bindparam("cat_ids", cat_ids, type_=ARRAY(Integer)),
+    ).table_valued("mission_id", "cat_id").render_derived()
+    await session.execute(
+        update(Cat)
+        .where(Cat.id == assignments.c.cat_id)
+        .values(
+            active_mission_id=assignments.c.mission_id, version=Cat.version + 1
+        )
+        .execution_options(synchronize_session=False)
     )
-    return result.scalar() > 0
@@ -0,0 +1,134 @@
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Integer,
+    Text,
+    any_,
+    bindparam,
+    func,
+    literal,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from core.enums import ChangeEntity
+from core.tracing import traced
+from models import Cat, ChangeTombstone, Mission, Target
+
+CHANGE_TRACKED_MODELS: dict[ChangeEntity, type[Cat | Mission | Target]] = {
+    ChangeEntity.CAT: Cat,
+    ChangeEntity.MISSION: Mission,
+    ChangeEntity.TARGET: Target,
+}
+
+
+@traced
+async def get_change_horizon(session: AsyncSession) -> int:
+    """Get the oldest transaction ID that may still be in flight.
+
+    Every transaction below it has committed or rolled back, so rows written
+    by them can be handed out without risk of a lower cursor appearing later.
+    """
+    result = await session.execute(
+        select(
+            func.pg_snapshot_xmin(func.pg_current_snapshot())
+            .cast(Text)
+            .cast(BigInteger)
+        )
+    )
+    return result.scalar_one()
+
+
+@traced
+async def get_changes_after(
+    session: AsyncSession,
+    entity: ChangeEntity,
+    change_xid: int,
+    change_seq: int,
+    horizon: int,
+    limit: int,
+) -> list[Cat | Mission | Target]:
+    """Get rows of an entity changed after a cursor, tombstones included."""
+    model = CHANGE_TRACKED_MODELS[entity]
+    result = await session.execute(
+        select(model)
+        # Deferred columns such as target notes are part of the change record
+        .options(undefer("*"))
+        .where(model.change_xid < horizon)
+        .where(
+            tuple_(model.change_xid, model.change_seq)
+            > tuple_(change_xid, change_seq)
+        )
+        .order_by(model.change_xid, model.change_seq)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def get_tombstones_after(
+    session: AsyncSession,
+    change_xid: int,
+    change_seq: int,
+    horizon: int,
+    limit: int,
+) -> list[ChangeTombstone]:
+    """Get tombstones of rows removed outright after a cursor."""
+    result = await session.execute(
+        select(ChangeTombstone)
+        .where(ChangeTombstone.change_xid < horizon)
+        .where(
+            tuple_(ChangeTombstone.change_xid, ChangeTombstone.change_seq)
+            > tuple_(change_xid, change_seq)
+        )
+        .order_by(ChangeTombstone.change_xid, ChangeTombstone.change_seq)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def record_mission_removals(
+    session: AsyncSession, mission_ids: list[int]
+) -> None:
+    """Leave tombstones for missions about to be deleted outright, and targets.
+
+    Call it in the transaction that deletes them, before the delete.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    removed = union_all(
+        select(literal(ChangeEntity.MISSION.value), Mission.id)
+        .where(Mission.id == any_(ids)),
+        select(literal(ChangeEntity.TARGET.value), Target.id)
+        .where(Target.mission_id == any_(ids)),
+    ).subquery()
+    await session.execute(
+        insert(ChangeTombstone)
+        .from_select(["entity", "entity_id"], select(removed))
+        .on_conflict_do_nothing()
+    )
+
+
+@traced
+async def record_target_removals(
+    session: AsyncSession, mission_ids: list[int]
+) -> None:
+    """Leave tombstones for the targets of missions being soft-deleted.
+
+    Targets have no `deleted_at` of their own, so without these the feed never
+    reports them gone. Call it in the transaction that deletes the missions.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    await session.execute(
+        insert(ChangeTombstone)
+        .from_select(
+            ["entity", "entity_id"],
+            select(literal(ChangeEntity.TARGET.value), Target.id)
+            .where(Target.mission_id == any_(ids)),
+        )
+        .on_conflict_do_nothing()
+    )
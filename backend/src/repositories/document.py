@@ -0,0 +1,239 @@
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from core.tracing import traced
+from models import Mission, MissionDocument
+from repositories.target import load_targets
+
+# Documents are read back as text, so responses are sent without decoding them
+DOCUMENT_TEXT = cast(MissionDocument.document, Text)
+
+
+@traced
+async def get_mission_documents(
+    session: AsyncSession, mission_ids: list[int]
+) -> dict[int, str]:
+    """Get the current JSON documents of the given missions, by mission ID.
+
+    Stale documents are left out, so their missions are rendered from rows.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        select(MissionDocument.mission_id, DOCUMENT_TEXT)
+        .where(MissionDocument.mission_id == any_(ids))
+        .where(MissionDocument.is_stale.is_(False))
+    )
+    return dict(result.tuples().all())
+
+
+@traced
+async def get_mission_document_page(
+    session: AsyncSession, skip: int = 0, limit: int = 100
+) -> tuple[list[tuple[int, str | None]], int]:
+    """Get a page of live mission IDs with their documents, in list order.
+
+    The page is read from `missions` and matches `get_all_missions`; a mission
+    without a current document comes with None instead.
+    """
+    count_result = await session.execute(
+        select(func.count(Mission.id)).where(Mission.deleted_at.is_(None))
+    )
+    total = count_result.scalar()
+
+    result = await session.execute(
+        select(Mission.id, DOCUMENT_TEXT)
+        .outerjoin(
+            MissionDocument,
+            and_(
+                MissionDocument.mission_id == Mission.id,
+                MissionDocument.is_stale.is_(False),
+            ),
+        )
+        .where(Mission.deleted_at.is_(None))
+        .offset(skip)
+        .limit(limit)
+        .order_by(Mission.created_at.desc())
+    )
+    return list(result.tuples().all()), total
+
+
+@traced
+async def get_stored_mission_documents(
+    session: AsyncSession, mission_ids: list[int]
+) -> dict[int, dict]:
+    """Get the stored documents of the given missions, decoded, by mission ID."""
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        select(MissionDocument.mission_id, MissionDocument.document)
+        .where(MissionDocument.mission_id == any_(ids))
+    )
+    return dict(result.tuples().all())
+
+
+@traced
+async def lock_mission_documents(session: AsyncSession, mission_ids: list[int]) -> None:
+    """Lock the existing documents of the given missions, in ID order.
+
+    A writer that renders documents after taking these locks waits for other
+    writers of the same documents to commit, so it renders their changes too.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    await session.execute(
+        select(MissionDocument.mission_id)
+        .where(MissionDocument.mission_id == any_(ids))
+        .order_by(MissionDocument.mission_id)
+        .with_for_update()
+    )
+
+
+@traced
+async def get_document_mission_ids(
+    session: AsyncSession,
+    mission_ids: list[int] | None = None,
+    cat_ids: list[int] | None = None,
+) -> list[int]:
+    """Get the missions whose documents embed any of the given missions or cats.
+
+    Deleted missions are included, as their documents have to be removed.
+    """
+    conditions = []
+    if mission_ids:
+        ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+        conditions.append(Mission.id == any_(ids))
+    if cat_ids:
+        ids = bindparam("cat_ids", cat_ids, type_=ARRAY(Integer))
+        conditions.append(Mission.cat_id == any_(ids))
+    if not conditions:
+        return []
+
+    result = await session.execute(
+        select(Mission.id).where(or_(*conditions)).order_by(Mission.id)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def get_mission_ids_after(
+    session: AsyncSession, after_id: int, limit: int
+) -> list[int]:
+    """Get the next IDs of missions, deleted or not, in ascending order."""
+    result = await session.execute(
+        select(Mission.id)
+        .where(Mission.id > after_id)
+        .order_by(Mission.id)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def get_missions_for_documents(
+    session: AsyncSession, mission_ids: list[int]
+) -> list[Mission]:
+    """Get the live missions among the IDs with everything their documents hold.
+
+    Rows already in the session are overwritten with the database state, so
+    values changed by bulk statements earlier in the transaction are seen.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        select(Mission)
+        .options(load_targets(Mission.targets), selectinload(Mission.cat))
+        .where(Mission.id == any_(ids))
+        .where(Mission.deleted_at.is_(None))
+        .execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def save_mission_documents(
+    session: AsyncSession, documents: dict[int, dict]
+) -> None:
+    """Insert or replace the documents of missions, keyed by mission ID.
+
+    The rows travel as two array parameters joined with `unnest`, so the
+    statement stays within asyncpg's 32767 arguments for any batch size.
+    """
+    if not documents:
+        return
+
+    rows = func.unnest(
+        bindparam("mission_ids", list(documents), type_=ARRAY(Integer)),
+        bindparam("documents", list(documents.values()), type_=ARRAY(JSONB)),
+    ).table_valued("mission_id", "document").render_derived()
+    statement = insert(MissionDocument).from_select(
+        ["mission_id", "document"], select(rows.c.mission_id, rows.c.document)
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[MissionDocument.mission_id],
+            set_={
+                "document": statement.excluded.document,
+                "is_stale": False,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+@traced
+async def mark_mission_documents_stale(
+    session: AsyncSession,
+    mission_ids: list[int] | None = None,
+    cat_ids: list[int] | None = None,
+) -> None:
+    """Mark the documents embedding any of the given missions or cats stale.
+
+    One statement covers any number of missions, so bulk writes can leave the
+    rendering to a background job.
+    """
+    conditions = []
+    if mission_ids:
+        ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+        conditions.append(Mission.id == any_(ids))
+    if cat_ids:
+        ids = bindparam("cat_ids", cat_ids, type_=ARRAY(Integer))
+        conditions.append(Mission.cat_id == any_(ids))
+    if not conditions:
+        return
+
+    await session.execute(
+        update(MissionDocument)
+        .where(MissionDocument.mission_id == Mission.id)
+        .where(or_(*conditions))
+        .values(is_stale=True)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@traced
+async def delete_mission_documents(
+    session: AsyncSession, mission_ids: list[int]
+) -> int:
+    """Delete the documents of the given missions, returning how many existed."""
+    if not mission_ids:
+        return 0
+
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        delete(MissionDocument)
+        .where(MissionDocument.mission_id == any_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
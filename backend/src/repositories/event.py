@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.enums import MissionEventType
+from core.tracing import traced
+from models import MissionEvent
+
+# Postgres NOTIFY channel that wakes change feed brokers up
+MISSION_EVENTS_CHANNEL = "mission_events"
+
+# Position of an event in the feed: its transaction ID, then its ID
+EventPosition = tuple[int, int]
+
+
+def mission_event_position(event: MissionEvent) -> EventPosition:
+    """Get the position of an event, in the order the feed releases events."""
+    return event.change_xid, event.id
+
+
+def serialize_mission_event(event: MissionEvent) -> dict:
+    """Convert a mission event into its wire representation."""
+    return {
+        "id": event.id,
+        "cursor": "{}.{}".format(*mission_event_position(event)),
+        "type": event.event_type,
+        "mission_id": event.mission_id,
+        "target_id": event.target_id,
+        "cat_id": event.cat_id,
+        "created_at": event.created_at.isoformat(),
+    }
+
+
+async def _notify_listeners(session: AsyncSession) -> None:
+    # Notifications are sent on commit, and repeated ones in a transaction are
+    # folded into one, so brokers are woken once per writing transaction
+    await session.execute(select(func.pg_notify(MISSION_EVENTS_CHANNEL, "")))
+
+
+@traced
+async def record_mission_event(
+    session: AsyncSession,
+    event_type: MissionEventType,
+    mission_id: int,
+    target_id: int | None = None,
+    cat_id: int | None = None,
+) -> MissionEvent:
+    """Persist a mission event and notify listeners once the transaction commits."""
+    event = MissionEvent(
+        event_type=event_type.value,
+        mission_id=mission_id,
+        target_id=target_id,
+        cat_id=cat_id,
+    )
+    session.add(event)
+    await session.flush()
+    await _notify_listeners(session)
+    return event
+
+
+@traced
+async def record_mission_events(
+    session: AsyncSession,
+    event_type: MissionEventType,
+    mission_ids: list[int],
+    cat_ids: list[int],
+) -> None:
+    """Persist one event per mission in a single statement and notify listeners."""
+    rows = func.unnest(
+        bindparam("mission_ids", mission_ids, type_=ARRAY(BigInteger)),
+        bindparam("cat_ids", cat_ids, type_=ARRAY(BigInteger)),
+    ).table_valued("mission_id", "cat_id").render_derived()
+    await session.execute(
+        insert(MissionEvent).from_select(
+            ["event_type", "mission_id", "cat_id"],
+            select(literal(event_type.value), rows.c.mission_id, rows.c.cat_id),
+        )
+    )
+    await _notify_listeners(session)
+
+
+@traced
+async def get_mission_events_after(
+    session: AsyncSession, position: EventPosition, limit: int = 100
+) -> list[MissionEvent]:
+    """Get committed mission events after a position, in position order.
+
+    Events of transactions at or above the change horizon may still be
+    followed by events of older transactions that have yet to commit, so
+    callers only hand out those below it.
+    """
+    result = await session.execute(
+        select(MissionEvent)
+        .where(tuple_(MissionEvent.change_xid, MissionEvent.id) > tuple_(*position))
+        .order_by(MissionEvent.change_xid, MissionEvent.id)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def delete_mission_events_before(session: AsyncSession, age: timedelta) -> int:
+    """Delete mission events older than the given age."""
+    result = await session.execute(
+        delete(MissionEvent).where(MissionEvent.created_at < func.now() - age)
+    )
+    return result.rowcount
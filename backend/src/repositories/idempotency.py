@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.tracing import traced
+from models import IdempotencyKey
+
+
+@traced
+async def get_idempotency_key(
+    session: AsyncSession, scope: str, key: str
+) -> IdempotencyKey | None:
+    """Get an unexpired idempotency key record."""
+    result = await session.execute(
+        select(IdempotencyKey)
+        .where(IdempotencyKey.scope == scope)
+        .where(IdempotencyKey.key == key)
+        .where(IdempotencyKey.expires_at > func.now())
+    )
+    return result.scalar_one_or_none()
+
+
+@traced
+async def claim_idempotency_key(
+    session: AsyncSession, scope: str, key: str, fingerprint: str, ttl: timedelta
+) -> IdempotencyKey | None:
+    """Claim a key for the current transaction.
+
+    Returns None when the key was claimed, otherwise the record stored by the
+    request that got there first. A concurrent duplicate blocks on the insert
+    until the first transaction commits or rolls back, so only one of them
+    ever executes the operation.
+    """
+    await session.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.scope == scope)
+        .where(IdempotencyKey.key == key)
+        .where(IdempotencyKey.expires_at <= func.now())
+    )
+
+    result = await session.execute(
+        insert(IdempotencyKey)
+        .values(
+            scope=scope,
+            key=key,
+            fingerprint=fingerprint,
+            expires_at=func.now() + ttl,
+        )
+        .on_conflict_do_nothing()
+        .returning(IdempotencyKey.key)
+    )
+    if result.scalar_one_or_none() is not None:
+        return None
+
+    return await get_idempotency_key(session=session, scope=scope, key=key)
+
+
+@traced
+async def save_idempotency_response(
+    session: AsyncSession, scope: str, key: str, status_code: int, response_body: dict
+) -> None:
+    """Store the response of a claimed key in the caller's transaction."""
+    await session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.scope == scope)
+        .where(IdempotencyKey.key == key)
+        .values(status_code=status_code, response_body=response_body)
+    )
+
+
+@traced
+async def delete_expired_idempotency_keys(session: AsyncSession) -> int:
+    """Delete idempotency keys past their TTL."""
+    result = await session.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.expires_at <= func.now())
+    )
+    return result.rowcount
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.enums import JobStatus, JobTask
+from core.tracing import traced
+from models import Job
+
+
+@traced
+async def enqueue_job(
+    session: AsyncSession, task: JobTask, payload: dict, max_attempts: int
+) -> Job:
+    """Add a job to the outbox as part of the caller's transaction."""
+    job = Job(task=task.value, payload=payload, max_attempts=max_attempts)
+    session.add(job)
+    await session.flush()
+    return job
+
+
+@traced
+async def claim_jobs(session: AsyncSession, limit: int, lease: timedelta) -> list[Job]:
+    """Lease due jobs, skipping rows already locked by other workers.
+
+    Jobs whose lease expired (the worker died mid-run) become claimable again.
+    """
+    due_jobs = (
+        select(Job.id)
+        .where(
+            or_(
+                and_(
+                    Job.status == JobStatus.PENDING.value,
+                    Job.available_at <= func.now(),
+                ),
+                and_(
+                    Job.status == JobStatus.RUNNING.value,
+                    Job.locked_until < func.now(),
+                ),
+            )
+        )
+        .order_by(Job.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(
+        update(Job)
+        .where(Job.id.in_(due_jobs.scalar_subquery()))
+        .values(
+            status=JobStatus.RUNNING.value,
+            locked_until=func.now() + lease,
+            attempts=Job.attempts + 1,
+        )
+        .returning(Job)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def complete_job(session: AsyncSession, job_id: int) -> None:
+    """Remove a successfully processed job from the outbox."""
+    await session.execute(delete(Job).where(Job.id == job_id))
+
+
+@traced
+async def fail_job(
+    session: AsyncSession, job_id: int, error: str, retry_in: timedelta | None
+) -> None:
+    """Record a failed attempt, scheduling a retry or giving up."""
+    values = {"last_error": error, "locked_until": None}
+    if retry_in is None:
+        values["status"] = JobStatus.FAILED.value
+    else:
+        values["status"] = JobStatus.PENDING.value
+        values["available_at"] = func.now() + retry_in
+
+    await session.execute(update(Job).where(Job.id == job_id).values(**values))
@@ -1,13 +1,30 @@
-from datetime import UTC, datetime
+from datetime import timedelta
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    ColumnElement,
+    Integer,
+    any_,
+    bindparam,
+    delete,
+    func,
+    lambda_stmt,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.enums import TargetNotes
+from core.tracing import traced
 from models import Mission, Target
-from schemas.mission import MissionCreate
+from repositories.changes import record_target_removals
+from repositories.target import load_targets
+from schemas.mission import MissionCreate, MissionPurgeRequest
 
 
+@traced
 async def create_mission(session: AsyncSession, mission_data: MissionCreate) -> Mission:
     """Create a new mission with targets."""
     mission = Mission()
@@ -30,43 +47,87 @@ async def create_mission(session: AsyncSession, mission_data: MissionCreate) ->
     return mission
 
 
+@traced
 async def get_mission_by_id(session: AsyncSession, mission_id: int) -> Mission | None:
     """Get mission by ID with targets and cat."""
     result = await session.execute(
-        select(Mission)
-        .options(
-            selectinload(Mission.targets),
-            selectinload(Mission.cat)
+        lambda_stmt(
+            lambda: select(Mission)
+            .options(
+                load_targets(Mission.targets),
+                selectinload(Mission.cat)
+            )
+            .where(Mission.id == mission_id)
+            .where(Mission.deleted_at.is_(None))
         )
-        .where(Mission.id == mission_id)
     )
     return result.scalar_one_or_none()
 
 
+@traced
+async def get_missions_by_ids(
+    session: AsyncSession,
+    mission_ids: list[int],
+    include_targets: bool = True,
+    include_cat: bool = True,
+    notes: TargetNotes = TargetNotes.FULL,
+) -> list[Mission]:
+    """Get the existing missions among the given IDs in one query."""
+    options = []
+    if include_targets:
+        options.append(load_targets(Mission.targets, notes=notes))
+    if include_cat:
+        options.append(selectinload(Mission.cat))
+
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        select(Mission)
+        .options(*options)
+        .where(Mission.id == any_(ids))
+        .where(Mission.deleted_at.is_(None))
+    )
+    return list(result.scalars().all())
+
+
+@traced
 async def get_all_missions(
-    session: AsyncSession, skip: int = 0, limit: int = 100
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    include_targets: bool = True,
+    include_cat: bool = True,
+    notes: TargetNotes = TargetNotes.FULL,
 ) -> tuple[list[Mission], int]:
-    """Get all missions with pagination."""
+    """Get all missions with pagination, eager loading only requested relations."""
     count_result = await session.execute(
-        select(func.count(Mission.id))
+        lambda_stmt(
+            lambda: select(func.count(Mission.id)).where(Mission.deleted_at.is_(None))
+        )
     )
     total = count_result.scalar()
 
-    result = await session.execute(
-        select(Mission)
-        .options(
-            selectinload(Mission.targets),
-            selectinload(Mission.cat)
-        )
+    # Each optional lambda is part of the cache key, so every combination of
+    # relations is still built only once
+    statement = lambda_stmt(
+        lambda: select(Mission)
+        .where(Mission.deleted_at.is_(None))
         .offset(skip)
         .limit(limit)
         .order_by(Mission.created_at.desc())
     )
+    if include_targets:
+        targets_loader = load_targets(Mission.targets, notes=notes)
+        statement += lambda s: s.options(targets_loader)
+    if include_cat:
+        statement += lambda s: s.options(selectinload(Mission.cat))
+
+    result = await session.execute(statement)
     missions = result.scalars().all()
 
     return list(missions), total
 
 
+@traced
 async def assign_cat_to_mission(
     session: AsyncSession, mission: Mission, cat_id: int
 ) -> Mission:
@@ -77,35 +138,155 @@ async def assign_cat_to_mission(
     return mission
 
 
+@traced
+async def unassign_cat_from_mission(
+    session: AsyncSession, mission: Mission
+) -> Mission:
+    """Remove the mission's cat, leaving it open for assignment."""
+    mission.cat_id = None
+    await session.flush()
+    await session.refresh(mission)
+    return mission
+
+
+@traced
+async def get_assignable_mission_ids(
+    session: AsyncSession, limit: int | None = None
+) -> list[int]:
+    """Lock unassigned open missions, oldest first, skipping rows locked elsewhere."""
+    result = await session.execute(
+        select(Mission.id)
+        .where(Mission.cat_id.is_(None))
+        .where(Mission.is_complete == False)
+        .where(Mission.deleted_at.is_(None))
+        .order_by(Mission.created_at, Mission.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(result.scalars().all())
+
+
+@traced
+async def assign_cats_to_missions(
+    session: AsyncSession, mission_ids: list[int], cat_ids: list[int]
+) -> None:
+    """Assign cats to missions pairwise in one statement.
+
+    The pairs travel as two array parameters joined with `unnest`, so the
+    statement has the same shape and parameter count for any batch size.
+    """
+    assignments = func.unnest(
+        bindparam("mission_ids", mission_ids, type_=ARRAY(BigInteger)),
+        bindparam("cat_ids", cat_ids, type_=ARRAY(BigInteger)),
+    ).table_valued("mission_id", "cat_id").render_derived()
+    await session.execute(
+        update(Mission)
+        .where(Mission.id == assignments.c.mission_id)
+        .values(cat_id=assignments.c.cat_id, version=Mission.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@traced
 async def delete_mission(session: AsyncSession, mission: Mission) -> None:
-    """Delete a mission."""
-    await session.delete(mission)
+    """Soft-delete a mission, leaving tombstones for it and its targets."""
+    mission.deleted_at = func.now()
     await session.flush()
+    await record_target_removals(session=session, mission_ids=[mission.id])
+
+
+def _purge_conditions(request: MissionPurgeRequest) -> list[ColumnElement[bool]]:
+    """Translate a purge filter into WHERE clauses on missions."""
+    conditions = [
+        Mission.created_at < func.now() - timedelta(days=request.older_than_days)
+    ]
+    if request.is_complete is not None:
+        conditions.append(Mission.is_complete == request.is_complete)
+    if request.assigned is not None:
+        conditions.append(
+            Mission.cat_id.is_not(None)
+            if request.assigned
+            else Mission.cat_id.is_(None)
+        )
+    if request.deleted is not None:
+        conditions.append(
+            Mission.deleted_at.is_not(None)
+            if request.deleted
+            else Mission.deleted_at.is_(None)
+        )
+    return conditions
+
+
+@traced
+async def count_purgeable_missions(
+    session: AsyncSession, request: MissionPurgeRequest
+) -> int:
+    """Count the missions a purge with this filter would delete."""
+    result = await session.execute(
+        select(func.count(Mission.id)).where(*_purge_conditions(request))
+    )
+    return result.scalar()
+
+
+@traced
+async def lock_purgeable_mission_ids(
+    session: AsyncSession, request: MissionPurgeRequest, limit: int
+) -> list[int]:
+    """Lock the next batch of missions to purge, skipping rows locked elsewhere."""
+    result = await session.execute(
+        select(Mission.id)
+        .where(*_purge_conditions(request))
+        .order_by(Mission.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(result.scalars().all())
 
 
+@traced
+async def delete_missions_by_ids(session: AsyncSession, mission_ids: list[int]) -> int:
+    """Permanently delete missions with one statement.
+
+    Targets go with them through ON DELETE CASCADE in the database, so no rows
+    are loaded into the session. Returns the number of missions deleted.
+    """
+    ids = bindparam("mission_ids", mission_ids, type_=ARRAY(Integer))
+    result = await session.execute(
+        delete(Mission)
+        .where(Mission.id == any_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+@traced
 async def is_mission_assigned(session: AsyncSession, mission_id: int) -> bool:
     """Check if mission is assigned to a cat."""
     result = await session.execute(
-        select(Mission.cat_id).where(Mission.id == mission_id)
+        lambda_stmt(lambda: select(Mission.cat_id).where(Mission.id == mission_id))
     )
     cat_id = result.scalar_one_or_none()
     return cat_id is not None
 
 
+@traced
 async def update_mission_completion_status(
     session: AsyncSession, mission: Mission
 ) -> Mission:
     """Update mission completion status based on targets."""
+    mission_id = mission.id
     result = await session.execute(
-        select(func.count(Target.id))
-        .where(Target.mission_id == mission.id)
-        .where(Target.is_complete == False)
+        lambda_stmt(
+            lambda: select(func.count(Target.id))
+            .where(Target.mission_id == mission_id)
+            .where(Target.is_complete == False)
+        )
     )
     incomplete_targets = result.scalar()
 
     if incomplete_targets == 0 and not mission.is_complete:
         mission.is_complete = True
-        mission.completed_at = datetime.now(UTC)
+        mission.completed_at = func.now()
     elif incomplete_targets > 0 and mission.is_complete:
         mission.is_complete = False
         mission.completed_at = None
@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+from sqlalchemy import case, delete, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.tracing import traced
+from models import RateLimitBucket
+
+
+@traced
+async def consume_token(
+    connection: AsyncConnection, key: str, rate: float, burst: int
+) -> tuple[bool, float]:
+    """Atomically refill a bucket and take one token if available.
+
+    Returns whether the request is allowed and the tokens left afterwards.
+    """
+    bucket = RateLimitBucket.__table__
+    elapsed = func.extract("epoch", func.clock_timestamp() - bucket.c.updated_at)
+    refilled = func.least(literal(float(burst)), bucket.c.tokens + elapsed * rate)
+
+    statement = (
+        insert(bucket)
+        .values(
+            key=key,
+            tokens=burst - 1,
+            allowed=True,
+            updated_at=func.clock_timestamp(),
+        )
+        .on_conflict_do_update(
+            index_elements=[bucket.c.key],
+            set_={
+                "tokens": case((refilled >= 1, refilled - 1), else_=refilled),
+                "allowed": refilled >= 1,
+                "updated_at": func.clock_timestamp(),
+            },
+        )
+        .returning(bucket.c.allowed, bucket.c.tokens)
+    )
+    result = await connection.execute(statement)
+    allowed, tokens = result.one()
+    return allowed, tokens
+
+
+@traced
+async def delete_idle_buckets(connection: AsyncConnection, idle: timedelta) -> int:
+    """Delete buckets untouched for `idle`, returning how many were deleted."""
+    bucket = RateLimitBucket.__table__
+    result = await connection.execute(
+        delete(bucket).where(bucket.c.updated_at < func.clock_timestamp() - idle)
+    )
+    return result.rowcount
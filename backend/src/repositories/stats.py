@@ -0,0 +1,106 @@
+from sqlalchemy import column, func, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.tracing import traced
+
+# Materialized views created by migration d1cf4aec4a5f. They are not part of the
+# ORM metadata so autogenerate never tries to manage them as tables.
+cat_mission_stats = table(
+    "cat_mission_stats",
+    column("cat_id"),
+    column("cat_name"),
+    column("active_missions"),
+    column("completed_missions"),
+)
+country_target_stats = table(
+    "country_target_stats",
+    column("country"),
+    column("total_targets"),
+    column("completed_targets"),
+    column("completion_rate"),
+)
+breed_salary_stats = table(
+    "breed_salary_stats",
+    column("breed"),
+    column("cat_count"),
+    column("total_salary"),
+    column("average_salary"),
+)
+mission_completion_stats = table(
+    "mission_completion_stats",
+    column("total_missions"),
+    column("completed_missions"),
+    column("active_missions"),
+    column("avg_completion_seconds"),
+    column("total_cats"),
+    column("refreshed_at"),
+)
+
+STATS_VIEWS = (
+    cat_mission_stats,
+    country_target_stats,
+    breed_salary_stats,
+    mission_completion_stats,
+)
+
+# Arbitrary application-wide key used to elect a single refresher across workers
+STATS_REFRESH_LOCK_KEY = 260_026
+
+
+@traced
+async def get_cat_mission_stats(
+    session: AsyncSession, skip: int = 0, limit: int = 100
+) -> list[dict]:
+    """Get per-cat mission counts with pagination.
+
+    The number of cats is `total_cats` of `get_mission_completion_stats`.
+    """
+    result = await session.execute(
+        select(cat_mission_stats)
+        .offset(skip)
+        .limit(limit)
+        .order_by(cat_mission_stats.c.cat_id)
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+@traced
+async def get_country_target_stats(session: AsyncSession) -> list[dict]:
+    """Get target completion rates per country."""
+    result = await session.execute(
+        select(country_target_stats).order_by(country_target_stats.c.country)
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+@traced
+async def get_breed_salary_stats(session: AsyncSession) -> list[dict]:
+    """Get salary totals per breed."""
+    result = await session.execute(
+        select(breed_salary_stats).order_by(breed_salary_stats.c.breed)
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+@traced
+async def get_mission_completion_stats(session: AsyncSession) -> dict | None:
+    """Get agency-wide mission completion figures."""
+    result = await session.execute(select(mission_completion_stats))
+    row = result.mappings().one_or_none()
+    return dict(row) if row else None
+
+
+@traced
+async def refresh_stats_views(session: AsyncSession) -> bool:
+    """Refresh all stats views unless another worker is already doing it."""
+    result = await session.execute(
+        select(func.pg_try_advisory_xact_lock(STATS_REFRESH_LOCK_KEY))
+    )
+    if not result.scalar():
+        return False
+
+    for view in STATS_VIEWS:
+        await session.execute(
+            text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}")
+        )
+    return True
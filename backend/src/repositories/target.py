@@ -1,20 +1,61 @@
-from datetime import UTC, datetime
-
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    Load,
+    QueryableAttribute,
+    contains_eager,
+    selectinload,
+    undefer,
+    with_expression,
+)
 
-from models import Target
+from core.enums import TargetNotes
+from core.tracing import traced
+from models import Mission, Target
 from schemas.target import TargetUpdate
 
+# Characters of notes in a preview; one more is loaded to tell if it was cut
+NOTES_PREVIEW_LENGTH = 100
+
+
+def load_targets(
+    relationship: QueryableAttribute, notes: TargetNotes = TargetNotes.FULL
+) -> Load:
+    """Eager load a mission's targets with as much of their notes as needed.
+
+    Notes are deferred, so lists that do not return them never read them from
+    disk. Previews cut them in the database, so long notes are not sent whole.
+    """
+    target = relationship.property.mapper.class_
+    loader = selectinload(relationship)
+    if notes == TargetNotes.FULL:
+        return loader.options(undefer(target.notes))
+    if notes == TargetNotes.PREVIEW:
+        return loader.options(
+            with_expression(
+                target.notes_preview,
+                func.left(target.notes, NOTES_PREVIEW_LENGTH + 1),
+            )
+        )
+    return loader
+
 
+@traced
 async def get_target_by_id(session: AsyncSession, target_id: int) -> Target | None:
-    """Get target by ID."""
+    """Get target by ID together with its mission, loaded from the same join."""
     result = await session.execute(
-        select(Target).where(Target.id == target_id)
+        lambda_stmt(
+            lambda: select(Target)
+            .join(Target.mission)
+            .options(contains_eager(Target.mission), undefer(Target.notes))
+            .where(Target.id == target_id)
+            .where(Mission.deleted_at.is_(None))
+        )
     )
     return result.scalar_one_or_none()
 
 
+@traced
 async def update_target(
     session: AsyncSession, target: Target, target_data: TargetUpdate
 ) -> Target:
@@ -25,7 +66,7 @@ async def update_target(
     if target_data.is_complete is not None:
         target.is_complete = target_data.is_complete
         if target_data.is_complete:
-            target.completed_at = datetime.now(UTC)
+            target.completed_at = func.now()
         else:
             target.completed_at = None
 
@@ -34,9 +75,14 @@ async def update_target(
     return target
 
 
+@traced
 async def get_mission_targets(session: AsyncSession, mission_id: int) -> list[Target]:
     """Get all targets for a mission."""
     result = await session.execute(
-        select(Target).where(Target.mission_id == mission_id)
+        lambda_stmt(
+            lambda: select(Target)
+            .options(undefer(Target.notes))
+            .where(Target.mission_id == mission_id)
+        )
     )
     return list(result.scalars().all())
@@ -1,5 +1,15 @@
+from routers.admin import router as admin_router
 from routers.cat import router as cat_router
+from routers.changes import router as changes_router
 from routers.mission import router as mission_router
+from routers.stats import router as stats_router
 from routers.target import router as target_router
 
-__all__ = ["cat_router", "mission_router", "target_router"]
+__all__ = [
+    "admin_router",
+    "cat_router",
+    "changes_router",
+    "mission_router",
+    "stats_router",
+    "target_router",
+]
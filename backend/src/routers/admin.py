@@ -0,0 +1,56 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from typing import Annotated
+
+from db.dependencies import AppSettings, DBSession
+from schemas.mission import MissionPurgeRequest, MissionPurgeResponse
+from services.mission import purge_missions_service
+
+
+def require_admin_key(
+    request: Request,
+    x_admin_key: Annotated[
+        str | None, Header(description="Key configured in ADMIN_API_KEY")
+    ] = None
+) -> None:
+    """Reject the request unless it carries the configured admin key."""
+    admin_api_key = request.app.state.settings.admin_api_key
+    if admin_api_key is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admin endpoints are disabled"
+        )
+    if x_admin_key is None or not secrets.compare_digest(
+        x_admin_key.encode(), admin_api_key.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin key"
+        )
+
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_key)]
+)
+
+
+@router.post(
+    path="/missions/purge",
+    response_model=MissionPurgeResponse,
+    summary="Permanently delete missions",
+    description=(
+        "Hard-delete missions created before `older_than_days` that match the "
+        "filters, with their targets, in short batches. Cats on purged "
+        "missions are released. Requires the `X-Admin-Key` header"
+    )
+)
+async def purge_missions(
+    request: MissionPurgeRequest,
+    session: DBSession,
+    settings: AppSettings
+) -> MissionPurgeResponse:
+    """Purge missions matching a filter."""
+    return await purge_missions_service(
+        session=session, settings=settings, request=request
+    )
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Header, Query, Request, Response, status
 from typing import Annotated
 
-from db.dependencies import DBSession
+from core.concurrency import parse_if_match, version_etag
+from core.params import parse_ids
+from core.responses import MSGPACK_CONTENT, negotiated_response
+from db.dependencies import AppSettings, DBSession, ListDBSession
 from schemas.cat import CatCreate, CatListResponse, CatResponse, CatUpdate
 from services.cat import (
     create_cat_service,
     delete_cat_service,
+    get_available_cats_service,
     get_cat_service,
     get_cats_service,
     update_cat_service,
@@ -20,31 +24,97 @@ router = APIRouter(prefix="/cats", tags=["cats"])
     response_model=CatResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new spy cat",
-    description="Create a new spy cat with breed validation using TheCatAPI"
+    description=(
+        "Create a new spy cat with breed validation using TheCatAPI. Retries "
+        "sent with the same `Idempotency-Key` return the original response"
+    )
 )
 async def create_cat(
     cat_data: CatCreate,
-    session: DBSession
+    session: DBSession,
+    settings: AppSettings,
+    idempotency_key: Annotated[
+        str | None,
+        Header(max_length=255, description="Replay-safe key for retried requests")
+    ] = None
 ) -> CatResponse:
     """Create a new spy cat."""
-    return await create_cat_service(session=session, cat_data=cat_data)
+    return await create_cat_service(
+        session=session,
+        settings=settings,
+        cat_data=cat_data,
+        idempotency_key=idempotency_key,
+    )
 
 
 @router.get(
     path="/",
     response_model=CatListResponse,
+    responses={200: {"content": MSGPACK_CONTENT}},
     summary="List all spy cats",
-    description="Get a paginated list of all spy cats"
+    description=(
+        "Get a paginated list of all spy cats, or fetch up to 100 cats at once "
+        "with `ids`. IDs that do not exist are listed in `missing`. Sent as "
+        "MessagePack with `Accept: application/msgpack`"
+    )
 )
 async def get_cats(
-    session: DBSession,
+    request: Request,
+    session: ListDBSession,
     skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Number of records to return")
-    ] = 100
-) -> CatListResponse:
+    ] = 100,
+    ids: Annotated[
+        str | None,
+        Query(description="Comma-separated cat IDs to fetch instead of a page")
+    ] = None
+) -> Response:
     """Get all spy cats with pagination."""
-    return await get_cats_service(session=session, skip=skip, limit=limit)
+    cats = await get_cats_service(
+        session=session, skip=skip, limit=limit, ids=parse_ids(ids)
+    )
+    return negotiated_response(request=request, content=cats)
+
+
+@router.get(
+    path="/available",
+    response_model=CatListResponse,
+    responses={200: {"content": MSGPACK_CONTENT}},
+    summary="List available spy cats",
+    description=(
+        "Get a paginated list of cats without an active mission, most "
+        "experienced first, optionally filtered by breed and experience. "
+        "Sent as MessagePack with `Accept: application/msgpack`"
+    )
+)
+async def get_available_cats(
+    request: Request,
+    session: ListDBSession,
+    skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Number of records to return")
+    ] = 100,
+    breed: Annotated[
+        str | None, Query(min_length=1, description="Exact breed to filter by")
+    ] = None,
+    min_experience: Annotated[
+        int | None, Query(ge=0, description="Minimum years of experience")
+    ] = None,
+    max_experience: Annotated[
+        int | None, Query(ge=0, description="Maximum years of experience")
+    ] = None
+) -> Response:
+    """Get spy cats available for new missions."""
+    cats = await get_available_cats_service(
+        session=session,
+        skip=skip,
+        limit=limit,
+        breed=breed,
+        min_experience=min_experience,
+        max_experience=max_experience,
+    )
+    return negotiated_response(request=request, content=cats)
 
 
 @router.get(
@@ -55,32 +125,50 @@ async def get_cats(
 )
 async def get_cat(
     cat_id: int,
+    request: Request,
     session: DBSession
 ) -> CatResponse:
     """Get a spy cat by ID."""
-    return await get_cat_service(session=session, cat_id=cat_id)
+    return await get_cat_service(
+        session=session, cat_id=cat_id, loader=request.app.state.cat_loader
+    )
 
 
 @router.patch(
     path="/{cat_id}",
     response_model=CatResponse,
     summary="Update spy cat information",
-    description="Update spy cat information (currently only salary can be updated)"
+    description=(
+        "Update spy cat information (currently only salary can be updated). "
+        "Send the cat's version as `If-Match` to reject lost updates with 409"
+    )
 )
 async def update_cat(
     cat_id: int,
     cat_data: CatUpdate,
-    session: DBSession
+    session: DBSession,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None
 ) -> CatResponse:
     """Update spy cat information."""
-    return await update_cat_service(session=session, cat_id=cat_id, cat_data=cat_data)
+    cat = await update_cat_service(
+        session=session,
+        cat_id=cat_id,
+        cat_data=cat_data,
+        expected_version=parse_if_match(if_match),
+    )
+    response.headers["ETag"] = version_etag(cat.version)
+    return cat
 
 
 @router.delete(
     path="/{cat_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a spy cat",
-    description="Delete a spy cat (only if it has no active missions)"
+    description=(
+        "Soft-delete a spy cat and its missions (only if it has no active missions). "
+        "Deletions are published as tombstones on `/changes`"
+    )
 )
 async def delete_cat(
     cat_id: int,
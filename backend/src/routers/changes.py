@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Query
+from typing import Annotated
+
+from db.dependencies import ListDBSession
+from schemas.change import ChangeFeedResponse
+from services.changes import get_changes_service
+
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+@router.get(
+    path="/",
+    response_model=ChangeFeedResponse,
+    summary="List changes since a cursor",
+    description=(
+        "Get inserts, updates and tombstones of cats, missions and targets in "
+        "commit order. Pass `next_cursor` back as `since` to sync incrementally"
+    )
+)
+async def get_changes(
+    session: ListDBSession,
+    since: Annotated[
+        str | None, Query(description="Cursor returned by the previous page")
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=1000, description="Number of changes to return")
+    ] = 100
+) -> ChangeFeedResponse:
+    """Get changes after a cursor."""
+    return await get_changes_service(session=session, since=since, limit=limit)
@@ -1,15 +1,29 @@
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from typing import Annotated
 
-from db.dependencies import DBSession
-from schemas.mission import MissionCreate, MissionListResponse, MissionResponse
+from core.concurrency import parse_if_match, version_etag
+from core.params import parse_ids
+from core.responses import MSGPACK_CONTENT, negotiated_response
+from core.enums import MissionListShape, TargetNotes
+from db.dependencies import AppSettings, DBSession, ListDBSession
+from schemas.mission import (
+    MissionAutoAssignRequest,
+    MissionAutoAssignResponse,
+    MissionCreate,
+    MissionListResponse,
+    MissionResponse,
+    MissionSideloadedListResponse,
+)
 from services.mission import (
     assign_cat_to_mission_service,
+    auto_assign_missions_service,
     create_mission_service,
     delete_mission_service,
     get_mission_service,
     get_missions_service,
 )
+from services.events import parse_event_cursor, stream_mission_events
 
 
 router = APIRouter(prefix="/missions", tags=["missions"])
@@ -20,71 +34,202 @@ router = APIRouter(prefix="/missions", tags=["missions"])
     response_model=MissionResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new mission",
-    description="Create a new mission with 1-3 targets"
+    description=(
+        "Create a new mission with 1-3 targets. Retries sent with the same "
+        "`Idempotency-Key` return the original response"
+    )
 )
 async def create_mission(
     mission_data: MissionCreate,
-    session: DBSession
+    session: DBSession,
+    settings: AppSettings,
+    idempotency_key: Annotated[
+        str | None,
+        Header(max_length=255, description="Replay-safe key for retried requests")
+    ] = None
 ) -> MissionResponse:
     """Create a new mission with targets."""
-    return await create_mission_service(session=session, mission_data=mission_data)
+    return await create_mission_service(
+        session=session,
+        settings=settings,
+        mission_data=mission_data,
+        idempotency_key=idempotency_key,
+    )
 
 
 @router.get(
     path="/",
     response_model=MissionListResponse,
+    responses={
+        200: {"model": MissionSideloadedListResponse, "content": MSGPACK_CONTENT}
+    },
     summary="List all missions",
     description=(
-        "Get a paginated list of all missions with their targets and assigned cats"
+        "Get a paginated list of all missions with their targets and assigned cats. "
+        "Use `include`, `fields`, `shape` and `notes` to slim the payload and "
+        "`archived` to browse archived missions. Fetch up to 100 missions at "
+        "once with `ids`; IDs that do not exist are listed in `missing`. Batch "
+        "consumers can ask for MessagePack with `Accept: application/msgpack`"
     )
 )
 async def get_missions(
-    session: DBSession,
+    request: Request,
+    session: ListDBSession,
     skip: Annotated[int, Query(ge=0, description="Number of records to skip")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Number of records to return")
-    ] = 100
-) -> MissionListResponse:
+    ] = 100,
+    include: Annotated[
+        str | None,
+        Query(description="Comma-separated relations to embed: cat, targets")
+    ] = None,
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated mission fields to return")
+    ] = None,
+    shape: Annotated[
+        MissionListShape,
+        Query(description="`sideloaded` lists each assigned cat once under `cats`")
+    ] = MissionListShape.NESTED,
+    archived: Annotated[
+        bool, Query(description="List archived missions instead of live ones")
+    ] = False,
+    ids: Annotated[
+        str | None,
+        Query(description="Comma-separated mission IDs to fetch instead of a page")
+    ] = None,
+    notes: Annotated[
+        TargetNotes,
+        Query(
+            description=(
+                "Target notes in `full`, as a `preview` of their first 100 "
+                "characters with `notes_truncated`, or `none`"
+            )
+        )
+    ] = TargetNotes.FULL
+) -> Response:
     """Get all missions with pagination."""
-    return await get_missions_service(session=session, skip=skip, limit=limit)
+    missions = await get_missions_service(
+        session=session,
+        skip=skip,
+        limit=limit,
+        include=include,
+        fields=fields,
+        shape=shape,
+        archived=archived,
+        ids=parse_ids(ids),
+        notes=notes,
+    )
+    return negotiated_response(request=request, content=missions)
+
+
+@router.post(
+    path="/auto-assign",
+    response_model=MissionAutoAssignResponse,
+    summary="Auto-assign cats to missions",
+    description=(
+        "Assign available cats to unassigned open missions in bulk, oldest "
+        "missions first. Use `dry_run` to preview the plan without applying it"
+    )
+)
+async def auto_assign_missions(
+    request: MissionAutoAssignRequest,
+    session: DBSession,
+    settings: AppSettings
+) -> MissionAutoAssignResponse:
+    """Assign available cats to open missions."""
+    return await auto_assign_missions_service(
+        session=session, settings=settings, request=request
+    )
+
+
+@router.get(
+    path="/events",
+    response_class=StreamingResponse,
+    summary="Stream mission changes",
+    description=(
+        "Server-sent events feed of mission creation, cat assignment, target "
+        "updates and mission completion. Reconnect with `Last-Event-ID` to resume"
+    )
+)
+async def get_mission_events(
+    request: Request,
+    settings: AppSettings,
+    last_event_id: Annotated[
+        str | None, Header(description="Resume after the event with this ID")
+    ] = None
+) -> StreamingResponse:
+    """Stream mission change events."""
+    return StreamingResponse(
+        content=stream_mission_events(
+            broker=request.app.state.mission_events,
+            session_factory=request.app.state.session_factory,
+            position=parse_event_cursor(last_event_id) if last_event_id else None,
+            keepalive_interval=settings.event_keepalive_interval,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
     path="/{mission_id}",
     response_model=MissionResponse,
     summary="Get a mission",
-    description="Get a specific mission by ID with targets and assigned cat information"
+    description=(
+        "Get a specific mission by ID with targets and assigned cat information, "
+        "including archived missions"
+    )
 )
 async def get_mission(
     mission_id: int,
+    request: Request,
     session: DBSession
-) -> MissionResponse:
+) -> Response:
     """Get a mission by ID."""
-    return await get_mission_service(session=session, mission_id=mission_id)
+    document = await get_mission_service(
+        session=session,
+        mission_id=mission_id,
+        loader=request.app.state.mission_loader,
+    )
+    return Response(content=document, media_type="application/json")
 
 
 @router.patch(
     path="/{mission_id}/assign/{cat_id}",
     response_model=MissionResponse,
     summary="Assign cat to mission",
-    description="Assign an available cat to a mission"
+    description=(
+        "Assign an available cat to a mission. Send the mission's version as "
+        "`If-Match` to reject lost updates with 409"
+    )
 )
 async def assign_cat_to_mission(
     mission_id: int,
     cat_id: int,
-    session: DBSession
+    session: DBSession,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None
 ) -> MissionResponse:
     """Assign a cat to a mission."""
-    return await assign_cat_to_mission_service(
-        session=session, mission_id=mission_id, cat_id=cat_id
+    mission = await assign_cat_to_mission_service(
+        session=session,
+        mission_id=mission_id,
+        cat_id=cat_id,
+        expected_version=parse_if_match(if_match),
     )
+    response.headers["ETag"] = version_etag(mission.version)
+    return mission
 
 
 @router.delete(
     path="/{mission_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a mission",
-    description="Delete a mission (only if it's not assigned to a cat)"
+    description=(
+        "Soft-delete a mission (only if it's not assigned to a cat). "
+        "Deletions are published as tombstones on `/changes`"
+    )
 )
 async def delete_mission(
     mission_id: int,
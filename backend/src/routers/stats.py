@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Query, Request
+from typing import Annotated
+
+from db.dependencies import AppSettings, DBSession
+from schemas.stats import AgencyStatsResponse, CacheStatsResponse
+from services.stats import get_agency_stats_service
+
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    path="/",
+    response_model=AgencyStatsResponse,
+    summary="Get agency statistics",
+    description=(
+        "Get precomputed mission, target, breed and per-cat statistics. "
+        "Figures are refreshed periodically and may lag writes by up to "
+        "`max_staleness_seconds`"
+    )
+)
+async def get_stats(
+    session: DBSession,
+    settings: AppSettings,
+    skip: Annotated[int, Query(ge=0, description="Number of cat rows to skip")] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Number of cat rows to return")
+    ] = 100
+) -> AgencyStatsResponse:
+    """Get agency statistics."""
+    return await get_agency_stats_service(
+        session=session, settings=settings, skip=skip, limit=limit
+    )
+
+
+@router.get(
+    path="/cache",
+    response_model=CacheStatsResponse,
+    summary="Get entity cache statistics",
+    description=(
+        "Get hit rate and size of the single-entity cache. Counters are per "
+        "worker process and reset on restart"
+    )
+)
+async def get_cache_stats(request: Request) -> CacheStatsResponse:
+    """Get entity cache statistics."""
+    return CacheStatsResponse.model_validate(request.app.state.entity_cache.stats())
@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Response
+from typing import Annotated
 
+from core.concurrency import parse_if_match, version_etag
 from db.dependencies import DBSession
 from schemas.target import TargetResponse, TargetUpdate
 from services.mission import update_target_service
@@ -12,14 +14,24 @@ router = APIRouter(prefix="/targets", tags=["targets"])
     path="/{target_id}",
     response_model=TargetResponse,
     summary="Update target information",
-    description="Update target notes and/or completion status"
+    description=(
+        "Update target notes and/or completion status. Send the target's version "
+        "as `If-Match` to reject lost updates with 409"
+    )
 )
 async def update_target(
     target_id: int,
     target_data: TargetUpdate,
-    session: DBSession
+    session: DBSession,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None
 ) -> TargetResponse:
     """Update target information."""
-    return await update_target_service(
-        session=session, target_id=target_id, target_data=target_data
+    target = await update_target_service(
+        session=session,
+        target_id=target_id,
+        target_data=target_data,
+        expected_version=parse_if_match(if_match),
     )
+    response.headers["ETag"] = version_etag(target.version)
+    return target
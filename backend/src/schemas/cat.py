@@ -45,8 +45,16 @@ class CatResponse(CatBase):
     """Schema for cat response."""
 
     id: int = Field(..., description="Cat's unique identifier")
+    breed_rejected: bool = Field(
+        default=False,
+        description="TheCatAPI did not recognize the breed when it was re-checked",
+    )
+    active_mission_id: int | None = Field(
+        default=None, description="Incomplete mission the cat is assigned to"
+    )
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
+    version: int = Field(..., description="Entity version, usable as If-Match ETag")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -56,3 +64,6 @@ class CatListResponse(BaseModel):
 
     cats: list[CatResponse]
     total: int = Field(..., description="Total number of cats")
+    missing: list[int] = Field(
+        default_factory=list, description="Requested `ids` that were not found"
+    )
@@ -0,0 +1,25 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from core.enums import ChangeEntity, ChangeOperation
+
+
+class ChangeResponse(BaseModel):
+    """Schema for a single change feed entry."""
+
+    entity: ChangeEntity = Field(..., description="Changed entity type")
+    op: ChangeOperation = Field(..., description="Kind of change")
+    id: int = Field(..., description="Changed entity's unique identifier")
+    cursor: str = Field(..., description="Resume from this entry with `since`")
+    data: dict[str, Any] | None = Field(
+        None, description="Current state of the entity, null for tombstones"
+    )
+
+
+class ChangeFeedResponse(BaseModel):
+    """Schema for a page of the change feed."""
+
+    changes: list[ChangeResponse]
+    next_cursor: str = Field(..., description="Cursor to pass as `since` next time")
+    has_more: bool = Field(..., description="Whether more changes are available")
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+
+
+class MissionDocumentRebuildResponse(BaseModel):
+    """Schema for the result of rebuilding mission documents."""
+
+    rebuilt: int = Field(..., description="Documents of live missions rewritten")
+    removed: int = Field(..., description="Documents of deleted missions removed")
+    batches: int = Field(..., description="Transactions the rebuild took")
+
+
+class MissionDocumentVerifyResponse(BaseModel):
+    """Schema for the drift found between mission documents and their missions."""
+
+    checked: int = Field(..., description="Live missions compared with their document")
+    missing: int = Field(..., description="Live missions without a document")
+    stale: int = Field(..., description="Documents that differ from their mission")
+    orphaned: int = Field(..., description="Documents left for deleted missions")
+    drifted_ids: list[int] = Field(
+        default_factory=list, description="First mission IDs found drifted"
+    )
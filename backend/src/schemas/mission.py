@@ -1,7 +1,10 @@
 from datetime import datetime
+from decimal import Decimal
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from core.enums import AssignmentPreference
 from schemas.cat import CatResponse
 from schemas.target import TargetCreate, TargetResponse
 
@@ -35,8 +38,8 @@ class MissionUpdate(BaseModel):
     cat_id: int | None = Field(default=None, description="Assign cat to mission")
 
 
-class MissionResponse(MissionBase):
-    """Schema for mission response."""
+class MissionSummaryResponse(MissionBase):
+    """Schema for mission response without related entities."""
 
     id: int = Field(..., description="Mission's unique identifier")
     cat_id: int | None = Field(default=None, description="Assigned cat ID")
@@ -46,16 +49,121 @@ class MissionResponse(MissionBase):
     completed_at: datetime | None = Field(
         default=None, description="Completion timestamp"
     )
+    version: int = Field(..., description="Entity version, usable as If-Match ETag")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MissionResponse(MissionSummaryResponse):
+    """Schema for mission response."""
+
     targets: list[TargetResponse] = Field(..., description="Mission targets")
     cat: CatResponse | None = Field(
         default=None, description="Assigned cat information"
     )
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class MissionListResponse(BaseModel):
     """Schema for listing missions."""
 
     missions: list[MissionResponse]
     total: int = Field(..., description="Total number of missions")
+    missing: list[int] = Field(
+        default_factory=list, description="Requested `ids` that were not found"
+    )
+
+
+class MissionSideloadedListResponse(BaseModel):
+    """Schema for listing missions with assigned cats listed once."""
+
+    missions: list[dict[str, Any]] = Field(
+        ..., description="Missions restricted to the requested fields"
+    )
+    cats: list[CatResponse] = Field(
+        default_factory=list, description="Distinct cats referenced by `cat_id`"
+    )
+    total: int = Field(..., description="Total number of missions")
+    missing: list[int] = Field(
+        default_factory=list, description="Requested `ids` that were not found"
+    )
+
+
+class MissionAutoAssignRequest(BaseModel):
+    """Schema for automatically assigning available cats to open missions."""
+
+    prefer: AssignmentPreference = Field(
+        default=AssignmentPreference.EXPERIENCE,
+        description="Rank cats by most experience or by lowest salary",
+    )
+    min_experience: int | None = Field(
+        default=None, ge=0, description="Minimum years of experience"
+    )
+    max_salary: Decimal | None = Field(
+        default=None, gt=0, description="Maximum salary"
+    )
+    breeds: list[str] | None = Field(
+        default=None, min_length=1, description="Only assign cats of these breeds"
+    )
+    max_assignments: int | None = Field(
+        default=None, ge=1, description="Maximum number of missions to assign"
+    )
+    dry_run: bool = Field(
+        default=False, description="Plan the assignments without applying them"
+    )
+
+
+class MissionAssignment(BaseModel):
+    """Schema for a single planned cat assignment."""
+
+    mission_id: int = Field(..., description="Mission ID")
+    cat_id: int = Field(..., description="Assigned cat ID")
+
+
+class MissionAutoAssignResponse(BaseModel):
+    """Schema for the auto-assignment result."""
+
+    assignments: list[MissionAssignment] = Field(
+        ..., description="Mission and cat pairs, oldest mission first"
+    )
+    assigned: int = Field(..., description="Number of missions assigned")
+    unassigned: int = Field(
+        ..., description="Open missions left without a matching cat"
+    )
+    dry_run: bool = Field(..., description="Whether the plan was left unapplied")
+
+
+class MissionPurgeRequest(BaseModel):
+    """Schema for permanently deleting missions that match a filter."""
+
+    older_than_days: int = Field(
+        ..., ge=0, description="Only missions created more than this many days ago"
+    )
+    is_complete: bool | None = Field(
+        default=None, description="Only complete, or only incomplete, missions"
+    )
+    assigned: bool | None = Field(
+        default=None, description="Only assigned, or only unassigned, missions"
+    )
+    deleted: bool | None = Field(
+        default=None,
+        description="Only soft-deleted missions (tombstones), or only live ones",
+    )
+    batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        le=10_000,
+        description="Missions deleted per transaction, PURGE_BATCH_SIZE if unset",
+    )
+    dry_run: bool = Field(
+        default=False, description="Count the matching missions without deleting"
+    )
+
+
+class MissionPurgeResponse(BaseModel):
+    """Schema for the purge result."""
+
+    purged: int = Field(
+        ..., description="Missions deleted, or that would be deleted on a dry run"
+    )
+    batches: int = Field(..., description="Transactions the deletion took")
+    dry_run: bool = Field(..., description="Whether nothing was deleted")
@@ -0,0 +1,71 @@
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CatMissionStats(BaseModel):
+    """Schema for per-cat mission counts."""
+
+    cat_id: int = Field(..., description="Cat's unique identifier")
+    cat_name: str = Field(..., description="Cat's name")
+    active_missions: int = Field(..., description="Number of incomplete missions")
+    completed_missions: int = Field(..., description="Number of completed missions")
+
+
+class CountryTargetStats(BaseModel):
+    """Schema for target completion per country."""
+
+    country: str = Field(..., description="Target country")
+    total_targets: int = Field(..., description="Number of targets in the country")
+    completed_targets: int = Field(..., description="Number of completed targets")
+    completion_rate: Decimal = Field(..., description="Completed / total targets")
+
+
+class BreedSalaryStats(BaseModel):
+    """Schema for salary totals per breed."""
+
+    breed: str = Field(..., description="Cat breed")
+    cat_count: int = Field(..., description="Number of cats of the breed")
+    total_salary: Decimal = Field(..., description="Sum of salaries")
+    average_salary: Decimal = Field(..., description="Average salary")
+
+
+class MissionCompletionStats(BaseModel):
+    """Schema for agency-wide mission completion figures."""
+
+    total_missions: int = Field(..., description="Total number of missions")
+    completed_missions: int = Field(..., description="Number of completed missions")
+    active_missions: int = Field(..., description="Number of incomplete missions")
+    avg_completion_seconds: float | None = Field(
+        default=None, description="Mean time from creation to completion"
+    )
+
+
+class AgencyStatsResponse(BaseModel):
+    """Schema for agency statistics response."""
+
+    missions: MissionCompletionStats
+    countries: list[CountryTargetStats]
+    breeds: list[BreedSalaryStats]
+    cats: list[CatMissionStats]
+    total_cats: int = Field(..., description="Total number of cats in statistics")
+    refreshed_at: datetime | None = Field(
+        default=None, description="When the statistics were last recomputed"
+    )
+    max_staleness_seconds: int = Field(
+        ..., description="Upper bound on statistics age under normal operation"
+    )
+
+
+class CacheStatsResponse(BaseModel):
+    """Schema for entity cache counters of the answering worker."""
+
+    hits: int = Field(..., description="Lookups answered from the cache")
+    misses: int = Field(..., description="Lookups that loaded from the database")
+    hit_rate: float = Field(..., description="Hits / lookups since startup")
+    evictions: int = Field(..., description="Entries evicted to stay within size")
+    size: int = Field(..., description="Entries currently cached")
+    max_size: int = Field(..., description="Maximum number of cached entries")
+
+    model_config = ConfigDict(from_attributes=True)
@@ -60,6 +60,24 @@ class TargetUpdate(BaseModel):
         return v
 
 
+class TargetSummaryResponse(BaseModel):
+    """Schema for target response without notes."""
+
+    id: int = Field(..., description="Target's unique identifier")
+    mission_id: int = Field(..., description="Associated mission ID")
+    name: str = Field(..., description="Target's name")
+    country: str = Field(..., description="Target's country")
+    is_complete: bool = Field(..., description="Target completion status")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    completed_at: datetime | None = Field(
+        default=None, description="Completion timestamp"
+    )
+    version: int = Field(..., description="Entity version, usable as If-Match ETag")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class TargetResponse(TargetBase):
     """Schema for target response."""
 
@@ -71,5 +89,6 @@ class TargetResponse(TargetBase):
     completed_at: datetime | None = Field(
         default=None, description="Completion timestamp"
     )
+    version: int = Field(..., description="Entity version, usable as If-Match ETag")
 
     model_config = ConfigDict(from_attributes=True)
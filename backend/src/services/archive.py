@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import Settings
+from core.tracing import traced
+from repositories.archive import archive_completed_missions
+
+
+@traced
+async def archive_missions_service(
+    session: AsyncSession, settings: Settings
+) -> None:
+    """Move old completed missions to the archive, one transaction per batch."""
+    archived = 0
+    while True:
+        moved = await archive_completed_missions(
+            session=session,
+            age=timedelta(days=settings.archive_after_days),
+            batch_size=settings.archive_batch_size,
+        )
+        await session.commit()
+        archived += moved
+        if moved < settings.archive_batch_size:
+            break
+
+    if archived:
+        logger.info(f"Archived {archived} completed missions")
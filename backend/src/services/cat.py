@@ -1,32 +1,135 @@
+from datetime import timedelta
+
 from fastapi import HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from loguru import logger
+from sqlalchemy.orm.exc import StaleDataError
 
+from core.cache import get_entity_cache
+from core.config import Settings
+from core.enums import JobTask
+from core.loader import BatchLoader
+from core.params import MAX_IDS_PER_REQUEST
+from core.tracing import traced
+from db.session import open_db_session
 from repositories.cat import (
     cat_has_active_mission,
     create_cat,
     delete_cat, get_all_cats,
+    get_available_cats,
     get_cat_by_id,
+    get_cats_by_ids,
+    reject_cat_breed,
     update_cat,
 )
+from repositories.job import enqueue_job
 from schemas.cat import CatCreate, CatListResponse, CatResponse, CatUpdate
+from services.document import refresh_mission_documents
 from services.external_api import CatAPIService
+from services.idempotency import (
+    claim_or_replay,
+    find_idempotent_response,
+    request_fingerprint,
+    store_idempotent_response,
+)
+
+CREATE_CAT_SCOPE = "cats.create"
+
+
+def cat_cache_key(cat_id: int) -> tuple[str, int]:
+    """Entity cache key of a cat's response."""
+    return ("cat", cat_id)
+
+
+@traced
+async def _get_cat_responses(
+    session: AsyncSession, cat_ids: list[int]
+) -> dict[int, CatResponse]:
+    cats = await get_cats_by_ids(session=session, cat_ids=cat_ids)
+    return {cat.id: CatResponse.model_validate(cat) for cat in cats}
 
 
-async def create_cat_service(session: AsyncSession, cat_data: CatCreate) -> CatResponse:
+def create_cat_loader(
+    session_factory: async_sessionmaker[AsyncSession], statement_timeout: float
+) -> BatchLoader[int, CatResponse]:
+    """Build the worker's loader that batches concurrent single-cat lookups."""
+
+    async def load_cats(cat_ids: list[int]) -> dict[int, CatResponse]:
+        async with open_db_session(
+            session_factory=session_factory, statement_timeout=statement_timeout
+        ) as session:
+            return await _get_cat_responses(session=session, cat_ids=cat_ids)
+
+    return BatchLoader(load_many=load_cats, max_batch_size=MAX_IDS_PER_REQUEST)
+
+
+@traced
+async def create_cat_service(
+    session: AsyncSession,
+    settings: Settings,
+    cat_data: CatCreate,
+    idempotency_key: str | None = None,
+) -> CatResponse:
     """Create a new cat with breed validation."""
-    cat_api = CatAPIService()
+    fingerprint = request_fingerprint(cat_data)
+
+    if idempotency_key:
+        stored = await find_idempotent_response(
+            session=session,
+            scope=CREATE_CAT_SCOPE,
+            key=idempotency_key,
+            fingerprint=fingerprint,
+        )
+        # End the lookup's transaction so its connection goes back to the pool
+        # instead of idling through the TheCatAPI call below
+        await session.rollback()
+        if stored:
+            return CatResponse.model_validate(stored)
+
+    cat_api = CatAPIService(base_url=settings.cat_api_url)
 
-    if not await cat_api.validate_breed(cat_data.breed):
+    # No connection is held here: the session only checks one out on its
+    # first statement after this point
+    if (breed_is_valid := await cat_api.check_breed(cat_data.breed)) is False:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid cat breed: {cat_data.breed}"
         )
 
+    if idempotency_key and (
+        stored := await claim_or_replay(
+            session=session,
+            scope=CREATE_CAT_SCOPE,
+            key=idempotency_key,
+            fingerprint=fingerprint,
+            ttl=timedelta(hours=settings.idempotency_key_ttl_hours),
+        )
+    ):
+        return CatResponse.model_validate(stored)
+
     try:
         cat = await create_cat(session=session, cat_data=cat_data)
+
+        if breed_is_valid is None:
+            # TheCatAPI was unreachable: accept the cat now and re-check later
+            await enqueue_job(
+                session=session,
+                task=JobTask.REVALIDATE_CAT_BREED,
+                payload={"cat_id": cat.id},
+                max_attempts=settings.job_max_attempts,
+            )
+
+        response = CatResponse.model_validate(cat)
+        if idempotency_key:
+            await store_idempotent_response(
+                session=session,
+                scope=CREATE_CAT_SCOPE,
+                key=idempotency_key,
+                response=response,
+            )
+
         await session.commit()
-        return CatResponse.model_validate(cat)
+        return response
     except Exception as e:
         logger.error(f"Error creating cat: {e}")
         await session.rollback()
@@ -36,21 +139,55 @@ async def create_cat_service(session: AsyncSession, cat_data: CatCreate) -> CatR
         )
 
 
-async def get_cat_service(session: AsyncSession, cat_id: int) -> CatResponse:
-    """Get cat by ID."""
-    if not (cat := await get_cat_by_id(session=session, cat_id=cat_id)):
+@traced
+async def get_cat_service(
+    session: AsyncSession,
+    cat_id: int,
+    loader: BatchLoader[int, CatResponse] | None = None,
+) -> CatResponse:
+    """Get cat by ID, served from the worker's entity cache when possible.
+
+    Cache misses go through `loader` when given, so concurrent lookups of
+    different cats share one query.
+    """
+
+    async def load_cat() -> CatResponse | None:
+        if loader is not None:
+            return await loader.load(cat_id)
+        if cat := await get_cat_by_id(session=session, cat_id=cat_id):
+            return CatResponse.model_validate(cat)
+        return None
+
+    if cache := get_entity_cache(session):
+        cat = await cache.get_or_load(cat_cache_key(cat_id), load_cat)
+    else:
+        cat = await load_cat()
+
+    if not cat:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Cat with id {cat_id} not found"
         )
 
-    return CatResponse.model_validate(cat)
+    return cat
 
 
+@traced
 async def get_cats_service(
-    session: AsyncSession, skip: int = 0, limit: int = 100
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    ids: list[int] | None = None,
 ) -> CatListResponse:
-    """Get all cats with pagination."""
+    """Get all cats with pagination, or the cats with the given IDs."""
+    if ids is not None:
+        found = await _get_cat_responses(session=session, cat_ids=ids)
+        return CatListResponse(
+            cats=[found[cat_id] for cat_id in ids if cat_id in found],
+            total=len(found),
+            missing=[cat_id for cat_id in ids if cat_id not in found],
+        )
+
     cats, total = await get_all_cats(session=session, skip=skip, limit=limit)
 
     return CatListResponse(
@@ -59,8 +196,37 @@ async def get_cats_service(
     )
 
 
+@traced
+async def get_available_cats_service(
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    breed: str | None = None,
+    min_experience: int | None = None,
+    max_experience: int | None = None,
+) -> CatListResponse:
+    """Get cats free to take a mission."""
+    cats, total = await get_available_cats(
+        session=session,
+        skip=skip,
+        limit=limit,
+        breed=breed,
+        min_experience=min_experience,
+        max_experience=max_experience,
+    )
+
+    return CatListResponse(
+        cats=[CatResponse.model_validate(cat) for cat in cats],
+        total=total
+    )
+
+
+@traced
 async def update_cat_service(
-    session: AsyncSession, cat_id: int, cat_data: CatUpdate
+    session: AsyncSession,
+    cat_id: int,
+    cat_data: CatUpdate,
+    expected_version: int | None = None,
 ) -> CatResponse:
     """Update cat information."""
     if not (cat := await get_cat_by_id(session=session, cat_id=cat_id)):
@@ -69,10 +235,27 @@ async def update_cat_service(
             detail=f"Cat with id {cat_id} not found"
         )
 
+    if expected_version is not None and cat.version != expected_version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cat with id {cat_id} is at version {cat.version}"
+        )
+
     try:
         updated_cat = await update_cat(session=session, cat=cat, cat_data=cat_data)
+        await refresh_mission_documents(session=session, cat_ids=[cat_id])
         await session.commit()
-        return CatResponse.model_validate(updated_cat)
+
+        response = CatResponse.model_validate(updated_cat)
+        if cache := get_entity_cache(session):
+            cache.set(cat_cache_key(cat_id), response)
+        return response
+    except StaleDataError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cat with id {cat_id} was modified concurrently"
+        )
     except Exception as e:
         logger.error(f"Error updating cat: {e}")
         await session.rollback()
@@ -82,6 +265,7 @@ async def update_cat_service(
         )
 
 
+@traced
 async def delete_cat_service(session: AsyncSession, cat_id: int) -> None:
     """Delete a cat if it has no active missions."""
     if not (cat := await get_cat_by_id(session, cat_id)):
@@ -98,7 +282,11 @@ async def delete_cat_service(session: AsyncSession, cat_id: int) -> None:
 
     try:
         await delete_cat(session=session, cat=cat)
+        await refresh_mission_documents(session=session, cat_ids=[cat_id])
         await session.commit()
+
+        if cache := get_entity_cache(session):
+            cache.invalidate(cat_cache_key(cat_id))
     except Exception as e:
         logger.error(f"Error deleting cat: {e}")
         await session.rollback()
@@ -108,6 +296,7 @@ async def delete_cat_service(session: AsyncSession, cat_id: int) -> None:
         )
 
 
+@traced
 async def check_cat_availability_service(session: AsyncSession, cat_id: int) -> bool:
     """Check if cat is available for new missions."""
     if not await get_cat_by_id(session=session, cat_id=cat_id):
@@ -117,3 +306,38 @@ async def check_cat_availability_service(session: AsyncSession, cat_id: int) ->
         )
 
     return not await cat_has_active_mission(session=session, cat_id=cat_id)
+
+
+@traced
+async def revalidate_cat_breed_job(
+    session: AsyncSession, settings: Settings, payload: dict
+) -> None:
+    """Re-check the breed of a cat accepted while TheCatAPI was unreachable.
+
+    A breed TheCatAPI does not recognize is flagged with `breed_rejected`.
+    """
+    if not (cat := await get_cat_by_id(session=session, cat_id=payload["cat_id"])):
+        return
+
+    cat_id, breed = cat.id, cat.breed
+    # Release the connection before calling TheCatAPI
+    await session.rollback()
+
+    cat_api = CatAPIService(base_url=settings.cat_api_url)
+    breed_is_valid = await cat_api.check_breed(breed)
+
+    if breed_is_valid is None:
+        raise RuntimeError("TheCatAPI is still unreachable")
+    if breed_is_valid:
+        return
+
+    logger.warning(f"Cat {cat_id} was accepted with unknown breed '{breed}'")
+    # The cat may have been deleted while TheCatAPI was being called
+    if not (cat := await get_cat_by_id(session=session, cat_id=cat_id)):
+        return
+    await reject_cat_breed(session=session, cat=cat)
+    await refresh_mission_documents(session=session, cat_ids=[cat_id])
+    await session.commit()
+
+    if cache := get_entity_cache(session):
+        cache.invalidate(cat_cache_key(cat_id))
@@ -0,0 +1,118 @@
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.enums import ChangeEntity, ChangeOperation
+from core.tracing import traced
+from repositories.changes import (
+    CHANGE_TRACKED_MODELS,
+    get_change_horizon,
+    get_changes_after,
+    get_tombstones_after,
+)
+from schemas.cat import CatResponse
+from schemas.change import ChangeFeedResponse, ChangeResponse
+from schemas.mission import MissionSummaryResponse
+from schemas.target import TargetResponse
+
+CHANGE_SCHEMAS: dict[ChangeEntity, type[BaseModel]] = {
+    ChangeEntity.CAT: CatResponse,
+    ChangeEntity.MISSION: MissionSummaryResponse,
+    ChangeEntity.TARGET: TargetResponse,
+}
+
+
+def _parse_cursor(cursor: str | None) -> tuple[int, int]:
+    """Split a `<xid>.<seq>` cursor; no cursor starts from the beginning."""
+    if cursor is None:
+        return 0, 0
+
+    xid, _, seq = cursor.partition(".")
+    if not (xid.isdigit() and seq.isdigit()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid change cursor: {cursor}"
+        )
+    return int(xid), int(seq)
+
+
+def _change_operation(row) -> ChangeOperation:
+    """Classify a row as insert, update or tombstone."""
+    if getattr(row, "deleted_at", None) is not None:
+        return ChangeOperation.DELETE
+    if row.version == 1:
+        return ChangeOperation.INSERT
+    return ChangeOperation.UPDATE
+
+
+@traced
+async def get_changes_service(
+    session: AsyncSession, since: str | None = None, limit: int = 100
+) -> ChangeFeedResponse:
+    """Get cats, missions and targets changed after a cursor, in commit order.
+
+    Only rows written by transactions older than every in-flight transaction
+    are returned, so a change that commits late is never skipped by a cursor
+    that already moved past it.
+    """
+    change_xid, change_seq = _parse_cursor(since)
+    horizon = await get_change_horizon(session=session)
+
+    changes = []
+    for entity in CHANGE_TRACKED_MODELS:
+        changed = await get_changes_after(
+            session=session,
+            entity=entity,
+            change_xid=change_xid,
+            change_seq=change_seq,
+            horizon=horizon,
+            limit=limit + 1,
+        )
+        for row in changed:
+            op = _change_operation(row)
+            data = None
+            if op != ChangeOperation.DELETE:
+                data = CHANGE_SCHEMAS[entity].model_validate(row).model_dump(
+                    mode="json"
+                )
+            changes.append(
+                (row.change_xid, row.change_seq, entity, op, row.id, data)
+            )
+
+    # Rows archived or purged are gone; their tombstones stand in for them
+    tombstones = await get_tombstones_after(
+        session=session,
+        change_xid=change_xid,
+        change_seq=change_seq,
+        horizon=horizon,
+        limit=limit + 1,
+    )
+    changes.extend(
+        (
+            tombstone.change_xid,
+            tombstone.change_seq,
+            ChangeEntity(tombstone.entity),
+            ChangeOperation.DELETE,
+            tombstone.entity_id,
+            None,
+        )
+        for tombstone in tombstones
+    )
+    changes.sort(key=lambda change: change[:2])
+
+    page = [
+        ChangeResponse(
+            entity=entity,
+            op=op,
+            id=entity_id,
+            cursor=f"{row_xid}.{row_seq}",
+            data=data,
+        )
+        for row_xid, row_seq, entity, op, entity_id, data in changes[:limit]
+    ]
+
+    return ChangeFeedResponse(
+        changes=page,
+        next_cursor=page[-1].cursor if page else f"{change_xid}.{change_seq}",
+        has_more=len(changes) > limit,
+    )
@@ -0,0 +1,217 @@
+from itertools import batched
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import Settings
+from core.enums import JobTask
+from core.tracing import traced
+from models import Mission
+from repositories.document import (
+    delete_mission_documents,
+    get_document_mission_ids,
+    get_mission_ids_after,
+    get_missions_for_documents,
+    get_stored_mission_documents,
+    lock_mission_documents,
+    mark_mission_documents_stale,
+    save_mission_documents,
+)
+from repositories.job import enqueue_job
+from schemas.document import (
+    MissionDocumentRebuildResponse,
+    MissionDocumentVerifyResponse,
+)
+from schemas.mission import MissionResponse
+
+# Missions rebuilt or verified per transaction by default
+DOCUMENT_BATCH_SIZE = 500
+
+# Drifted mission IDs listed in a verification report
+MAX_DRIFTED_IDS = 100
+
+
+def render_mission_document(mission: Mission) -> dict:
+    """Render a mission as the document `GET /missions/{id}` returns."""
+    return MissionResponse.model_validate(mission).model_dump(mode="json")
+
+
+async def _rewrite_mission_documents(
+    session: AsyncSession, mission_ids: list[int]
+) -> tuple[int, int]:
+    """Render the documents of live missions and drop those of deleted ones.
+
+    Returns the number of documents written and removed.
+    """
+    await lock_mission_documents(session=session, mission_ids=mission_ids)
+    missions = await get_missions_for_documents(
+        session=session, mission_ids=mission_ids
+    )
+    await save_mission_documents(
+        session=session,
+        documents={
+            mission.id: render_mission_document(mission) for mission in missions
+        },
+    )
+    live_ids = {mission.id for mission in missions}
+    removed = await delete_mission_documents(
+        session=session,
+        mission_ids=[
+            mission_id for mission_id in mission_ids if mission_id not in live_ids
+        ],
+    )
+    return len(missions), removed
+
+
+@traced
+async def refresh_mission_documents(
+    session: AsyncSession,
+    mission_ids: list[int] | None = None,
+    cat_ids: list[int | None] | None = None,
+) -> None:
+    """Rewrite mission documents in the transaction of a write, before it commits.
+
+    Pass the missions written, directly or through their targets, and the cats
+    written, including by claiming or releasing them. Documents embed the cat,
+    so those of every mission of the cats are rewritten too.
+    """
+    document_ids = await get_document_mission_ids(
+        session=session,
+        mission_ids=mission_ids,
+        cat_ids=[cat_id for cat_id in cat_ids or [] if cat_id is not None],
+    )
+    if document_ids:
+        await _rewrite_mission_documents(session=session, mission_ids=document_ids)
+
+
+@traced
+async def defer_mission_document_refresh(
+    session: AsyncSession,
+    settings: Settings,
+    mission_ids: list[int] | None = None,
+    cat_ids: list[int | None] | None = None,
+) -> None:
+    """Leave the documents of a bulk write to be rewritten in the background.
+
+    Takes the same arguments as `refresh_mission_documents`, but only marks the
+    documents stale in one statement and enqueues a job to rewrite them, so
+    the write does not render every document it touches. Reads render the
+    missions from their rows until the job has run.
+    """
+    cat_ids = [cat_id for cat_id in cat_ids or [] if cat_id is not None]
+    if not mission_ids and not cat_ids:
+        return
+
+    await mark_mission_documents_stale(
+        session=session, mission_ids=mission_ids, cat_ids=cat_ids
+    )
+    await enqueue_job(
+        session=session,
+        task=JobTask.REFRESH_MISSION_DOCUMENTS,
+        payload={"mission_ids": mission_ids or [], "cat_ids": cat_ids},
+        max_attempts=settings.job_max_attempts,
+    )
+
+
+@traced
+async def refresh_mission_documents_job(
+    session: AsyncSession, settings: Settings, payload: dict
+) -> None:
+    """Rewrite the documents left stale by a bulk write, one batch at a time."""
+    document_ids = await get_document_mission_ids(
+        session=session,
+        mission_ids=payload["mission_ids"],
+        cat_ids=payload["cat_ids"],
+    )
+    for mission_ids in batched(document_ids, DOCUMENT_BATCH_SIZE):
+        await _rewrite_mission_documents(
+            session=session, mission_ids=list(mission_ids)
+        )
+        await session.commit()
+
+
+@traced
+async def rebuild_mission_documents_service(
+    session: AsyncSession, batch_size: int = DOCUMENT_BATCH_SIZE
+) -> MissionDocumentRebuildResponse:
+    """Rewrite the documents of all missions, one transaction per batch."""
+    rebuilt = removed = batches = 0
+    after_id = 0
+    while mission_ids := await get_mission_ids_after(
+        session=session, after_id=after_id, limit=batch_size
+    ):
+        written, dropped = await _rewrite_mission_documents(
+            session=session, mission_ids=mission_ids
+        )
+        await session.commit()
+        rebuilt += written
+        removed += dropped
+        batches += 1
+        after_id = mission_ids[-1]
+
+    logger.info(f"Rebuilt {rebuilt} mission documents and removed {removed}")
+    return MissionDocumentRebuildResponse(
+        rebuilt=rebuilt, removed=removed, batches=batches
+    )
+
+
+@traced
+async def verify_mission_documents_service(
+    session: AsyncSession, batch_size: int = DOCUMENT_BATCH_SIZE
+) -> MissionDocumentVerifyResponse:
+    """Compare every mission document with a fresh rendering of its mission.
+
+    Each batch is read from one snapshot, so writes committed meanwhile are not
+    reported as drift. Nothing is changed; rebuild to repair.
+    """
+    checked = missing = stale = orphaned = 0
+    drifted_ids: list[int] = []
+    after_id = 0
+    while True:
+        await session.connection(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
+        mission_ids = await get_mission_ids_after(
+            session=session, after_id=after_id, limit=batch_size
+        )
+        if not mission_ids:
+            await session.rollback()
+            break
+
+        missions = await get_missions_for_documents(
+            session=session, mission_ids=mission_ids
+        )
+        stored = await get_stored_mission_documents(
+            session=session, mission_ids=mission_ids
+        )
+
+        drifted = []
+        for mission in missions:
+            document = stored.pop(mission.id, None)
+            if document is None:
+                missing += 1
+                drifted.append(mission.id)
+            elif document != render_mission_document(mission):
+                stale += 1
+                drifted.append(mission.id)
+        await session.rollback()
+        # Whatever is left belongs to deleted missions
+        orphaned += len(stored)
+        drifted.extend(stored)
+
+        checked += len(missions)
+        drifted_ids.extend(sorted(drifted)[:MAX_DRIFTED_IDS - len(drifted_ids)])
+        after_id = mission_ids[-1]
+
+    if missing or stale or orphaned:
+        logger.warning(
+            f"Mission documents drifted: {missing} missing, {stale} stale, "
+            f"{orphaned} orphaned of {checked} checked"
+        )
+    return MissionDocumentVerifyResponse(
+        checked=checked,
+        missing=missing,
+        stale=stale,
+        orphaned=orphaned,
+        drifted_ids=drifted_ids,
+    )
@@ -0,0 +1,240 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import asyncpg
+from fastapi import HTTPException, status
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import Settings
+from core.tracing import traced
+from repositories.changes import get_change_horizon
+from repositories.event import (
+    MISSION_EVENTS_CHANNEL,
+    EventPosition,
+    delete_mission_events_before,
+    get_mission_events_after,
+    mission_event_position,
+    serialize_mission_event,
+)
+
+# Events read from the table per query
+EVENT_BATCH_SIZE = 100
+
+
+class EventSubscription:
+    """A single client's bounded view of the change feed."""
+
+    def __init__(self, max_size: int) -> None:
+        self.queue: asyncio.Queue[tuple[EventPosition, dict]] = asyncio.Queue(
+            maxsize=max_size
+        )
+        self.overflowed = asyncio.Event()
+
+    def push(self, event: tuple[EventPosition, dict]) -> None:
+        """Queue an event, flagging the subscription if the client fell behind."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed.set()
+
+
+class MissionEventBroker:
+    """Releases committed mission events to in-process subscribers, in order.
+
+    Each worker holds one LISTEN connection, whose notifications only wake the
+    broker up. It then reads new events from the table and releases those of
+    transactions below the change horizon, ordered by transaction and ID. An
+    event recorded after a transaction that has yet to commit is held back
+    until that transaction ends, so a client resuming from the last event it
+    received never skips one that committed late.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        session_factory: async_sessionmaker[AsyncSession],
+        queue_size: int,
+        reconnect_delay: float = 1.0,
+        hold_back_delay: float = 0.1,
+    ) -> None:
+        self.dsn = dsn
+        self.session_factory = session_factory
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self.hold_back_delay = hold_back_delay
+        self.subscriptions: set[EventSubscription] = set()
+        self.position: EventPosition | None = None
+        self.wakeup = asyncio.Event()
+
+    def subscribe(self) -> EventSubscription:
+        """Register a new subscription."""
+        subscription = EventSubscription(max_size=self.queue_size)
+        self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription."""
+        self.subscriptions.discard(subscription)
+
+    def _on_notify(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        self.wakeup.set()
+
+    async def run(self) -> None:
+        """Listen for notifications and release events until cancelled."""
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(self._listen())
+            tasks.create_task(self._release_events())
+
+    async def _listen(self) -> None:
+        """Keep a LISTEN connection open, reconnecting when it drops."""
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.error(f"Change feed listener failed to connect: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _, closed=closed: closed.set())
+            try:
+                await connection.add_listener(MISSION_EVENTS_CHANNEL, self._on_notify)
+                # Catch up with events recorded while disconnected
+                self.wakeup.set()
+                await closed.wait()
+                logger.warning("Change feed listener connection lost, reconnecting")
+            finally:
+                await connection.close()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _release_events(self) -> None:
+        """Release new events on every wakeup, retrying while some are held back."""
+        while True:
+            self.wakeup.clear()
+            try:
+                held_back = await self._release()
+                delay = self.hold_back_delay if held_back else None
+            except Exception as e:
+                logger.error(f"Change feed failed to read events: {e}")
+                delay = self.reconnect_delay
+
+            if delay is None:
+                await self.wakeup.wait()
+            else:
+                await asyncio.sleep(delay)
+
+    async def _release(self) -> bool:
+        """Publish the events below the horizon; return whether any are held back."""
+        async with self.session_factory() as session:
+            horizon = await get_change_horizon(session=session)
+            if self.position is None:
+                # Start with the transactions still in flight
+                self.position = (horizon, 0)
+
+            while True:
+                events = await get_mission_events_after(
+                    session=session, position=self.position, limit=EVENT_BATCH_SIZE
+                )
+                released = [event for event in events if event.change_xid < horizon]
+                for event in released:
+                    position = mission_event_position(event)
+                    payload = serialize_mission_event(event)
+                    for subscription in self.subscriptions:
+                        subscription.push((position, payload))
+                if released:
+                    self.position = mission_event_position(released[-1])
+
+                if len(released) < len(events):
+                    return True
+                if len(events) < EVENT_BATCH_SIZE:
+                    return False
+
+
+def parse_event_cursor(cursor: str) -> EventPosition:
+    """Parse a `<xid>.<id>` event cursor sent back as `Last-Event-ID`.
+
+    A bare event ID, as sent before cursors carried the transaction, resumes
+    after that event among the events recorded before them.
+    """
+    if cursor.isdigit():
+        return 0, int(cursor)
+
+    xid, _, event_id = cursor.partition(".")
+    if not (xid.isdigit() and event_id.isdigit()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid event cursor: {cursor}"
+        )
+    return int(xid), int(event_id)
+
+
+def format_sse(event: dict) -> str:
+    """Format an event as a server-sent events frame."""
+    return (
+        f"id: {event['cursor']}\nevent: {event['type']}\n"
+        f"data: {json.dumps(event)}\n\n"
+    )
+
+
+async def stream_mission_events(
+    broker: MissionEventBroker,
+    session_factory: async_sessionmaker[AsyncSession],
+    position: EventPosition | None,
+    keepalive_interval: float,
+) -> AsyncIterator[str]:
+    """Stream change feed events, replaying anything after `position` first.
+
+    Replay reads the table in the broker's order and up to the same horizon,
+    so together with the events the broker releases afterwards nothing is
+    missed. The stream ends when the client falls more than the broker's
+    `queue_size` events behind; the client then reconnects with
+    `Last-Event-ID` and catches up from the event table instead of growing an
+    unbounded buffer on the server.
+    """
+    subscription = broker.subscribe()
+    try:
+        while position is not None:
+            async with session_factory() as session:
+                horizon = await get_change_horizon(session=session)
+                events = await get_mission_events_after(
+                    session=session, position=position, limit=EVENT_BATCH_SIZE
+                )
+            replayed = [event for event in events if event.change_xid < horizon]
+            for event in replayed:
+                yield format_sse(serialize_mission_event(event))
+            if replayed:
+                position = mission_event_position(replayed[-1])
+            # Held back events are released by the broker once they are safe
+            if len(replayed) < EVENT_BATCH_SIZE:
+                break
+
+        while not subscription.overflowed.is_set():
+            try:
+                event_position, event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=keepalive_interval
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if position is not None and event_position <= position:
+                continue
+            yield format_sse(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@traced
+async def purge_mission_events_service(
+    session: AsyncSession, settings: Settings
+) -> None:
+    """Drop change feed events past the retention window."""
+    await delete_mission_events_before(
+        session=session, age=timedelta(hours=settings.event_retention_hours)
+    )
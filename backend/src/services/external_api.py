@@ -1,20 +1,28 @@
-import httpx
 from loguru import logger
 
-from core.config import settings
+from core.tracing import create_http_transport
 
 
 class CatAPIService:
     """Service for interacting with TheCatAPI."""
 
-    def __init__(self) -> None:
-        self.base_url = settings.cat_api_url
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
         self.timeout = 10.0
 
     async def validate_breed(self, breed: str) -> bool:
-        """Validate cat breed using TheCatAPI."""
+        """Validate cat breed using TheCatAPI, accepting it if the API is down."""
+        return await self.check_breed(breed) is not False
+
+    async def check_breed(self, breed: str) -> bool | None:
+        """Check cat breed using TheCatAPI; None if the API could not be reached."""
+        # Imported on first use: httpx is the heaviest import on the startup path
+        import httpx
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=create_http_transport()
+            ) as client:
                 response = await client.get(self.base_url)
                 response.raise_for_status()
 
@@ -34,20 +42,24 @@ class CatAPIService:
 
         except httpx.TimeoutException:
             logger.error(f"Timeout while validating breed '{breed}' with TheCatAPI")
-            return True
+            return None
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error while validating breed '{breed}': {e}")
-            return True
+            return None
 
         except Exception as e:
             logger.error(f"Unexpected error while validating breed '{breed}': {e}")
-            return True
+            return None
 
     async def get_all_breeds(self) -> list[dict]:
         """Get all available cat breeds."""
+        import httpx
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=create_http_transport()
+            ) as client:
                 response = await client.get(self.base_url)
                 response.raise_for_status()
                 return response.json()
@@ -0,0 +1,80 @@
+import hashlib
+from datetime import timedelta
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.tracing import traced
+from models import IdempotencyKey
+from repositories.idempotency import (
+    claim_idempotency_key,
+    delete_expired_idempotency_keys,
+    get_idempotency_key,
+    save_idempotency_response,
+)
+
+
+def request_fingerprint(request_data: BaseModel) -> str:
+    """Hash a validated request body so key reuse with other payloads is caught."""
+    return hashlib.sha256(request_data.model_dump_json().encode()).hexdigest()
+
+
+def _stored_response(record: IdempotencyKey, fingerprint: str) -> dict:
+    if record.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used with a different request body"
+        )
+    return record.response_body
+
+
+@traced
+async def find_idempotent_response(
+    session: AsyncSession, scope: str, key: str, fingerprint: str
+) -> dict | None:
+    """Get the stored response for a replayed key without claiming it."""
+    if not (record := await get_idempotency_key(session=session, scope=scope, key=key)):
+        return None
+    return _stored_response(record=record, fingerprint=fingerprint)
+
+
+@traced
+async def claim_or_replay(
+    session: AsyncSession, scope: str, key: str, fingerprint: str, ttl: timedelta
+) -> dict | None:
+    """Claim a key for this transaction or return the response stored for it."""
+    record = await claim_idempotency_key(
+        session=session,
+        scope=scope,
+        key=key,
+        fingerprint=fingerprint,
+        ttl=ttl,
+    )
+    if record is None:
+        return None
+    return _stored_response(record=record, fingerprint=fingerprint)
+
+
+@traced
+async def store_idempotent_response(
+    session: AsyncSession,
+    scope: str,
+    key: str,
+    response: BaseModel,
+    status_code: int = status.HTTP_201_CREATED,
+) -> None:
+    """Store a response for replay; commits together with the operation itself."""
+    await save_idempotency_response(
+        session=session,
+        scope=scope,
+        key=key,
+        status_code=status_code,
+        response_body=response.model_dump(mode="json"),
+    )
+
+
+@traced
+async def purge_idempotency_keys_service(session: AsyncSession) -> None:
+    """Evict idempotency keys past their TTL."""
+    await delete_expired_idempotency_keys(session=session)
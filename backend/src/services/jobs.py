@@ -0,0 +1,108 @@
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import Settings
+from core.enums import JobTask
+from models import Job
+from repositories.job import claim_jobs, complete_job, fail_job
+from services.cat import revalidate_cat_breed_job
+from services.document import refresh_mission_documents_job
+
+JobHandler = Callable[[AsyncSession, Settings, dict], Awaitable[None]]
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    JobTask.REVALIDATE_CAT_BREED.value: revalidate_cat_breed_job,
+    JobTask.REFRESH_MISSION_DOCUMENTS.value: refresh_mission_documents_job,
+}
+
+
+def retry_delay(attempts: int, base_delay: float) -> timedelta:
+    """Exponential backoff with jitter for the given attempt number."""
+    delay = base_delay * 2 ** (attempts - 1)
+    return timedelta(seconds=delay * random.uniform(0.5, 1.5))  # noqa: S311
+
+
+class JobRunner:
+    """Executes outbox jobs in the background with bounded concurrency.
+
+    Jobs are claimed with `FOR UPDATE SKIP LOCKED`, so any number of workers
+    across instances can drain the same outbox without double-processing.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], settings: Settings
+    ) -> None:
+        self.session_factory = session_factory
+        self.settings = settings
+        self.concurrency = settings.job_concurrency
+        self.running: set[asyncio.Task[None]] = set()
+
+    async def run(self) -> None:
+        """Poll the outbox until cancelled."""
+        try:
+            while True:
+                if len(self.running) >= self.concurrency:
+                    await asyncio.wait(
+                        self.running, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    continue
+
+                try:
+                    claimed = await self._claim()
+                except Exception as e:
+                    logger.error(f"Failed to claim background jobs: {e}")
+                    claimed = 0
+
+                if not claimed:
+                    await asyncio.sleep(self.settings.job_poll_interval)
+        finally:
+            for task in self.running:
+                task.cancel()
+
+    async def _claim(self) -> int:
+        async with self.session_factory() as session:
+            jobs = await claim_jobs(
+                session=session,
+                limit=self.concurrency - len(self.running),
+                lease=timedelta(seconds=self.settings.job_lease_seconds),
+            )
+            await session.commit()
+
+        for job in jobs:
+            task = asyncio.create_task(self._execute(job), name=f"job-{job.id}")
+            self.running.add(task)
+            task.add_done_callback(self.running.discard)
+        return len(jobs)
+
+    async def _execute(self, job: Job) -> None:
+        try:
+            if not (handler := JOB_HANDLERS.get(job.task)):
+                raise LookupError(f"No handler registered for task '{job.task}'")
+
+            async with self.session_factory() as session:
+                await handler(session, self.settings, job.payload)
+                await complete_job(session=session, job_id=job.id)
+                await session.commit()
+        except Exception as e:
+            retry_in = (
+                retry_delay(job.attempts, self.settings.job_retry_base_delay)
+                if job.attempts < job.max_attempts
+                else None
+            )
+            logger.error(
+                f"Job {job.id} ({job.task}) failed on attempt {job.attempts}: {e}"
+            )
+            try:
+                async with self.session_factory() as session:
+                    await fail_job(
+                        session=session, job_id=job.id, error=str(e), retry_in=retry_in
+                    )
+                    await session.commit()
+            except Exception as fail_error:
+                # The lease expires and the job is claimed again
+                logger.error(f"Failed to record failure of job {job.id}: {fail_error}")
@@ -1,29 +1,129 @@
+import asyncio
+
+import json
+from datetime import timedelta
+
 from fastapi import HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from loguru import logger
+from sqlalchemy.orm.exc import StaleDataError
 
-from repositories.cat import cat_has_active_mission, get_cat_by_id
+from core.cache import get_entity_cache
+from core.config import Settings
+from core.enums import MissionEventType, MissionListShape, TargetNotes
+from core.loader import BatchLoader
+from core.params import MAX_IDS_PER_REQUEST
+from core.tracing import traced
+from db.session import open_db_session
+from models import Mission, MissionArchive, Target, TargetArchive
+from repositories.archive import (
+    get_all_archived_missions,
+    get_archived_missions_by_ids,
+)
+from repositories.cat import (
+    claim_cat_for_mission,
+    claim_cats_for_missions,
+    get_available_cat_ids,
+    get_cat_by_id,
+    release_cat_from_mission,
+    release_cats_from_missions,
+)
 from repositories.mission import (
     assign_cat_to_mission,
+    assign_cats_to_missions,
+    count_purgeable_missions,
     create_mission,
+    delete_missions_by_ids,
+    get_assignable_mission_ids,
+    get_missions_by_ids,
+    lock_purgeable_mission_ids,
+    unassign_cat_from_mission,
     delete_mission, get_all_missions,
     get_mission_by_id, is_mission_assigned, update_mission_completion_status,
 )
-from repositories.target import get_target_by_id, update_target
-from schemas.mission import MissionCreate, MissionListResponse, MissionResponse
-from schemas.target import TargetResponse, TargetUpdate
+from repositories.changes import record_mission_removals
+from repositories.document import (
+    get_mission_document_page,
+    get_mission_documents,
+    save_mission_documents,
+)
+from repositories.event import record_mission_event, record_mission_events
+from repositories.target import (
+    NOTES_PREVIEW_LENGTH,
+    get_target_by_id,
+    update_target,
+)
+from schemas.cat import CatResponse
+from schemas.mission import (
+    MissionAssignment,
+    MissionAutoAssignRequest,
+    MissionAutoAssignResponse,
+    MissionCreate,
+    MissionListResponse,
+    MissionPurgeRequest,
+    MissionPurgeResponse,
+    MissionResponse,
+    MissionSummaryResponse,
+)
+from schemas.target import TargetResponse, TargetSummaryResponse, TargetUpdate
+from services.cat import cat_cache_key
+from services.document import (
+    defer_mission_document_refresh,
+    refresh_mission_documents,
+)
+from services.idempotency import (
+    claim_or_replay,
+    request_fingerprint,
+    store_idempotent_response,
+)
+
+CREATE_MISSION_SCOPE = "missions.create"
+MISSION_RELATIONS = {"cat", "targets"}
 
 
+@traced
 async def create_mission_service(
-    session: AsyncSession, mission_data: MissionCreate
+    session: AsyncSession,
+    settings: Settings,
+    mission_data: MissionCreate,
+    idempotency_key: str | None = None,
 ) -> MissionResponse:
     """Create a new mission with targets."""
+    if idempotency_key and (
+        stored := await claim_or_replay(
+            session=session,
+            scope=CREATE_MISSION_SCOPE,
+            key=idempotency_key,
+            fingerprint=request_fingerprint(mission_data),
+            ttl=timedelta(hours=settings.idempotency_key_ttl_hours),
+        )
+    ):
+        return MissionResponse.model_validate(stored)
+
     try:
         mission = await create_mission(session=session, mission_data=mission_data)
-        await session.commit()
+        await record_mission_event(
+            session=session,
+            event_type=MissionEventType.MISSION_CREATED,
+            mission_id=mission.id,
+        )
 
         mission = await get_mission_by_id(session=session, mission_id=mission.id)
-        return MissionResponse.model_validate(mission)
+        response = MissionResponse.model_validate(mission)
+        await save_mission_documents(
+            session=session, documents={mission.id: response.model_dump(mode="json")}
+        )
+
+        if idempotency_key:
+            await store_idempotent_response(
+                session=session,
+                scope=CREATE_MISSION_SCOPE,
+                key=idempotency_key,
+                response=response,
+            )
+
+        await session.commit()
+        return response
     except Exception as e:
         logger.error(f"Error creating mission: {e}")
         await session.rollback()
@@ -33,32 +133,300 @@ async def create_mission_service(
         )
 
 
+def _invalidate_cats(session: AsyncSession, cat_ids: list[int | None]) -> None:
+    """Drop cached cats whose active mission changed in a committed write."""
+    if cache := get_entity_cache(session):
+        for cat_id in cat_ids:
+            if cat_id is not None:
+                cache.invalidate(cat_cache_key(cat_id))
+
+
+@traced
+async def _get_missions_by_ids(
+    session: AsyncSession,
+    mission_ids: list[int],
+    include_targets: bool = True,
+    include_cat: bool = True,
+    notes: TargetNotes = TargetNotes.FULL,
+) -> dict[int, Mission | MissionArchive]:
+    """Get missions by ID from the live table, then the archive for the rest."""
+    missions: dict[int, Mission | MissionArchive] = {
+        mission.id: mission
+        for mission in await get_missions_by_ids(
+            session=session,
+            mission_ids=mission_ids,
+            include_targets=include_targets,
+            include_cat=include_cat,
+            notes=notes,
+        )
+    }
+    missing = [mission_id for mission_id in mission_ids if mission_id not in missions]
+    if missing:
+        missions.update(
+            (mission.id, mission)
+            for mission in await get_archived_missions_by_ids(
+                session=session,
+                mission_ids=missing,
+                include_targets=include_targets,
+                include_cat=include_cat,
+                notes=notes,
+            )
+        )
+    return missions
+
+
+@traced
+async def _get_mission_documents(
+    session: AsyncSession, mission_ids: list[int]
+) -> dict[int, str]:
+    """Get missions by ID as encoded `MissionResponse` JSON.
+
+    Stored documents are returned as they are. Archived missions, and live ones
+    whose document has not been built yet, are rendered from their rows.
+    """
+    documents = await get_mission_documents(session=session, mission_ids=mission_ids)
+    if missing := [
+        mission_id for mission_id in mission_ids if mission_id not in documents
+    ]:
+        missions = await _get_missions_by_ids(session=session, mission_ids=missing)
+        documents.update(
+            (mission_id, MissionResponse.model_validate(mission).model_dump_json())
+            for mission_id, mission in missions.items()
+        )
+    return documents
+
+
+def create_mission_loader(
+    session_factory: async_sessionmaker[AsyncSession], statement_timeout: float
+) -> BatchLoader[int, str]:
+    """Build the worker's loader that batches concurrent single-mission lookups."""
+
+    async def load_missions(mission_ids: list[int]) -> dict[int, str]:
+        async with open_db_session(
+            session_factory=session_factory, statement_timeout=statement_timeout
+        ) as session:
+            return await _get_mission_documents(
+                session=session, mission_ids=mission_ids
+            )
+
+    return BatchLoader(load_many=load_missions, max_batch_size=MAX_IDS_PER_REQUEST)
+
+
+@traced
 async def get_mission_service(
-    session: AsyncSession, mission_id: int
-) -> MissionResponse:
-    """Get mission by ID."""
-    if not (mission := await get_mission_by_id(session=session, mission_id=mission_id)):
+    session: AsyncSession,
+    mission_id: int,
+    loader: BatchLoader[int, str] | None = None,
+) -> str:
+    """Get mission by ID as encoded JSON, falling back to the archive.
+
+    Live missions are read from their stored document in a single-row lookup.
+    With `loader`, concurrent lookups of different missions share one query.
+    """
+    if loader is not None:
+        document = await loader.load(mission_id)
+    else:
+        documents = await _get_mission_documents(
+            session=session, mission_ids=[mission_id]
+        )
+        document = documents.get(mission_id)
+    if document is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Mission with id {mission_id} not found"
         )
 
-    return MissionResponse.model_validate(mission)
+    return document
+
+
+def _parse_selection(
+    value: str | None, allowed: set[str], name: str
+) -> set[str] | None:
+    """Parse a comma-separated query parameter, rejecting unknown names."""
+    if value is None:
+        return None
+
+    selection = {item.strip() for item in value.split(",") if item.strip()}
+    if unknown := selection - allowed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Unknown {name}: {', '.join(sorted(unknown))}. "
+                f"Allowed: {', '.join(sorted(allowed))}"
+            )
+        )
+    return selection
+
+
+def _target_payload(target: Target | TargetArchive, notes: TargetNotes) -> dict:
+    """Serialize a target with its notes in full, as a preview, or without them."""
+    if notes == TargetNotes.FULL:
+        return TargetResponse.model_validate(target).model_dump(mode="json")
+
+    item = TargetSummaryResponse.model_validate(target).model_dump(mode="json")
+    if notes == TargetNotes.PREVIEW:
+        # The preview holds one extra character when the notes are longer
+        preview = target.notes_preview
+        item["notes"] = preview[:NOTES_PREVIEW_LENGTH] if preview else preview
+        item["notes_truncated"] = len(preview or "") > NOTES_PREVIEW_LENGTH
+    return item
+
+
+@traced
+async def _get_mission_list_document(
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    ids: list[int] | None = None,
+) -> str:
+    """Assemble the default mission list as `MissionListResponse` JSON.
+
+    The stored documents of the page are joined as they are, without loading
+    or validating any mission.
+    """
+    missing = []
+    if ids is not None:
+        found = await _get_mission_documents(session=session, mission_ids=ids)
+        documents = [found[mission_id] for mission_id in ids if mission_id in found]
+        missing = [mission_id for mission_id in ids if mission_id not in found]
+        total = len(documents)
+    else:
+        page, total = await get_mission_document_page(
+            session=session, skip=skip, limit=limit
+        )
+        rendered = {}
+        if unbuilt := [mission_id for mission_id, document in page if document is None]:
+            rendered = await _get_mission_documents(
+                session=session, mission_ids=unbuilt
+            )
+        documents = [
+            document or rendered[mission_id]
+            for mission_id, document in page
+            if document or mission_id in rendered
+        ]
+
+    return (
+        f'{{"missions":[{",".join(documents)}],"total":{total},'
+        f'"missing":{json.dumps(missing)}}}'
+    )
 
 
+@traced
 async def get_missions_service(
-    session: AsyncSession, skip: int = 0, limit: int = 100
-) -> MissionListResponse:
-    """Get all missions with pagination."""
-    missions, total = await get_all_missions(session=session, skip=skip, limit=limit)
-
-    return MissionListResponse(
-        missions=[MissionResponse.model_validate(mission) for mission in missions],
-        total=total
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    include: str | None = None,
+    fields: str | None = None,
+    shape: MissionListShape = MissionListShape.NESTED,
+    archived: bool = False,
+    ids: list[int] | None = None,
+    notes: TargetNotes = TargetNotes.FULL,
+) -> MissionListResponse | dict | str:
+    """Get all missions with pagination.
+
+    Without `include`, `fields`, a non-default `shape` or `notes` the full
+    nested response is returned, for live missions as JSON assembled from
+    their stored documents. Otherwise a plain payload restricted to the
+    requested relations and fields is built, and relations that are not
+    included are not loaded at all. Target notes are then returned in full, as
+    a preview or not at all, and only as much of them as needed is read. With
+    `archived` the archive is listed instead of live missions. With `ids`
+    exactly those missions are returned, live or archived, in the requested
+    order, and the ones not found are listed in `missing`.
+    """
+    relations = _parse_selection(
+        value=include, allowed=MISSION_RELATIONS, name="include"
+    )
+    mission_fields = _parse_selection(
+        value=fields,
+        allowed=set(MissionSummaryResponse.model_fields),
+        name="fields",
     )
+    include_targets = relations is None or "targets" in relations
+    include_cat = relations is None or "cat" in relations
+
+    is_default_shape = shape == MissionListShape.NESTED
+    is_default_selection = relations is None and mission_fields is None
+    is_default = is_default_selection and is_default_shape and notes == TargetNotes.FULL
+    if is_default and not archived:
+        return await _get_mission_list_document(
+            session=session, skip=skip, limit=limit, ids=ids
+        )
 
+    missing = None
+    if ids is not None:
+        found = await _get_missions_by_ids(
+            session=session,
+            mission_ids=ids,
+            include_targets=include_targets,
+            include_cat=include_cat,
+            notes=notes,
+        )
+        missions = [found[mission_id] for mission_id in ids if mission_id in found]
+        missing = [mission_id for mission_id in ids if mission_id not in found]
+        total = len(missions)
+    else:
+        list_missions = get_all_archived_missions if archived else get_all_missions
+        missions, total = await list_missions(
+            session=session,
+            skip=skip,
+            limit=limit,
+            include_targets=include_targets,
+            include_cat=include_cat,
+            notes=notes,
+        )
+
+    if is_default:
+        return MissionListResponse(
+            missions=[MissionResponse.model_validate(mission) for mission in missions],
+            total=total,
+            missing=missing or [],
+        )
+
+    sideload = shape == MissionListShape.SIDELOADED
+    if sideload and mission_fields is not None:
+        mission_fields.add("cat_id")
+
+    items = []
+    cats: dict[int, dict] = {}
+    for mission in missions:
+        item = MissionSummaryResponse.model_validate(mission).model_dump(
+            mode="json", include=mission_fields
+        )
+        if include_targets:
+            item["targets"] = [
+                _target_payload(target=target, notes=notes)
+                for target in mission.targets
+            ]
+        if include_cat and mission.cat is not None:
+            if sideload:
+                if mission.cat.id not in cats:
+                    cats[mission.cat.id] = CatResponse.model_validate(
+                        mission.cat
+                    ).model_dump(mode="json")
+            else:
+                item["cat"] = CatResponse.model_validate(mission.cat).model_dump(
+                    mode="json"
+                )
+        elif include_cat and not sideload:
+            item["cat"] = None
+        items.append(item)
+
+    payload = {"missions": items, "total": total}
+    if sideload:
+        payload["cats"] = list(cats.values())
+    if missing is not None:
+        payload["missing"] = missing
+    return payload
+
+
+@traced
 async def assign_cat_to_mission_service(
-    session: AsyncSession, mission_id: int, cat_id: int
+    session: AsyncSession,
+    mission_id: int,
+    cat_id: int,
+    expected_version: int | None = None,
 ) -> MissionResponse:
     """Assign a cat to a mission."""
     if not (mission := await get_mission_by_id(session=session, mission_id=mission_id)):
@@ -67,6 +435,12 @@ async def assign_cat_to_mission_service(
             detail=f"Mission with id {mission_id} not found"
         )
 
+    if expected_version is not None and mission.version != expected_version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mission with id {mission_id} is at version {mission.version}"
+        )
+
     if mission.is_complete:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -79,22 +453,45 @@ async def assign_cat_to_mission_service(
             detail=f"Cat with id {cat_id} not found"
         )
 
-    if await cat_has_active_mission(session=session, cat_id=cat_id):
+    if not await claim_cat_for_mission(
+        session=session, cat_id=cat_id, mission_id=mission_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cat already has an active mission"
         )
 
     try:
+        previous_cat_id = mission.cat_id
+        if previous_cat_id is not None:
+            await release_cat_from_mission(
+                session=session, cat_id=previous_cat_id, mission_id=mission_id
+            )
+
         updated_mission = await assign_cat_to_mission(
             session=session, mission=mission, cat_id=cat_id
         )
+        await record_mission_event(
+            session=session,
+            event_type=MissionEventType.CAT_ASSIGNED,
+            mission_id=updated_mission.id,
+            cat_id=cat_id,
+        )
+        await refresh_mission_documents(
+            session=session, mission_ids=[mission_id], cat_ids=[cat_id, previous_cat_id]
+        )
         await session.commit()
+        _invalidate_cats(session=session, cat_ids=[cat_id, previous_cat_id])
 
-        updated_mission = await get_mission_by_id(
-            session=session, mission_id=updated_mission.id
-        )
+        # The refresh after assigning already reloaded the eagerly loaded cat
+        # and targets, and nothing is expired on commit, so no reload is needed
         return MissionResponse.model_validate(updated_mission)
+    except StaleDataError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mission with id {mission_id} was modified concurrently"
+        )
     except Exception as e:
         logger.error(f"Error assigning cat to mission: {e}")
         await session.rollback()
@@ -103,6 +500,142 @@ async def assign_cat_to_mission_service(
             detail="Failed to assign cat to mission"
         )
 
+
+@traced
+async def auto_assign_missions_service(
+    session: AsyncSession, settings: Settings, request: MissionAutoAssignRequest
+) -> MissionAutoAssignResponse:
+    """Assign available cats to open missions in bulk.
+
+    Missions carry no requirements of their own, so any eligible cat fits any
+    mission and pairing the oldest missions with the best ranked cats is already
+    an optimal matching. Two locking queries fetch both sides, and the whole
+    plan is applied with one UPDATE per table and one event INSERT. Mission
+    documents are marked stale and rewritten by a background job.
+    """
+    try:
+        mission_ids = await get_assignable_mission_ids(
+            session=session, limit=request.max_assignments
+        )
+        cat_ids = []
+        if mission_ids:
+            cat_ids = await get_available_cat_ids(
+                session=session,
+                limit=len(mission_ids),
+                prefer=request.prefer,
+                min_experience=request.min_experience,
+                max_salary=request.max_salary,
+                breeds=request.breeds,
+            )
+        unassigned = len(mission_ids) - len(cat_ids)
+        mission_ids = mission_ids[:len(cat_ids)]
+
+        if mission_ids and not request.dry_run:
+            await assign_cats_to_missions(
+                session=session, mission_ids=mission_ids, cat_ids=cat_ids
+            )
+            await claim_cats_for_missions(
+                session=session, mission_ids=mission_ids, cat_ids=cat_ids
+            )
+            await record_mission_events(
+                session=session,
+                event_type=MissionEventType.CAT_ASSIGNED,
+                mission_ids=mission_ids,
+                cat_ids=cat_ids,
+            )
+            await defer_mission_document_refresh(
+                session=session,
+                settings=settings,
+                mission_ids=mission_ids,
+                cat_ids=cat_ids,
+            )
+            await session.commit()
+            _invalidate_cats(session=session, cat_ids=cat_ids)
+        else:
+            # Release the row locks taken while planning
+            await session.rollback()
+    except Exception as e:
+        logger.error(f"Error auto-assigning missions: {e}")
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to auto-assign missions"
+        )
+
+    return MissionAutoAssignResponse(
+        assignments=[
+            MissionAssignment(mission_id=mission_id, cat_id=cat_id)
+            for mission_id, cat_id in zip(mission_ids, cat_ids, strict=True)
+        ],
+        assigned=len(mission_ids),
+        unassigned=unassigned,
+        dry_run=request.dry_run,
+    )
+
+
+@traced
+async def purge_missions_service(
+    session: AsyncSession, settings: Settings, request: MissionPurgeRequest
+) -> MissionPurgeResponse:
+    """Permanently delete missions matching a filter, one transaction per batch.
+
+    Each batch locks its missions with SKIP LOCKED, so writers holding one of
+    them are never waited on, clears the active mission of their cats and
+    deletes them by ID; targets follow through the foreign key cascade. Short
+    transactions and a pause between them keep locks brief and let replicas
+    keep up. Purged missions and their targets leave tombstones for the change
+    feed.
+    """
+    batch_size = request.batch_size or settings.purge_batch_size
+    if request.dry_run:
+        try:
+            purgeable = await count_purgeable_missions(session=session, request=request)
+        finally:
+            await session.rollback()
+        return MissionPurgeResponse(purged=purgeable, batches=0, dry_run=True)
+
+    purged = batches = 0
+    try:
+        while True:
+            mission_ids = await lock_purgeable_mission_ids(
+                session=session, request=request, limit=batch_size
+            )
+            if not mission_ids:
+                await session.rollback()
+                break
+
+            cat_ids = await release_cats_from_missions(
+                session=session, mission_ids=mission_ids
+            )
+            await record_mission_removals(session=session, mission_ids=mission_ids)
+            purged += await delete_missions_by_ids(
+                session=session, mission_ids=mission_ids
+            )
+            # Documents of purged missions go through the cascade as well
+            await defer_mission_document_refresh(
+                session=session, settings=settings, cat_ids=cat_ids
+            )
+            await session.commit()
+            _invalidate_cats(session=session, cat_ids=cat_ids)
+            batches += 1
+
+            if len(mission_ids) < batch_size:
+                break
+            await asyncio.sleep(settings.purge_batch_pause)
+    except Exception as e:
+        logger.error(f"Error purging missions after {purged} deleted: {e}")
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to purge missions after {purged} were deleted"
+        )
+
+    if purged:
+        logger.info(f"Purged {purged} missions in {batches} batches")
+    return MissionPurgeResponse(purged=purged, batches=batches, dry_run=False)
+
+
+@traced
 async def delete_mission_service(session: AsyncSession, mission_id: int) -> None:
     """Delete a mission if it's not assigned to a cat."""
     if not (mission := await get_mission_by_id(session=session, mission_id=mission_id)):
@@ -119,6 +652,7 @@ async def delete_mission_service(session: AsyncSession, mission_id: int) -> None
 
     try:
         await delete_mission(session=session, mission=mission)
+        await refresh_mission_documents(session=session, mission_ids=[mission_id])
         await session.commit()
     except Exception as e:
         logger.error(f"Error deleting mission: {e}")
@@ -129,8 +663,12 @@ async def delete_mission_service(session: AsyncSession, mission_id: int) -> None
         )
 
 
+@traced
 async def update_target_service(
-    session: AsyncSession, target_id: int, target_data: TargetUpdate
+    session: AsyncSession,
+    target_id: int,
+    target_data: TargetUpdate,
+    expected_version: int | None = None,
 ) -> TargetResponse:
     """Update target information."""
     if not (target := await get_target_by_id(session=session, target_id=target_id)):
@@ -139,7 +677,13 @@ async def update_target_service(
             detail=f"Target with id {target_id} not found"
         )
 
-    mission = await get_mission_by_id(session=session, mission_id=target.mission_id)
+    if expected_version is not None and target.version != expected_version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Target with id {target_id} is at version {target.version}"
+        )
+
+    mission = target.mission
 
     if target_data.notes is not None:
         if target.is_complete:
@@ -158,11 +702,65 @@ async def update_target_service(
             session=session, target=target, target_data=target_data
         )
 
+        await record_mission_event(
+            session=session,
+            event_type=MissionEventType.TARGET_UPDATED,
+            mission_id=updated_target.mission_id,
+            target_id=updated_target.id,
+        )
+
+        # Cats whose active mission changed, embedded in their missions' documents
+        written_cat_ids = []
         if target_data.is_complete is not None and mission:
+            was_complete = mission.is_complete
             await update_mission_completion_status(session=session, mission=mission)
 
+            if mission.is_complete and not was_complete:
+                await record_mission_event(
+                    session=session,
+                    event_type=MissionEventType.MISSION_COMPLETED,
+                    mission_id=mission.id,
+                    cat_id=mission.cat_id,
+                )
+                if mission.cat_id is not None:
+                    await release_cat_from_mission(
+                        session=session, cat_id=mission.cat_id, mission_id=mission.id
+                    )
+                    written_cat_ids.append(mission.cat_id)
+            elif was_complete and not mission.is_complete:
+                # Reopened: the cat is busy again, unless it took another mission
+                # meanwhile; then the mission is unassigned and waits for a new cat
+                if mission.cat_id is not None:
+                    if await claim_cat_for_mission(
+                        session=session, cat_id=mission.cat_id, mission_id=mission.id
+                    ):
+                        written_cat_ids.append(mission.cat_id)
+                    else:
+                        await unassign_cat_from_mission(
+                            session=session, mission=mission
+                        )
+                        await record_mission_event(
+                            session=session,
+                            event_type=MissionEventType.CAT_ASSIGNED,
+                            mission_id=mission.id,
+                            cat_id=None,
+                        )
+
+        await refresh_mission_documents(
+            session=session,
+            mission_ids=[updated_target.mission_id],
+            cat_ids=written_cat_ids,
+        )
         await session.commit()
+        if mission and mission.cat_id is not None:
+            _invalidate_cats(session=session, cat_ids=[mission.cat_id])
         return TargetResponse.model_validate(updated_target)
+    except StaleDataError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Target with id {target_id} was modified concurrently"
+        )
     except Exception as e:
         logger.error(f"Error updating target: {e}")
         await session.rollback()
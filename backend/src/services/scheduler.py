@@ -0,0 +1,49 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+PeriodicJob = Callable[[AsyncSession], Awaitable[None]]
+
+
+async def run_periodically(
+    name: str,
+    interval: float,
+    job: PeriodicJob,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Run a job in a fresh session every `interval` seconds until cancelled."""
+    while True:
+        try:
+            async with session_factory() as session:
+                await job(session)
+                await session.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Periodic job '{name}' failed: {e}")
+
+        await asyncio.sleep(interval)
+
+
+def start_periodic_job(
+    name: str,
+    interval: float,
+    job: PeriodicJob,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> asyncio.Task[None]:
+    """Schedule a periodic job on the running event loop."""
+    return asyncio.create_task(
+        run_periodically(
+            name=name, interval=interval, job=job, session_factory=session_factory
+        ),
+        name=name,
+    )
+
+
+async def stop_background_tasks(tasks: list[asyncio.Task[None]]) -> None:
+    """Cancel background tasks and wait for them to finish."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,56 @@
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import Settings
+from core.tracing import traced
+from repositories.stats import (
+    get_breed_salary_stats,
+    get_cat_mission_stats,
+    get_country_target_stats,
+    get_mission_completion_stats,
+    refresh_stats_views,
+)
+from schemas.stats import (
+    AgencyStatsResponse,
+    BreedSalaryStats,
+    CatMissionStats,
+    CountryTargetStats,
+    MissionCompletionStats,
+)
+
+
+@traced
+async def get_agency_stats_service(
+    session: AsyncSession, settings: Settings, skip: int = 0, limit: int = 100
+) -> AgencyStatsResponse:
+    """Get precomputed agency statistics."""
+    completion = await get_mission_completion_stats(session=session) or {
+        "total_missions": 0,
+        "completed_missions": 0,
+        "active_missions": 0,
+        "total_cats": 0,
+    }
+    cats = await get_cat_mission_stats(session=session, skip=skip, limit=limit)
+
+    return AgencyStatsResponse(
+        missions=MissionCompletionStats.model_validate(completion),
+        countries=[
+            CountryTargetStats.model_validate(row)
+            for row in await get_country_target_stats(session=session)
+        ],
+        breeds=[
+            BreedSalaryStats.model_validate(row)
+            for row in await get_breed_salary_stats(session=session)
+        ],
+        cats=[CatMissionStats.model_validate(row) for row in cats],
+        total_cats=completion["total_cats"],
+        refreshed_at=completion.get("refreshed_at"),
+        max_staleness_seconds=settings.stats_refresh_interval,
+    )
+
+
+@traced
+async def refresh_stats_service(session: AsyncSession) -> None:
+    """Recompute the stats views; used by the periodic refresher."""
+    if await refresh_stats_views(session=session):
+        logger.debug("Agency stats refreshed")